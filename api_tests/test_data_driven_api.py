@@ -1,6 +1,5 @@
 # api_tests/test_data_driven_api.py
 import pytest
-import requests
 from test_data.data_reader import DataReader
 
 class TestDataDrivenAPI:
@@ -9,13 +8,8 @@ class TestDataDrivenAPI:
         """Fixture to load API test data"""
         return DataReader.load_data("api/user_data.json")
     
-    @pytest.fixture
-    def base_url(self):
-        """Fixture to provide the base URL"""
-        return "https://reqres.in/api"
-    
     @pytest.mark.parametrize("user_data_index", [0, 1, 2])
-    def test_create_user(self, api_data, base_url, user_data_index):
+    def test_create_user(self, api_data, api_client, user_data_index):
         """
         Test creating users with different data sets.
         
@@ -26,8 +20,8 @@ class TestDataDrivenAPI:
         user_data = api_data["create_users"][user_data_index]
         
         # Make the request with data from our test data file
-        response = requests.post(
-            f"{base_url}/users",
+        response = api_client.post(
+            "/users",
             json={
                 "name": user_data["name"],
                 "job": user_data["job"]
@@ -41,7 +35,7 @@ class TestDataDrivenAPI:
     
     # Fixed parametrization to use actual user IDs instead of string characters
     @pytest.mark.parametrize("user_id", [1, 2, 3, 12, 23])
-    def test_get_user(self, base_url, user_id):
+    def test_get_user(self, api_client, user_id):
         """
         Test retrieving different users by ID.
         
@@ -49,7 +43,7 @@ class TestDataDrivenAPI:
         some that exist and some that don't.
         """
         # Make request to get user details for this ID
-        response = requests.get(f"{base_url}/users/{user_id}")
+        response = api_client.get(f"/users/{user_id}")
         
         # For existing users (1-12 in reqres), we expect success
         if 1 <= user_id <= 12:
@@ -59,7 +53,7 @@ class TestDataDrivenAPI:
             # For non-existent users, we expect 404
             assert response.status_code == 404
             
-    def test_update_user(self, api_data, base_url):
+    def test_update_user(self, api_data, api_client):
         """
         Test updating a user's information.
         
@@ -70,8 +64,8 @@ class TestDataDrivenAPI:
         user_id = 2  # Using a known user ID
         
         # Make the update request
-        response = requests.put(
-            f"{base_url}/users/{user_id}",
+        response = api_client.put(
+            f"/users/{user_id}",
             json=update_data
         )
         
@@ -87,14 +81,14 @@ class TestDataDrivenAPI:
         ("PUT", 200),
         ("DELETE", 204)
     ])
-    def test_request_methods(self, base_url, method, expected_code):
+    def test_request_methods(self, api_client, method, expected_code):
         """
         Test different HTTP methods with expected status codes.
         
         This shows how to parametrize multiple values at once.
         """
         # Prepare request details based on method
-        endpoint = f"{base_url}/users"
+        endpoint = "/users"
         payload = None
         
         if method in ["POST", "PUT"]:
@@ -105,7 +99,43 @@ class TestDataDrivenAPI:
             endpoint = f"{endpoint}/2"
             
         # Execute the request dynamically based on method
-        response = requests.request(method, endpoint, json=payload)
+        response = api_client.request(method, endpoint, json=payload)
         
         # Verify correct response code
-        assert response.status_code == expected_code
\ No newline at end of file
+        assert response.status_code == expected_code
+
+    def test_get_users_concurrently(self, async_api):
+        """
+        Fetch a range of users in one concurrent batch.
+
+        Same checks as test_get_user, but all requests are in flight at once,
+        so the test takes roughly as long as the slowest request.
+        """
+        user_ids = list(range(1, 13)) + [23]
+        batch = async_api.run_batch([("GET", f"/users/{user_id}") for user_id in user_ids])
+
+        for user_id, response in zip(user_ids, batch.responses):
+            if 1 <= user_id <= 12:
+                assert response.status_code == 200
+                assert response.json()["data"]["id"] == user_id
+            else:
+                assert response.status_code == 404
+
+    def test_request_methods_concurrently(self, async_api):
+        """
+        Fire the full CRUD matrix at once and check every status code.
+
+        This also checks that the API handles overlapping writes to the same user.
+        """
+        payload = {"name": "Test User", "job": "Tester"}
+        matrix = [
+            (("GET", "/users"), 200),
+            (("POST", "/users", {"json": payload}), 201),
+            (("PUT", "/users/2", {"json": payload}), 200),
+            (("PATCH", "/users/2", {"json": payload}), 200),
+            (("DELETE", "/users/2"), 204),
+        ]
+
+        batch = async_api.run_batch([call for call, _ in matrix])
+
+        assert batch.status_codes == [expected for _, expected in matrix]
@@ -1,7 +1,6 @@
 # api_tests/test_reqres_api.py
 
 import pytest
-import requests
 import json
 from datetime import datetime
 
@@ -9,10 +8,11 @@ class TestReqResAPI:
     """
     This class contains API tests for the ReqRes API service.
     We're testing basic CRUD (Create, Read, Update, Delete) operations.
+    Requests go through the shared api_client fixture, which targets the API
+    selected with --api_mode.
     """
-    BASE_URL = "https://reqres.in/api"
 
-    def test_get_user_list(self):
+    def test_get_user_list(self, api_client):
         """
         Test retrieving a list of users from the API.
         This verifies we can successfully get user data and it's in the correct format.
@@ -21,7 +21,7 @@ class TestReqResAPI:
         print("\n🚀 Testing GET request to fetch user list...")
 
         # Make the request to the API
-        response = requests.get(f"{self.BASE_URL}/users")
+        response = api_client.get("/users")
         
         # Print detailed information about what we received
         print("\n📥 Response Status Code:", response.status_code)
@@ -43,7 +43,7 @@ class TestReqResAPI:
             assert "first_name" in user, f"User {user} missing first_name field"
             assert "last_name" in user, f"User {user} missing last_name field"
 
-    def test_create_user(self):
+    def test_create_user(self, api_client):
         """
         Test creating a new user through the API.
         We'll send user data and verify the response contains the correct information.
@@ -60,8 +60,8 @@ class TestReqResAPI:
         print("\n📤 Sending user data:", json.dumps(user_data, indent=2))
         
         # Send POST request to create user
-        response = requests.post(
-            f"{self.BASE_URL}/users",
+        response = api_client.post(
+            "/users",
             json=user_data
         )
         
@@ -81,7 +81,7 @@ class TestReqResAPI:
         assert "id" in created_user, "Response should include an ID"
         assert "createdAt" in created_user, "Response should include creation timestamp"
 
-    def test_update_user(self):
+    def test_update_user(self, api_client):
         """
         Test updating an existing user's information.
         We'll update a user's details and verify the changes were saved.
@@ -97,8 +97,8 @@ class TestReqResAPI:
         print(f"\n📤 Sending update data for user {user_id}:", 
               json.dumps(update_data, indent=2))
         
-        response = requests.put(
-            f"{self.BASE_URL}/users/{user_id}",
+        response = api_client.put(
+            f"/users/{user_id}",
             json=update_data
         )
         
@@ -113,7 +113,7 @@ class TestReqResAPI:
             "Job should be updated in response"
         assert "updatedAt" in updated_user, "Response should include update timestamp"
 
-    def test_delete_user(self):
+    def test_delete_user(self, api_client):
         """
         Test deleting a user from the system.
         We'll delete a user and verify they were removed successfully.
@@ -124,7 +124,7 @@ class TestReqResAPI:
         
         print(f"\n📤 Attempting to delete user {user_id}")
         
-        response = requests.delete(f"{self.BASE_URL}/users/{user_id}")
+        response = api_client.delete(f"/users/{user_id}")
         
         print(f"\n📥 Received status code: {response.status_code}")
         
@@ -132,7 +132,7 @@ class TestReqResAPI:
         assert response.status_code == 204, \
             f"Expected 204 No Content status, got {response.status_code}"
             
-    def test_get_single_user(self):
+    def test_get_single_user(self, api_client):
         """
         Test retrieving a single user's details from the API.
         This verifies we can get detailed information about a specific user.
@@ -141,7 +141,7 @@ class TestReqResAPI:
         user_id = 2
         
         # Make request to get user details
-        response = requests.get(f"{self.BASE_URL}/users/{user_id}")
+        response = api_client.get(f"/users/{user_id}")
         
         # Verify successful response
         assert response.status_code == 200, "Should return 200 OK status"
@@ -1,23 +1,28 @@
 # config/environment.py
-import json
 import os
 from selenium.webdriver.chrome.options import Options
+from config import registry
 
 class Environment:
     def __init__(self):
-        self.config_file = os.path.join(os.path.dirname(__file__), 'config.json')
+        self.config_file = registry.CONFIG_FILE
         self.env = os.getenv('TEST_ENV', 'dev')  # Default to 'dev' if not specified
         self.config = self._load_config()
 
     def _load_config(self):
-        with open(self.config_file, 'r') as f:
-            configs = json.load(f)
-            return configs[self.env]
+        # Parsed once per process; defaults + TEST_ENV section + ECOM_<KEY> overrides
+        return registry.environment_config(self.env)
 
     @property
     def base_url(self):
+        # ECOM_BASE_URL (an ECOM_<KEY> override) lets a locally started server redirect the suite
         return self.config['base_url']
 
+    @property
+    def local_server(self):
+        """True when this environment expects the bundled Swag Labs replica"""
+        return self.config.get('local_server', False)
+
     @property
     def timeout(self):
         return self.config['timeout']
@@ -41,5 +46,9 @@ class Environment:
 
     def get_screenshot_dir(self):
         screenshot_dir = self.config['screenshot_dir']
+        # Each xdist worker writes to its own subdirectory (gw0, gw1, ...)
+        worker = os.getenv('PYTEST_XDIST_WORKER')
+        if worker:
+            screenshot_dir = os.path.join(screenshot_dir, worker)
         os.makedirs(screenshot_dir, exist_ok=True)
         return screenshot_dir
\ No newline at end of file
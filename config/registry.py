@@ -0,0 +1,120 @@
+# config/registry.py
+import functools
+import json
+import os
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+
+# config.json section merged under every environment
+DEFAULTS_SECTION = 'defaults'
+# Prefix of environment variables that override top-level config keys (ECOM_TIMEOUT=20).
+# Namespaced so generic CI variables such as TEST_TIMEOUT or TEST_BROWSER are never picked up.
+OVERRIDE_PREFIX = 'ECOM_'
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict returned by the registry.
+
+    Still a dict, so it can be passed to json.dumps / requests unchanged.
+    Use .copy() (a plain dict) when a test needs to modify data.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Registry data is read-only; call .copy() for a mutable version")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """
+    Recursively turn dicts into FrozenDicts.
+
+    Only the mapping layer is frozen: lists stay lists (with frozen dicts
+    inside), so comparisons with list literals and JSON round trips behave
+    as with json.load. Lists are shared, so copy one before modifying it.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [freeze(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(absolute_path):
+    with open(absolute_path, 'r') as f:
+        return freeze(json.load(f))
+
+
+def load_json(path):
+    """
+    Parse a JSON file once per process.
+
+    Returns:
+        The file's contents with FrozenDicts for objects (shared, read-only mappings)
+    """
+    return _load_json(os.path.abspath(path))
+
+
+def _parse_override(raw):
+    # "20" -> 20, "true" -> True, anything that isn't JSON stays a string
+    try:
+        return freeze(json.loads(raw))
+    except ValueError:
+        return raw
+
+
+def _merge(base, overlay):
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = _merge(merged[key], value)
+        merged[key] = value
+    return FrozenDict(merged)
+
+
+@functools.lru_cache(maxsize=None)
+def _environment_config(env_name, overrides):
+    configs = load_json(CONFIG_FILE)
+    if env_name not in configs or env_name == DEFAULTS_SECTION:
+        raise KeyError(f"Unknown TEST_ENV '{env_name}' in {CONFIG_FILE}")
+    merged = _merge(configs.get(DEFAULTS_SECTION, {}), configs[env_name])
+    return _merge(merged, {key: _parse_override(raw) for key, raw in overrides})
+
+
+def environment_config(env_name):
+    """
+    Config for one environment: defaults, then the TEST_ENV section, then
+    ECOM_<KEY> environment variables (e.g. ECOM_BASE_URL, ECOM_TIMEOUT).
+
+    The result is memoised on the environment name and override values, so
+    repeated calls cost one scan of os.environ.
+    """
+    configs = load_json(CONFIG_FILE)
+    keys = set(configs.get(DEFAULTS_SECTION, {})) | set(configs.get(env_name, {}))
+    overrides = tuple(sorted(
+        (key, os.environ[OVERRIDE_PREFIX + key.upper()])
+        for key in keys
+        if OVERRIDE_PREFIX + key.upper() in os.environ
+    ))
+    return _environment_config(env_name, overrides)
+
+
+def clear():
+    """Forget every parsed file and environment (e.g. after editing config in a test)"""
+    _load_json.cache_clear()
+    _environment_config.cache_clear()
@@ -0,0 +1,87 @@
+# local_site/server.py
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Every storefront URL is served by the same single-page app shell
+PAGE_PATHS = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+
+class SauceDemoRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the Swag Labs replica from local_site/static"""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in PAGE_PATHS:
+            self.path = "/index.html"
+        elif path.startswith("/static/"):
+            self.path = self.path[len("/static"):]
+        return super().do_GET()
+
+    def end_headers(self):
+        # Assets are tiny; let the browser cache them between tests
+        if not self.path.endswith(".html"):
+            self.send_header("Cache-Control", "max-age=3600")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        # Keep test output clean
+        pass
+
+
+class LocalSauceDemoServer:
+    """
+    Runs the local Swag Labs replica on a background thread.
+
+    Args:
+        host: Interface to bind to
+        port: Port to listen on (0 picks a free port)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        handler = partial(SauceDemoRequestHandler, directory=STATIC_DIR)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the local Swag Labs replica")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = LocalSauceDemoServer(args.host, args.port)
+    print(f"Serving Swag Labs replica on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,492 @@
+// local_site/static/app.js
+// Local replica of the Swag Labs (saucedemo.com) storefront.
+// Keeps the element IDs, class names, cookie and localStorage keys that the
+// page objects rely on, so the UI suite can run against loopback.
+(function () {
+    "use strict";
+
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var PASSWORD = "secret_sauce";
+    var USERS = ["standard_user", "locked_out_user", "problem_user",
+                 "performance_glitch_user", "error_user", "visual_user"];
+    var TAX_RATE = 0.08;
+
+    var PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+    ];
+
+    var SORT_OPTIONS = [
+        {value: "az", label: "Name (A to Z)"},
+        {value: "za", label: "Name (Z to A)"},
+        {value: "lohi", label: "Price (low to high)"},
+        {value: "hilo", label: "Price (high to low)"}
+    ];
+
+    var PROTECTED_PAGES = ["/inventory.html", "/inventory-item.html", "/cart.html",
+                           "/checkout-step-one.html", "/checkout-step-two.html",
+                           "/checkout-complete.html"];
+
+    var state = {sort: "az", menuOpen: false, loginError: "", checkoutError: ""};
+
+    // ----------------------------
+    // Session and cart storage
+    // ----------------------------
+    function getUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/; max-age=600";
+    }
+
+    function clearUser() {
+        document.cookie = SESSION_COOKIE + "=; path=/; max-age=0";
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function product(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) {
+                return PRODUCTS[i];
+            }
+        }
+        return null;
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function sortedProducts() {
+        var list = PRODUCTS.slice();
+        var compare = {
+            az: function (a, b) { return a.name.localeCompare(b.name); },
+            za: function (a, b) { return b.name.localeCompare(a.name); },
+            lohi: function (a, b) { return a.price - b.price || a.name.localeCompare(b.name); },
+            hilo: function (a, b) { return b.price - a.price || a.name.localeCompare(b.name); }
+        }[state.sort];
+        return list.sort(compare);
+    }
+
+    // ----------------------------
+    // Routing
+    // ----------------------------
+    function navigate(path) {
+        window.history.pushState({}, "", path);
+        state.menuOpen = false;
+        render();
+        window.scrollTo(0, 0);
+    }
+
+    function currentPath() {
+        var path = window.location.pathname;
+        return path === "/index.html" ? "/" : path;
+    }
+
+    // ----------------------------
+    // Shared fragments
+    // ----------------------------
+    function header(title, secondary) {
+        var count = getCart().length;
+        var badge = count ? '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + count + '</span>' : "";
+        return '' +
+            '<div class="primary_header" data-test="primary-header">' +
+              '<div id="menu_button_container"><div class="bm-burger-button">' +
+                '<button type="button" id="react-burger-menu-btn">Open Menu</button></div>' +
+                '<div class="bm-menu-wrap" aria-hidden="' + !state.menuOpen + '"' + (state.menuOpen ? "" : " hidden") + '>' +
+                  '<nav class="bm-item-list">' +
+                    '<a id="inventory_sidebar_link" class="bm-item menu-item" href="#" data-test="inventory-sidebar-link">All Items</a>' +
+                    '<a id="about_sidebar_link" class="bm-item menu-item" href="https://saucelabs.com/" data-test="about-sidebar-link">About</a>' +
+                    '<a id="logout_sidebar_link" class="bm-item menu-item" href="#" data-test="logout-sidebar-link">Logout</a>' +
+                    '<a id="reset_sidebar_link" class="bm-item menu-item" href="#" data-test="reset-sidebar-link">Reset App State</a>' +
+                  '</nav>' +
+                  '<div class="bm-cross-button"><button type="button" id="react-burger-cross-btn">Close Menu</button></div>' +
+                '</div>' +
+              '</div>' +
+              '<div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+              '<div id="shopping_cart_container" class="shopping_cart_container">' +
+                '<a class="shopping_cart_link" data-test="shopping-cart-link">' + badge + '</a>' +
+              '</div>' +
+            '</div>' +
+            '<div class="header_secondary_container" data-test="secondary-header">' +
+              '<span class="title" data-test="title">' + title + '</span>' + (secondary || "") +
+            '</div>';
+    }
+
+    function footer() {
+        return '<footer class="footer" data-test="footer"><div class="footer_copy">' +
+               '© Sauce Labs. Local replica for automated testing.</div></footer>';
+    }
+
+    function page(body) {
+        return '<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">' +
+               body + '</div>' + footer() + '</div>';
+    }
+
+    function cartItem(item, removable) {
+        var button = removable
+            ? '<button class="btn btn_secondary btn_small cart_button" id="remove-' + slug(item.name) +
+              '" data-id="' + item.id + '">Remove</button>'
+            : "";
+        return '' +
+            '<div class="cart_item" data-test="inventory-item">' +
+              '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+              '<div class="cart_item_label">' +
+                '<a id="item_' + item.id + '_title_link" href="#" data-id="' + item.id + '">' +
+                  '<div class="inventory_item_name" data-test="inventory-item-name">' + item.name + '</div></a>' +
+                '<div class="inventory_item_desc" data-test="inventory-item-desc">' + item.desc + '</div>' +
+                '<div class="item_pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+                  money(item.price) + '</div>' + button + '</div>' +
+              '</div>' +
+            '</div>';
+    }
+
+    // ----------------------------
+    // Pages
+    // ----------------------------
+    function renderLogin() {
+        var error = state.loginError
+            ? '<h3 data-test="error"><button class="error-button" data-test="error-button"></button>' + state.loginError + '</h3>'
+            : "";
+        return '' +
+            '<div class="login_logo">Swag Labs</div>' +
+            '<div class="login_wrapper"><div class="login_wrapper-inner">' +
+              '<div id="login_button_container" class="form_column"><div class="login-box">' +
+                '<form id="login_form">' +
+                  '<div class="form_group"><input class="form_input" placeholder="Username" type="text" ' +
+                    'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>' +
+                  '<div class="form_group"><input class="form_input" placeholder="Password" type="password" ' +
+                    'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>' +
+                  '<div class="error-message-container' + (error ? " error" : "") + '">' + error + '</div>' +
+                  '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">' +
+                '</form>' +
+              '</div></div>' +
+              '<div class="login_credentials_wrap"><div id="login_credentials" class="login_credentials">' +
+                '<h4>Accepted usernames are:</h4>' + USERS.join("<br>") + '</div>' +
+                '<div class="login_password"><h4>Password for all users:</h4>' + PASSWORD + '</div></div>' +
+            '</div></div>';
+    }
+
+    function renderInventory() {
+        var cart = getCart();
+        var options = SORT_OPTIONS.map(function (opt) {
+            return '<option value="' + opt.value + '"' + (opt.value === state.sort ? " selected" : "") + '>' + opt.label + '</option>';
+        }).join("");
+        var active = SORT_OPTIONS.filter(function (opt) { return opt.value === state.sort; })[0].label;
+        var sortControl = '<div class="right_component"><span class="select_container">' +
+            '<span class="active_option" data-test="active-option">' + active + '</span>' +
+            '<select class="product_sort_container" data-test="product-sort-container">' + options + '</select></span></div>';
+
+        var items = sortedProducts().map(function (item) {
+            var inCart = cart.indexOf(item.id) !== -1;
+            var button = inCart
+                ? '<button class="btn btn_secondary btn_small btn_inventory" id="remove-' + slug(item.name) + '" data-id="' + item.id + '">Remove</button>'
+                : '<button class="btn btn_primary btn_small btn_inventory" id="add-to-cart-' + slug(item.name) + '" data-id="' + item.id + '">Add to cart</button>';
+            return '' +
+                '<div class="inventory_item" data-test="inventory-item">' +
+                  '<div class="inventory_item_img"><a id="item_' + item.id + '_img_link" href="#" data-id="' + item.id + '">' +
+                    '<img alt="' + item.name + '" class="inventory_item_img" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" width="160" height="160"></a></div>' +
+                  '<div class="inventory_item_description" data-test="inventory-item-description">' +
+                    '<div class="inventory_item_label">' +
+                      '<a id="item_' + item.id + '_title_link" href="#" data-id="' + item.id + '">' +
+                        '<div class="inventory_item_name" data-test="inventory-item-name">' + item.name + '</div></a>' +
+                      '<div class="inventory_item_desc" data-test="inventory-item-desc">' + item.desc + '</div>' +
+                    '</div>' +
+                    '<div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' + money(item.price) + '</div>' + button + '</div>' +
+                  '</div>' +
+                '</div>';
+        }).join("");
+
+        return page(header("Products", sortControl) +
+            '<div id="inventory_container" class="inventory_container"><div class="inventory_list" data-test="inventory-list">' +
+            items + '</div></div>');
+    }
+
+    function renderItem() {
+        var id = parseInt(new URLSearchParams(window.location.search).get("id"), 10);
+        var item = product(id);
+        var back = '<button class="btn btn_secondary back btn_large inventory_details_back_button" id="back-to-products" data-test="back-to-products">Back to products</button>';
+        if (!item) {
+            return page(header("", back) + '<div class="inventory_details"><div class="inventory_details_name large_size">ITEM NOT FOUND</div></div>');
+        }
+        var inCart = getCart().indexOf(item.id) !== -1;
+        var button = inCart
+            ? '<button class="btn btn_secondary btn_small btn_inventory" id="remove" data-id="' + item.id + '">Remove</button>'
+            : '<button class="btn btn_primary btn_small btn_inventory" id="add-to-cart" data-id="' + item.id + '">Add to cart</button>';
+        return page(header("", back) +
+            '<div class="inventory_details" data-test="inventory-container"><div class="inventory_details_container">' +
+              '<div class="inventory_details_img_container"><img alt="' + item.name + '" class="inventory_details_img" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=" width="320" height="320"></div>' +
+              '<div class="inventory_details_desc_container">' +
+                '<div class="inventory_details_name large_size" data-test="inventory-item-name">' + item.name + '</div>' +
+                '<div class="inventory_details_desc large_size" data-test="inventory-item-desc">' + item.desc + '</div>' +
+                '<div class="inventory_details_price" data-test="inventory-item-price">' + money(item.price) + '</div>' +
+                button +
+              '</div>' +
+            '</div></div>');
+    }
+
+    function renderCart() {
+        var items = getCart().map(product).filter(Boolean).map(function (item) {
+            return cartItem(item, true);
+        }).join("");
+        return page(header("Your Cart") +
+            '<div id="cart_contents_container" class="cart_contents_container"><div>' +
+              '<div class="cart_list" data-test="cart-list">' +
+                '<div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+                '<div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+                items +
+              '</div>' +
+              '<div class="cart_footer">' +
+                '<button class="btn btn_secondary back btn_medium" id="continue-shopping" data-test="continue-shopping">Continue Shopping</button>' +
+                '<button class="btn btn_action btn_medium checkout_button" id="checkout" data-test="checkout">Checkout</button>' +
+              '</div>' +
+            '</div></div>');
+    }
+
+    function renderCheckoutStepOne() {
+        var error = state.checkoutError
+            ? '<h3 data-test="error"><button class="error-button" data-test="error-button"></button>' + state.checkoutError + '</h3>'
+            : "";
+        return page(header("Checkout: Your Information") +
+            '<div class="checkout_info_container"><div class="checkout_info_wrapper"><form id="checkout_form">' +
+              '<div class="checkout_info">' +
+                '<div class="form_group"><input class="form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName" value=""></div>' +
+                '<div class="form_group"><input class="form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName" value=""></div>' +
+                '<div class="form_group"><input class="form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode" value=""></div>' +
+                '<div class="error-message-container' + (error ? " error" : "") + '">' + error + '</div>' +
+              '</div>' +
+              '<div class="checkout_buttons">' +
+                '<button type="button" class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" data-test="cancel">Cancel</button>' +
+                '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">' +
+              '</div>' +
+            '</form></div></div>');
+    }
+
+    function renderCheckoutStepTwo() {
+        var items = getCart().map(product).filter(Boolean);
+        var subtotal = items.reduce(function (sum, item) { return sum + item.price; }, 0);
+        var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+        return page(header("Checkout: Overview") +
+            '<div id="checkout_summary_container" class="checkout_summary_container"><div>' +
+              '<div class="cart_list" data-test="cart-list">' +
+                '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+                items.map(function (item) { return cartItem(item, false); }).join("") +
+              '</div>' +
+              '<div class="summary_info">' +
+                '<div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>' +
+                '<div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>' +
+                '<div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>' +
+                '<div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>' +
+                '<div class="summary_info_label" data-test="total-info-label">Price Total</div>' +
+                '<div class="summary_subtotal_label" data-test="subtotal-label">Item total: ' + money(subtotal) + '</div>' +
+                '<div class="summary_tax_label" data-test="tax-label">Tax: ' + money(tax) + '</div>' +
+                '<div class="summary_info_label summary_total_label" data-test="total-label">Total: ' + money(subtotal + tax) + '</div>' +
+                '<div class="cart_footer">' +
+                  '<button class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" data-test="cancel">Cancel</button>' +
+                  '<button class="btn btn_action btn_medium cart_button" id="finish" data-test="finish">Finish</button>' +
+                '</div>' +
+              '</div>' +
+            '</div></div>');
+    }
+
+    function renderCheckoutComplete() {
+        return page(header("Checkout: Complete!") +
+            '<div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">' +
+              '<h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>' +
+              '<div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>' +
+              '<button class="btn btn_primary btn_small" id="back-to-products" data-test="back-to-products">Back Home</button>' +
+            '</div>');
+    }
+
+    var ROUTES = {
+        "/": renderLogin,
+        "/inventory.html": renderInventory,
+        "/inventory-item.html": renderItem,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderCheckoutStepOne,
+        "/checkout-step-two.html": renderCheckoutStepTwo,
+        "/checkout-complete.html": renderCheckoutComplete
+    };
+
+    function render() {
+        var path = currentPath();
+        if (PROTECTED_PAGES.indexOf(path) !== -1 && !getUser()) {
+            state.loginError = "Epic sadface: You can only access '" + path + "' when you are logged in.";
+            window.history.replaceState({}, "", "/");
+            path = "/";
+        }
+        var view = ROUTES[path] || renderLogin;
+        document.getElementById("root").innerHTML = view();
+    }
+
+    // ----------------------------
+    // Actions
+    // ----------------------------
+    function login() {
+        var username = document.getElementById("user-name").value;
+        var password = document.getElementById("password").value;
+        if (!username) {
+            state.loginError = "Epic sadface: Username is required";
+        } else if (!password) {
+            state.loginError = "Epic sadface: Password is required";
+        } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+            state.loginError = "Epic sadface: Username and password do not match any user in this service";
+        } else if (username === "locked_out_user") {
+            state.loginError = "Epic sadface: Sorry, this user has been locked out.";
+        } else {
+            state.loginError = "";
+            setUser(username);
+            navigate("/inventory.html");
+            return;
+        }
+        render();
+        document.getElementById("user-name").value = username;
+        document.getElementById("password").value = password;
+    }
+
+    function continueCheckout() {
+        var fields = [["first-name", "First Name"], ["last-name", "Last Name"], ["postal-code", "Postal Code"]];
+        var values = fields.map(function (field) { return document.getElementById(field[0]).value; });
+        for (var i = 0; i < fields.length; i++) {
+            if (!values[i]) {
+                state.checkoutError = "Error: " + fields[i][1] + " is required";
+                render();
+                fields.forEach(function (field, j) { document.getElementById(field[0]).value = values[j]; });
+                return;
+            }
+        }
+        state.checkoutError = "";
+        navigate("/checkout-step-two.html");
+    }
+
+    function addToCart(id) {
+        var cart = getCart();
+        if (cart.indexOf(id) === -1) {
+            cart.push(id);
+            setCart(cart);
+        }
+        render();
+    }
+
+    function removeFromCart(id, button) {
+        setCart(getCart().filter(function (itemId) { return itemId !== id; }));
+        if (currentPath() === "/cart.html") {
+            // The real site leaves an empty placeholder where the item was
+            var row = button.closest(".cart_item");
+            var placeholder = document.createElement("div");
+            placeholder.className = "removed_cart_item";
+            row.parentNode.replaceChild(placeholder, row);
+            var badge = document.querySelector(".shopping_cart_badge");
+            var count = getCart().length;
+            if (badge && count) {
+                badge.textContent = count;
+            } else if (badge) {
+                badge.parentNode.removeChild(badge);
+            }
+            return;
+        }
+        render();
+    }
+
+    document.addEventListener("submit", function (event) {
+        event.preventDefault();
+        if (event.target.id === "login_form") {
+            login();
+        } else if (event.target.id === "checkout_form") {
+            continueCheckout();
+        }
+    });
+
+    document.addEventListener("change", function (event) {
+        if (event.target.classList.contains("product_sort_container")) {
+            state.sort = event.target.value;
+            render();
+        }
+    });
+
+    document.addEventListener("click", function (event) {
+        var target = event.target.closest("button, a");
+        if (!target) {
+            return;
+        }
+        var id = target.id || "";
+        var dataId = target.getAttribute("data-id");
+
+        if (id === "react-burger-menu-btn" || id === "react-burger-cross-btn") {
+            event.preventDefault();
+            state.menuOpen = id === "react-burger-menu-btn";
+            render();
+        } else if (id === "inventory_sidebar_link") {
+            event.preventDefault();
+            navigate("/inventory.html");
+        } else if (id === "logout_sidebar_link") {
+            event.preventDefault();
+            clearUser();
+            state.sort = "az";
+            navigate("/");
+        } else if (id === "reset_sidebar_link") {
+            event.preventDefault();
+            setCart([]);
+            render();
+        } else if (target.classList.contains("shopping_cart_link")) {
+            event.preventDefault();
+            navigate("/cart.html");
+        } else if (id.indexOf("add-to-cart") === 0) {
+            addToCart(parseInt(dataId, 10));
+        } else if (id.indexOf("remove") === 0) {
+            removeFromCart(parseInt(dataId, 10), target);
+        } else if (/^item_\d+_(title|img)_link$/.test(id)) {
+            event.preventDefault();
+            navigate("/inventory-item.html?id=" + dataId);
+        } else if (id === "back-to-products" || id === "continue-shopping") {
+            navigate("/inventory.html");
+        } else if (id === "checkout") {
+            navigate("/checkout-step-one.html");
+        } else if (id === "cancel") {
+            state.checkoutError = "";
+            navigate(currentPath() === "/checkout-step-one.html" ? "/cart.html" : "/inventory.html");
+        } else if (id === "finish") {
+            setCart([]);
+            navigate("/checkout-complete.html");
+        } else if (id === "error-button" || target.classList.contains("error-button")) {
+            state.loginError = "";
+            state.checkoutError = "";
+            render();
+        }
+    });
+
+    window.addEventListener("popstate", render);
+    render();
+})();
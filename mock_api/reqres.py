@@ -0,0 +1,254 @@
+# mock_api/reqres.py
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+LIVE_BASE_URL = "https://reqres.in/api"
+DEFAULT_RECORDINGS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "test_data", "api", "recorded_responses.json",
+)
+
+SUPPORT = {
+    "url": "https://reqres.in/#support-heading",
+    "text": "To keep ReqRes free, contributions towards server costs are appreciated!",
+}
+
+# Same users ReqRes serves
+USERS = [
+    {"id": user_id, "email": f"{first.lower()}.{last.lower()}@reqres.in",
+     "first_name": first, "last_name": last,
+     "avatar": f"https://reqres.in/img/faces/{user_id}-image.jpg"}
+    for user_id, (first, last) in enumerate([
+        ("George", "Bluth"), ("Janet", "Weaver"), ("Emma", "Wong"),
+        ("Eve", "Holt"), ("Charles", "Morris"), ("Tracey", "Ramos"),
+        ("Michael", "Lawson"), ("Lindsay", "Ferguson"), ("Tobias", "Funke"),
+        ("Byron", "Fields"), ("George", "Edwards"), ("Rachel", "Howell"),
+    ], start=1)
+]
+
+USERS_PATH = re.compile(r"^/api/users/?$")
+USER_PATH = re.compile(r"^/api/users/(\d+)/?$")
+
+
+def _timestamp():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class MockBackend:
+    """
+    Implements the ReqRes /users endpoints in memory.
+
+    Like the real service, writes are not persisted: create/update echo the
+    payload back with an id or timestamp, and delete always succeeds.
+    """
+
+    def __init__(self):
+        self._next_id = 100
+        self._lock = threading.Lock()
+
+    def handle(self, method, path, query, payload, full_path):
+        """Return (status_code, json_body_or_None) for a request"""
+        if USERS_PATH.match(path):
+            if method == "GET":
+                return 200, self._list_users(query)
+            if method == "POST":
+                with self._lock:
+                    self._next_id += 1
+                    new_id = str(self._next_id)
+                return 201, {**(payload or {}), "id": new_id, "createdAt": _timestamp()}
+
+        match = USER_PATH.match(path)
+        if match:
+            user_id = int(match.group(1))
+            if method == "GET":
+                user = next((u for u in USERS if u["id"] == user_id), None)
+                return (200, {"data": user, "support": SUPPORT}) if user else (404, {})
+            if method in ("PUT", "PATCH"):
+                return 200, {**(payload or {}), "updatedAt": _timestamp()}
+            if method == "DELETE":
+                return 204, None
+
+        return 404, {}
+
+    @staticmethod
+    def _positive_int(value, default):
+        # Like ReqRes, a missing, non-numeric or non-positive value falls back to the default
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            return default
+        return number if number > 0 else default
+
+    @classmethod
+    def _list_users(cls, query):
+        page = cls._positive_int(query.get("page"), 1)
+        per_page = cls._positive_int(query.get("per_page"), 6)
+        start = (page - 1) * per_page
+        return {
+            "page": page,
+            "per_page": per_page,
+            "total": len(USERS),
+            "total_pages": -(-len(USERS) // per_page),
+            "data": USERS[start:start + per_page],
+            "support": SUPPORT,
+        }
+
+
+class RecordingStore:
+    """Recorded responses keyed by "METHOD /path?query", saved as JSON"""
+
+    def __init__(self, path=DEFAULT_RECORDINGS):
+        self.path = path
+        self._lock = threading.Lock()
+        self.responses = {}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.responses = json.load(f)
+
+    @staticmethod
+    def key(method, full_path):
+        return f"{method} {full_path}"
+
+    def get(self, method, full_path):
+        return self.responses.get(self.key(method, full_path))
+
+    def put(self, method, full_path, status, body):
+        with self._lock:
+            self.responses[self.key(method, full_path)] = {"status": status, "body": body}
+
+    def save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.responses, f, indent=2, sort_keys=True)
+
+
+class ReplayBackend:
+    """
+    Serves responses captured in record mode.
+
+    ReqRes echoes the request body on create/update, so for write methods the
+    current payload is laid over the recorded body. Unrecorded requests get a
+    501 so a missing recording is obvious in the test output.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def handle(self, method, path, query, payload, full_path):
+        recorded = self.store.get(method, full_path)
+        if recorded is None:
+            return 501, {"error": f"No recording for {method} {full_path}; run with --api_mode record first"}
+
+        body = recorded["body"]
+        if method in ("POST", "PUT", "PATCH") and isinstance(body, dict) and payload:
+            body = {**body, **payload}
+        return recorded["status"], body
+
+
+class RecordBackend:
+    """Forwards requests to the live API and records every response"""
+
+    def __init__(self, store, upstream=LIVE_BASE_URL):
+        self.store = store
+        self.upstream = upstream.rstrip("/")
+        self.session = requests.Session()
+
+    def handle(self, method, path, query, payload, full_path):
+        # full_path starts with /api, which is already part of the upstream URL
+        url = self.upstream + full_path[len("/api"):]
+        response = self.session.request(method, url, json=payload, timeout=30)
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            # An HTML error or challenge page; pass the failure on but don't record it for replay
+            content_type = response.headers.get("Content-Type", "unknown")
+            return 502, {"error": f"Upstream returned {response.status_code} with a non-JSON body ({content_type})"}
+        self.store.put(method, full_path, response.status_code, body)
+        return response.status_code, body
+
+
+class ReqResRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive between requests
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        full_path = self.path
+        path, _, query_string = full_path.partition("?")
+        query = dict(part.split("=", 1) for part in query_string.split("&") if "=" in part)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw) if raw else None
+        except ValueError:
+            payload = None
+
+        status, body = self.server.backend.handle(self.command, path, query, payload, full_path)
+
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReqResServer:
+    """
+    Local stand-in for https://reqres.in/api.
+
+    Args:
+        mode: "mock" (in-memory), "replay" (recorded responses) or
+              "record" (proxy to the live API and save responses)
+        recordings: JSON file used by record and replay modes
+        port: Port to listen on (0 picks a free port)
+    """
+
+    MODES = ("mock", "replay", "record")
+
+    def __init__(self, mode="mock", recordings=DEFAULT_RECORDINGS, host="127.0.0.1", port=0):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown API mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.store = RecordingStore(recordings) if mode != "mock" else None
+
+        self.httpd = ThreadingHTTPServer((host, port), ReqResRequestHandler)
+        self.httpd.daemon_threads = True
+        if mode == "mock":
+            self.httpd.backend = MockBackend()
+        elif mode == "replay":
+            self.httpd.backend = ReplayBackend(self.store)
+        else:
+            self.httpd.backend = RecordBackend(self.store)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.mode == "record":
+            self.store.save()
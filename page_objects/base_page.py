@@ -1,28 +1,185 @@
 # page_objects/base_page.py
+import time
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+from page_objects.locators import LocatorRegistry, ElementCache, compile_locator, locator_stats, FIND_BY_TEXT_SCRIPT
+from utils.wait_budget import wait_budget, describe
+from utils.perf_metrics import perf_metrics
+from utils.artifacts import artifacts
 
 class BasePage:
+    # Short polling keeps condition waits close to event-driven
+    POLL_FREQUENCY = 0.1
+    TIMEOUT = 10
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, self.TIMEOUT, poll_frequency=self.POLL_FREQUENCY)
+        self.locators = LocatorRegistry.for_page(type(self))
+        self.elements = ElementCache(locator_stats)
+        if locator_stats.validate:
+            self.locators.validate(driver)
+
+    def locator(self, name, **params):
+        """Compiled locator declared on the page, e.g. locator("ADD_TO_CART_BUTTON", slug="sauce-labs-backpack")"""
+        return self.locators.get(name, **params)
+
+    def wait_for(self, condition, target, timeout=None):
+        """
+        Wait until condition is truthy and record the time spent.
+
+        Args:
+            condition: Expected condition or any callable taking the driver
+            target: Locator or short description used in the wait report
+            timeout: Seconds before giving up (defaults to TIMEOUT)
+        """
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(
+                self.driver, timeout or self.TIMEOUT, poll_frequency=self.POLL_FREQUENCY
+            ).until(condition)
+        finally:
+            wait_budget.record(describe(target), time.perf_counter() - start)
+
+    def wait_until_not(self, condition, target, timeout=None):
+        """Wait until condition is falsy and record the time spent"""
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(
+                self.driver, timeout or self.TIMEOUT, poll_frequency=self.POLL_FREQUENCY
+            ).until_not(condition)
+        finally:
+            wait_budget.record(describe(target), time.perf_counter() - start)
+
+    def wait_for_dom_stable(self, quiet_ms=100, timeout=None):
+        """
+        Wait until the DOM has had no mutations for quiet_ms milliseconds.
+
+        Uses a MutationObserver inside the page, so it returns as soon as
+        rendering settles instead of sleeping for a fixed time.
+        """
+        timeout = timeout or self.TIMEOUT
+        start = time.perf_counter()
+        # The script timeout is a session setting; put back whatever the test had
+        previous = self.driver.timeouts.script
+        try:
+            self.driver.set_script_timeout(timeout)
+            return self.driver.execute_async_script("""
+                var quiet = arguments[0];
+                var done = arguments[arguments.length - 1];
+                var timer;
+                var observer = new MutationObserver(function () {
+                    clearTimeout(timer);
+                    timer = setTimeout(finish, quiet);
+                });
+                function finish() {
+                    observer.disconnect();
+                    done(true);
+                }
+                observer.observe(document.documentElement, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+                timer = setTimeout(finish, quiet);
+            """, quiet_ms)
+        finally:
+            self.driver.set_script_timeout(previous)
+            wait_budget.record("dom stable", time.perf_counter() - start)
+
+    def wait_for_network_idle(self, idle_ms=300, timeout=None):
+        """
+        Wait until the page has loaded and no fetch/XHR or resource request
+        has been active for idle_ms milliseconds.
+        """
+        def network_idle(driver):
+            return driver.execute_script("""
+                var idle = arguments[0];
+                if (!window.__pendingRequests) {
+                    window.__pendingRequests = {count: 0};
+                    var pending = window.__pendingRequests;
+                    if (window.fetch) {
+                        var originalFetch = window.fetch;
+                        window.fetch = function () {
+                            pending.count++;
+                            return originalFetch.apply(this, arguments).finally(function () {
+                                pending.count--;
+                            });
+                        };
+                    }
+                    var originalSend = XMLHttpRequest.prototype.send;
+                    XMLHttpRequest.prototype.send = function () {
+                        pending.count++;
+                        this.addEventListener('loadend', function () { pending.count--; });
+                        return originalSend.apply(this, arguments);
+                    };
+                }
+                if (document.readyState !== 'complete' || window.__pendingRequests.count > 0) {
+                    return false;
+                }
+                var entries = performance.getEntriesByType('resource');
+                var lastEnd = entries.length ? entries[entries.length - 1].responseEnd : 0;
+                return performance.now() - lastEnd >= idle;
+            """, idle_ms)
+
+        return self.wait_for(network_idle, "network idle", timeout)
+
+    def start_transition(self):
+        """Mark the start of a page change for capture_performance (no-op unless enabled)"""
+        return perf_metrics.start_transition(self.driver)
+
+    def capture_performance(self, label, marker=None):
+        """Record load timings for the page now shown under `label` (no-op unless enabled)"""
+        return perf_metrics.capture(self.driver, label, marker)
+
+    def save_artifacts(self, reason):
+        """Queue a screenshot, DOM snapshot and console log for the current test (written off-thread)"""
+        return artifacts.capture(self.driver, reason)
 
     def find_element(self, locator):
-        return self.wait.until(EC.presence_of_element_located(locator))
+        """Element for locator, reused until the page changes (see ElementCache)"""
+        locator = compile_locator(locator)
+        element = self.elements.get(locator)
+        if element is None:
+            element = self.elements.put(locator, self.wait_for(EC.presence_of_element_located(locator), locator))
+        return element
+
+    def find_by_text(self, locator, text):
+        """First element matching a CSS locator whose text is exactly `text` (one round trip, no XPath)"""
+        _, css = compile_locator(locator)
+        return self.wait_for(lambda driver: driver.execute_script(FIND_BY_TEXT_SCRIPT, css, text), f"{css} '{text}'")
+
+    def _retry_stale(self, action):
+        # A cached element can be detached by a re-render; resolve it again once
+        try:
+            return action()
+        except StaleElementReferenceException:
+            self.elements.invalidate(stale=True)
+            return action()
 
     def click(self, locator):
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        def action():
+            element = self.find_element(locator)
+            self.wait_for(EC.element_to_be_clickable(element), locator).click()
+        self._retry_stale(action)
+        self.elements.invalidate()
+
+    def js_click(self, element):
+        """Click through JavaScript (ignores overlays and scrolling), then start a new page-state epoch"""
+        self.driver.execute_script("arguments[0].click();", element)
+        self.elements.invalidate()
 
     def input_text(self, locator, text):
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def action():
+            element = self.find_element(locator)
+            element.clear()
+            element.send_keys(text)
+        self._retry_stale(action)
 
     def get_text(self, locator):
-        return self.find_element(locator).text
+        return self._retry_stale(lambda: self.find_element(locator).text)
 
     def is_displayed(self, locator):
         try:
-            return self.find_element(locator).is_displayed()
+            return self._retry_stale(lambda: self.find_element(locator).is_displayed())
         except:
-            return False
\ No newline at end of file
+            return False
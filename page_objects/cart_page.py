@@ -1,10 +1,38 @@
 # page_objects/cart_page.py
+from typing import NamedTuple, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from .base_page import BasePage
-import time
-from page_objects.inventory_page import InventoryPage
+from .locators import product_slug
+from page_objects.inventory_page import InventoryPage, parse_price
+
+
+class CartItemRecord(NamedTuple):
+    """One line in the cart"""
+    name: str
+    price: Optional[float]
+    quantity: int
+    button_id: Optional[str]
+
+
+# Reads every cart line (and the count of removed placeholders) in one round trip.
+CART_SNAPSHOT_SCRIPT = """
+    var text = function (root, selector) {
+        var el = root.querySelector(selector);
+        return el ? el.textContent.trim() : null;
+    };
+    var items = Array.prototype.map.call(document.querySelectorAll('.cart_item'), function (item) {
+        var button = item.querySelector('button');
+        return [
+            text(item, '.inventory_item_name'),
+            text(item, '.inventory_item_price'),
+            text(item, '.cart_quantity'),
+            button ? button.id : null
+        ];
+    });
+    return {items: items, removed: document.querySelectorAll('.removed_cart_item').length};
+"""
 
 
 class CartPage(BasePage):
@@ -12,18 +40,18 @@ class CartPage(BasePage):
     CHECKOUT_BUTTON = (By.ID, "checkout")
     CONTINUE_SHOPPING_BUTTON = (By.ID, "continue-shopping")
     CART_ITEMS = (By.CLASS_NAME, "cart_item")
-    REMOVE_BUTTON = (By.XPATH, "//button[text()='Remove']")
+    REMOVE_BUTTON = (By.CSS_SELECTOR, ".cart_item button[id^='remove-']")
+    REMOVE_ITEM_BUTTON = (By.ID, "remove-{slug}")
     ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
     ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
+    CART_CONTAINER = (By.CLASS_NAME, "cart_contents_container")
     
     def __init__(self, driver):
         # Reusing code: This constructor calls the parent BasePage constructor
         super().__init__(driver)
         
         try:
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("cart.html")
-            )
+            self.wait_for(EC.url_contains("cart.html"), "url contains cart.html")
         except Exception as e:
             print(f"Warning: Cart page URL check failed: {e}")
     
@@ -35,30 +63,28 @@ class CartPage(BasePage):
                 print(f"Warning: Not on cart page. Current URL: {self.driver.current_url}")
                 # Try to navigate to cart first
                 self.driver.get(self.driver.current_url.split("/cart.html")[0] + "/cart.html")
-                WebDriverWait(self.driver, 10).until(
-                   EC.url_contains("cart.html")
-                )
+                self.elements.invalidate()
+                self.wait_for(EC.url_contains("cart.html"), "url contains cart.html")
         
             # Find and click checkout button
-            checkout_button = WebDriverWait(self.driver, 15).until(
-                EC.element_to_be_clickable(self.CHECKOUT_BUTTON)
+            checkout_button = self.wait_for(
+                EC.element_to_be_clickable(self.CHECKOUT_BUTTON), self.CHECKOUT_BUTTON, timeout=15
             )
-            self.driver.execute_script("arguments[0].click();", checkout_button)
+            marker = self.start_transition()
+            self.js_click(checkout_button)
             print("Clicked checkout button")
         
             # Wait for checkout page to load
-            WebDriverWait(self.driver, 10).until(
-               EC.url_contains("checkout-step-one.html")
-            )
+            self.wait_for(EC.url_contains("checkout-step-one.html"), "url contains checkout-step-one.html")
             print(f"Navigated to checkout page: {self.driver.current_url}")
         
             # Wait for the form to be visible
-            WebDriverWait(self.driver, 10).until(
-               EC.visibility_of_element_located((By.ID, "first-name"))
-            )
+            first_name = (By.ID, "first-name")
+            self.wait_for(EC.visibility_of_element_located(first_name), first_name)
+            self.capture_performance("checkout_step_one", marker)
         except Exception as e:
             print(f"Error proceeding to checkout: {e}")
-            self.driver.save_screenshot("checkout_navigation_error.png")
+            self.save_artifacts("checkout_navigation_error")
             raise
     
     def continue_shopping(self):
@@ -68,18 +94,18 @@ class CartPage(BasePage):
         """
         try:
             # Find and click the continue shopping button
-            continue_button = WebDriverWait(self.driver, 10).until(
-               EC.element_to_be_clickable(self.CONTINUE_SHOPPING_BUTTON)
+            continue_button = self.wait_for(
+               EC.element_to_be_clickable(self.CONTINUE_SHOPPING_BUTTON), self.CONTINUE_SHOPPING_BUTTON
             )
         
              # Use JavaScript for more reliable clicking
-            self.driver.execute_script("arguments[0].click();", continue_button)
+            marker = self.start_transition()
+            self.js_click(continue_button)
             print("Clicked continue shopping button")
         
             # Wait for navigation to inventory page
-            WebDriverWait(self.driver, 10).until(
-               EC.url_contains("inventory.html")
-            )
+            self.wait_for(EC.url_contains("inventory.html"), "url contains inventory.html")
+            self.capture_performance("inventory", marker)
         
             print(f"Navigated back to inventory: {self.driver.current_url}")
         
@@ -88,13 +114,11 @@ class CartPage(BasePage):
             return InventoryPage(self.driver)
         except Exception as e:
             print(f"Error navigating back to inventory: {e}")
-            self.driver.save_screenshot("continue_shopping_error.png")
+            self.save_artifacts("continue_shopping_error")
             # If navigation fails, try direct URL
             try:
                 self.driver.get(self.driver.current_url.replace("cart.html", "inventory.html"))
-                WebDriverWait(self.driver, 10).until(
-                   EC.url_contains("inventory.html")
-                )
+                self.wait_for(EC.url_contains("inventory.html"), "url contains inventory.html")
                 print(f"Forced navigation to inventory page: {self.driver.current_url}")
                 from .inventory_page import InventoryPage
                 return InventoryPage(self.driver)
@@ -108,93 +132,88 @@ class CartPage(BasePage):
        # Example: "Sauce Labs Backpack" → "remove-sauce-labs-backpack"
        """Removes an item from the cart using the item's name."""
        # Convert name to ID for removal
-       item_id = item_name.lower().replace(" ", "-")
-       button_id = f"remove-{item_id}"
+       remove_locator = self.locator("REMOVE_ITEM_BUTTON", slug=product_slug(item_name))
        try:
            # Find and click the remove button
-           remove_button = WebDriverWait(self.driver, 10).until(
-               EC.element_to_be_clickable((By.ID, button_id))
+           remove_button = self.wait_for(
+               EC.element_to_be_clickable(remove_locator), remove_locator
            )
         
             # Use JavaScript to click for reliability
-           self.driver.execute_script("arguments[0].click();", remove_button)
+           self.js_click(remove_button)
            print(f"Removed item: {item_name}")
         
            # Important: Wait for the item to be removed from the DOM
-           WebDriverWait(self.driver, 10).until_not(
-              EC.presence_of_element_located((By.ID, button_id))
-            )
-        
-            # Wait for any animations or updates to complete
-           time.sleep(1)
-        
-            # Force a page refresh to ensure state is updated
-           self.driver.refresh()
+           self.wait_until_not(
+              EC.presence_of_element_located(remove_locator), remove_locator
+           )
         
-           # Wait for page to reload
-           WebDriverWait(self.driver, 10).until(
-               EC.presence_of_element_located((By.CLASS_NAME, "cart_contents_container"))
-            )
+           # Wait for the cart list to finish re-rendering (no refresh needed)
+           self.wait_for_dom_stable()
         
        except Exception as e:
            print(f"Error removing item: {e}")
-           self.driver.save_screenshot("remove_item_error.png")
+           self.save_artifacts("remove_item_error")
            raise
     
     def get_cart_items(self):
         try:
             # Ensure we're on cart page
-            WebDriverWait(self.driver, 10).until(
-               EC.url_contains("cart.html")
-            )
+            self.wait_for(EC.url_contains("cart.html"), "url contains cart.html")
             print(f"Checking cart items on: {self.driver.current_url}")
         
             # Wait for cart page to fully load
-            WebDriverWait(self.driver, 10).until(
-               EC.visibility_of_element_located((By.CLASS_NAME, "cart_contents_container"))
+            self.wait_for(
+               EC.visibility_of_element_located(self.CART_CONTAINER), self.CART_CONTAINER
             )
         
-            # Try with a slight delay
-            time.sleep(1)
-        
-            # Find all cart items
-            items = self.driver.find_elements(By.CLASS_NAME, "cart_item")
+            # Read all cart items in one call
+            items, removed = self._snapshot()
             print(f"Found {len(items)} cart items")
         
             if not items:
                # If no items found, check if page is truly empty or if there's an issue
-               empty_cart = len(self.driver.find_elements(By.CLASS_NAME, "removed_cart_item")) > 0
-               if empty_cart:
+               if removed:
                    print("Cart appears to be empty (removed items found)")
                else:
                    print("No cart items found but cart doesn't appear empty")
                    # Take a screenshot for debugging
-                   self.driver.save_screenshot("empty_cart_debug.png")
+                   self.save_artifacts("empty_cart_debug")
         
             cart_contents = []
             for item in items:
-                try:
-                    name = item.find_element(By.CLASS_NAME, "inventory_item_name").text
-                    price = item.find_element(By.CLASS_NAME, "inventory_item_price").text
-                    print(f"Cart item: {name}, {price}")
-                    cart_contents.append({"name": name, "price": price})
-                except Exception as e:
-                    print(f"Error getting cart item details: {e}")
+                price = f"${item.price:.2f}" if item.price is not None else ""
+                print(f"Cart item: {item.name}, {price}")
+                cart_contents.append({"name": item.name, "price": price})
         
             return cart_contents
         except Exception as e:
             print(f"Error getting cart items: {e}")
-            self.driver.save_screenshot("cart_items_error.png")
+            self.save_artifacts("cart_items_error")
             return []
     
+    def get_cart_snapshot(self):
+        """
+        Snapshot every cart line with a single JavaScript call.
+
+        Returns:
+            List of CartItemRecord in display order
+        """
+        self.wait_for(EC.presence_of_element_located(self.CART_CONTAINER), self.CART_CONTAINER)
+        return self._snapshot()[0]
+
+    def _snapshot(self):
+        data = self.driver.execute_script(CART_SNAPSHOT_SCRIPT)
+        items = [
+            CartItemRecord(name, parse_price(price), int(quantity or 1), button_id)
+            for name, price, quantity, button_id in data["items"]
+        ]
+        return items, data["removed"]
+
     def get_total_price(self):
-        # New code: Calculate the total price of items in cart
-        items = self.get_cart_items()
-        total = 0
-        
-        for item in items:
-            # Convert price from "$29.99" format to float
-            price = float(item["price"].replace("$", ""))
-            total += price
-            
-        return total
\ No newline at end of file
+        # Sum item prices x quantity from a single snapshot
+        return sum(
+            item.price * item.quantity
+            for item in self.get_cart_snapshot()
+            if item.price is not None
+        )
\ No newline at end of file
@@ -1,10 +1,52 @@
 # page_objects/inventory_page.py
+from typing import NamedTuple, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.ui import Select
 from .base_page import BasePage
-import time
+from .locators import product_slug
+
+
+class ProductRecord(NamedTuple):
+    """One product card on the inventory page"""
+    name: str
+    price: Optional[float]
+    description: str
+    button_id: Optional[str]
+
+    @property
+    def in_cart(self):
+        return bool(self.button_id) and self.button_id.startswith("remove-")
+
+
+# Reads every product card in a single WebDriver round trip.
+# Returns compact [name, price, description, button_id] rows.
+PRODUCT_SNAPSHOT_SCRIPT = """
+    var text = function (root, selector) {
+        var el = root.querySelector(selector);
+        return el ? el.textContent.trim() : null;
+    };
+    return Array.prototype.map.call(document.querySelectorAll('.inventory_item'), function (item) {
+        var button = item.querySelector('button');
+        return [
+            text(item, '.inventory_item_name'),
+            text(item, '.inventory_item_price'),
+            text(item, '.inventory_item_desc'),
+            button ? button.id : null
+        ];
+    });
+"""
+
+
+def parse_price(price_text):
+    """Convert "$29.99" to 29.99 (None if the text isn't a price)"""
+    try:
+        return float(price_text.replace("$", ""))
+    except (AttributeError, ValueError) as e:
+        print(f"Error converting price '{price_text}': {e}")
+        return None
+
 
 class InventoryPage(BasePage):
     # Locators
@@ -12,6 +54,12 @@ class InventoryPage(BasePage):
     SORT_DROPDOWN = (By.CLASS_NAME, "product_sort_container")
     CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
     CART_LINK = (By.CLASS_NAME, "shopping_cart_link")
+    INVENTORY_ITEM = (By.CLASS_NAME, "inventory_item")
+    MENU_BUTTON = (By.ID, "react-burger-menu-btn")
+    LOGOUT_LINK = (By.ID, "logout_sidebar_link")
+    ITEM_NAME = (By.CLASS_NAME, "inventory_item_name")
+    ADD_TO_CART_BUTTON = (By.ID, "add-to-cart-{slug}")
+    REMOVE_BUTTON = (By.ID, "remove-{slug}")
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -24,8 +72,8 @@ class InventoryPage(BasePage):
         """Sort products using the dropdown"""
         try:
            # Wait for the dropdown to be clickable
-           sort_dropdown = WebDriverWait(self.driver, 10).until(
-               EC.element_to_be_clickable(self.SORT_DROPDOWN)
+           sort_dropdown = self.wait_for(
+               EC.element_to_be_clickable(self.SORT_DROPDOWN), self.SORT_DROPDOWN
             )
         
             # Use Select class
@@ -55,8 +103,8 @@ class InventoryPage(BasePage):
                 except Exception as text_error:
                     print(f"Failed to select by text: {text_error}")
         
-            # Allow time for sort to complete
-           time.sleep(1)
+            # Wait for the list to finish re-rendering
+           self.wait_for_dom_stable()
         
         except Exception as e:
             print(f"Error sorting products: {e}")
@@ -68,38 +116,32 @@ class InventoryPage(BasePage):
         print(f"Looking for item: {item_name}")
 
         # Wait for inventory page to load fully
-        WebDriverWait(self.driver, 10).until(
-           EC.presence_of_all_elements_located((By.CLASS_NAME, "inventory_item"))
+        self.wait_for(
+           EC.presence_of_all_elements_located(self.INVENTORY_ITEM), self.INVENTORY_ITEM
         )
 
         try:
-            # Construct direct button ID
-            item_id = item_name.lower().replace(" ", "-")
-            button_id = f"add-to-cart-{item_id}"
-            print(f"Trying button ID: {button_id}")
+            # Buttons are identified by the product name, e.g. add-to-cart-sauce-labs-backpack
+            slug = product_slug(item_name)
+            add_button_locator = self.locator("ADD_TO_CART_BUTTON", slug=slug)
+            print(f"Trying button ID: {add_button_locator[1]}")
         
             # Wait for button to be clickable
-            add_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.ID, button_id))
+            add_button = self.wait_for(
+                EC.element_to_be_clickable(add_button_locator), add_button_locator
             )
         
              # Scroll to the button to ensure it's in view
             self.driver.execute_script("arguments[0].scrollIntoView(true);", add_button)
         
               # Use JavaScript to click the button (more reliable)
-            self.driver.execute_script("arguments[0].click();", add_button)
+            self.js_click(add_button)
             print(f"Added {item_name} to cart")
         
-             # Wait for cart badge to be visible or updated
+             # Wait for the button to flip to "Remove", which happens once the cart is updated
             try:
-                # Wait for the DOM to update
-                time.sleep(0.5)
-            
-                # Don't refresh - that can cause issues
-                # Instead, just wait for badge to be present
-                WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "shopping_cart_badge"))
-                )
+                remove_button = self.locator("REMOVE_BUTTON", slug=slug)
+                self.wait_for(EC.presence_of_element_located(remove_button), remove_button, timeout=5)
             except:
                 print("Note: Cart badge may not be visible yet")
             
@@ -119,61 +161,58 @@ class InventoryPage(BasePage):
         """Click the cart icon and navigate to the cart page"""
         try:
             # Find and click cart link
-            cart_link = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.CART_LINK)
+            cart_link = self.wait_for(
+                EC.element_to_be_clickable(self.locator("CART_LINK")), self.CART_LINK
             )
         
             # Use JavaScript for more reliable clicking
-            self.driver.execute_script("arguments[0].click();", cart_link)
+            marker = self.start_transition()
+            self.js_click(cart_link)
             print("Clicked cart icon")
         
             # Wait for cart page URL
-            WebDriverWait(self.driver, 10).until(
-               EC.url_contains("cart.html")
-            )
+            self.wait_for(EC.url_contains("cart.html"), "url contains cart.html")
         
             # Wait for page to fully load
-            WebDriverWait(self.driver, 10).until(
-               EC.presence_of_element_located((By.CLASS_NAME, "cart_contents_container"))
-            )
+            cart_container = (By.CLASS_NAME, "cart_contents_container")
+            self.wait_for(EC.presence_of_element_located(cart_container), cart_container)
+            self.capture_performance("cart", marker)
         
             print(f"Navigated to cart: {self.driver.current_url}")
         
-            # Wait for items to load
-            time.sleep(1)
-        
             from .cart_page import CartPage
             return CartPage(self.driver)
         except Exception as e:
             print(f"Error navigating to cart: {e}")
-            self.driver.save_screenshot("cart_navigation_error.png")
+            self.save_artifacts("cart_navigation_error")
             raise
 
         
+    def get_products(self):
+        """
+        Snapshot every product on the page with a single JavaScript call.
+
+        Returns:
+            List of ProductRecord in display order
+        """
+        # Wait for products to be visible
+        self.wait_for(EC.visibility_of_element_located(self.INVENTORY_ITEM), self.INVENTORY_ITEM)
+
+        rows = self.driver.execute_script(PRODUCT_SNAPSHOT_SCRIPT)
+        return [
+            ProductRecord(name, parse_price(price), description, button_id)
+            for name, price, description, button_id in rows
+        ]
+
     def get_first_product_name(self):
         """Get the name of the first product in the listing"""
-        first_product = self.find_element((By.CLASS_NAME, "inventory_item_name"))
-        return first_product.text
+        products = self.get_products()
+        return products[0].name if products else None
 
     def get_all_product_prices(self):
         """Get a list of all product prices as floats"""
         try:
-            # Wait for products to be visible
-            self.wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "inventory_item")))
-        
-            # Get price elements
-            price_elements = self.driver.find_elements(By.CLASS_NAME, "inventory_item_price")
-            print(f"Found {len(price_elements)} price elements")
-        
-            # Extract prices
-            prices = []
-            for elem in price_elements:
-                price_text = elem.text.replace("$", "")
-                try:
-                   prices.append(float(price_text))
-                except ValueError as e:
-                   print(f"Error converting price '{price_text}': {e}")
-        
+            prices = [product.price for product in self.get_products() if product.price is not None]
             print(f"Extracted prices: {prices}")
             return prices
         except Exception as e:
@@ -187,32 +226,29 @@ class InventoryPage(BasePage):
          Args:
             product_name: The name of the product to view
          """
-        # Locate the product name element using XPath
-         product_link_locator = (By.XPATH, f"//div[contains(@class, 'inventory_item_name') and text()='{product_name}']")
-    
-        # Use the click method from BasePage
-         self.click(product_link_locator)
+        # Match the product name by text in the page (CSS + one script call, no XPath)
+         product_link = self.find_by_text(self.ITEM_NAME, product_name)
+         self.wait_for(EC.element_to_be_clickable(product_link), self.ITEM_NAME).click()
+         self.elements.invalidate()
          
     def is_product_displayed(self, product_name):
         """
         Check if a product with the given name is displayed on the inventory page.
         """
-        products = self.driver.find_elements(By.CLASS_NAME, "inventory_item_name")
-        return any(product.text == product_name for product in products)
+        return any(product.name == product_name for product in self.get_products())
     
     def logout(self):
         # Step 1: Open sidebar
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.ID, "react-burger-menu-btn"))
-        ).click()
+        self.click(self.MENU_BUTTON)
 
         # Step 2: Wait for the logout link
-        logout_link = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.ID, "logout_sidebar_link"))
+        logout_link = self.wait_for(
+            EC.element_to_be_clickable(self.LOGOUT_LINK), self.LOGOUT_LINK
         )
 
         # Step 3: Click logout
         logout_link.click()
 
-        # Step 4: Hard wait for redirect to complete (1s fallback)
-        time.sleep(1)
+        # Step 4: Wait for the redirect to the login form to complete
+        login_button = (By.ID, "login-button")
+        self.wait_for(EC.visibility_of_element_located(login_button), login_button)
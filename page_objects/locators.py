@@ -0,0 +1,180 @@
+# page_objects/locators.py
+from selenium.webdriver.common.by import By
+
+# Strategies the browser resolves natively with querySelector; everything else
+# (XPath, link text) is evaluated more slowly and flagged by validate().
+FAST_STRATEGIES = (By.ID, By.CSS_SELECTOR)
+
+# Counts how many locators of a page exist, in one round trip
+VALIDATE_SCRIPT = """
+    var counts = {};
+    var locators = arguments[0];
+    for (var name in locators) {
+        try {
+            counts[name] = document.querySelectorAll(locators[name]).length;
+        } catch (e) {
+            counts[name] = -1;
+        }
+    }
+    return counts;
+"""
+
+# CSS match filtered by exact text, instead of an XPath text() expression
+FIND_BY_TEXT_SCRIPT = """
+    var matches = document.querySelectorAll(arguments[0]);
+    for (var i = 0; i < matches.length; i++) {
+        if (matches[i].textContent.trim() === arguments[1]) {
+            return matches[i];
+        }
+    }
+    return null;
+"""
+
+
+def product_slug(name):
+    """Product name as used in Swag Labs button IDs: "Sauce Labs Backpack" -> "sauce-labs-backpack" """
+    return name.lower().replace(" ", "-")
+
+
+def compile_locator(locator):
+    """
+    Rewrite a locator to the fastest equivalent strategy.
+
+    CLASS_NAME, NAME and TAG_NAME become CSS selectors; ID and CSS are kept;
+    XPath and link text are returned unchanged (validate() reports them).
+    """
+    by, value = locator
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return by, value
+
+
+def css_for(locator):
+    """CSS selector for a compiled locator (None if it has no CSS form)"""
+    by, value = locator
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CSS_SELECTOR:
+        return value
+    return None
+
+
+class LocatorRegistry:
+    """
+    All locators a page class declares, compiled once per class.
+
+    Locators are the upper-case (By, value) class attributes, including
+    inherited ones. Values containing {placeholders} are templates, filled
+    in by get(name, **params).
+    """
+
+    _registries = {}
+
+    def __init__(self, page_class):
+        self.page = page_class.__name__
+        self.locators = {}
+        for klass in reversed(page_class.__mro__):
+            for name, value in vars(klass).items():
+                if name.isupper() and isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], str):
+                    self.locators[name] = compile_locator(value)
+
+    @classmethod
+    def for_page(cls, page_class):
+        if page_class not in cls._registries:
+            cls._registries[page_class] = cls(page_class)
+        return cls._registries[page_class]
+
+    def get(self, name, **params):
+        by, value = self.locators[name]
+        return (by, value.format(**params)) if params else (by, value)
+
+    def slow(self):
+        """Names of locators that use a strategy the browser can't resolve natively"""
+        return sorted(name for name, (by, _) in self.locators.items() if by not in FAST_STRATEGIES)
+
+    def validate(self, driver):
+        """
+        Check every non-template locator against the current page in one round trip.
+
+        Returns:
+            {name: number of matching elements}; templates and slow locators are
+            left out, and -1 marks an invalid selector
+        """
+        selectors = {}
+        for name, locator in self.locators.items():
+            css = css_for(locator)
+            if css and "{" not in css:
+                selectors[name] = css
+        counts = driver.execute_script(VALIDATE_SCRIPT, selectors)
+        missing = sorted(name for name, count in counts.items() if count <= 0)
+        if missing:
+            print(f"[Locators]: {self.page} locators not on the page: {', '.join(missing)}")
+        if self.slow():
+            print(f"[Locators]: {self.page} locators using slow strategies: {', '.join(self.slow())}")
+        return counts
+
+
+class ElementCache:
+    """
+    Resolved WebElements for one page object, valid for one page-state epoch.
+
+    The epoch ends whenever the page object does something that can change
+    the page (click, navigation, script actions) and when a cached element
+    turns out to be stale. Within an epoch, repeated lookups of the same
+    locator cost no WebDriver round trip.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.epoch = 0
+        self._elements = {}
+
+    def get(self, locator):
+        element = self._elements.get(locator)
+        if element is not None:
+            self.stats.hits += 1
+        return element
+
+    def put(self, locator, element):
+        self.stats.lookups += 1
+        self._elements[locator] = element
+        return element
+
+    def invalidate(self, stale=False):
+        if stale:
+            self.stats.stale += 1
+        if self._elements:
+            self._elements.clear()
+        self.epoch += 1
+
+
+class LocatorStats:
+    """Element cache hits vs. lookups that went to the browser, for the whole run"""
+
+    def __init__(self):
+        self.validate = False
+        self.hits = 0
+        self.lookups = 0
+        self.stale = 0
+
+    def summary(self):
+        total = self.hits + self.lookups
+        return {
+            "hits": self.hits,
+            "lookups": self.lookups,
+            "stale": self.stale,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def format(self):
+        summary = self.summary()
+        return (f"{summary['hits']} cache hits, {summary['lookups']} driver lookups "
+                f"({summary['hit_rate']:.0%} hit rate), {summary['stale']} stale elements re-resolved")
+
+
+# Shared by the page objects in this process
+locator_stats = LocatorStats()
@@ -1,6 +1,7 @@
 # page_objects/login_page.py
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from utils.perf_metrics import perf_metrics
 
 class LoginPage(BasePage):
     # Locators
@@ -14,11 +15,18 @@ class LoginPage(BasePage):
 
     def navigate(self, base_url):
         self.driver.get(base_url)
+        self.elements.invalidate()
+        self.capture_performance("login")
 
     def login(self, username, password):
         self.input_text(self.USERNAME_INPUT, username)
         self.input_text(self.PASSWORD_INPUT, password)
+        marker = self.start_transition()
         self.click(self.LOGIN_BUTTON)
+        if perf_metrics.enabled:
+            # The result (inventory or an error) renders client-side; let it settle first
+            self.wait_for_dom_stable()
+            self.capture_performance("login_submit", marker)
 
     def get_error_message(self):
         return self.get_text(self.ERROR_MESSAGE)
\ No newline at end of file
@@ -0,0 +1,199 @@
+# render_reports.py
+# Build HTML and JUnit reports from the results files pytest writes while it runs,
+# so the suite never has to be re-run just to produce a report.
+# Example: python render_reports.py reports/results --html reports/report.html --junit reports/junit.xml
+#          python render_reports.py shard-1/ shard-2/ --html reports/report.html
+#          python render_reports.py reports/browserstack --html reports/browserstack/report.html
+import argparse
+import html
+import os
+import time
+from collections import Counter
+from xml.sax.saxutils import quoteattr, escape
+
+from utils.durations import DurationStore
+from utils.results_store import DEFAULT_RESULTS_DIR, expand_paths, read_results
+
+OUTCOME_ORDER = ("failed", "error", "xpassed", "passed", "skipped", "xfailed")
+PROBLEMS = ("failed", "error", "xpassed")
+
+STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+td.num { text-align: right; white-space: nowrap; }
+.passed { color: #1a7f37; } .failed, .error, .xpassed { color: #cf222e; } .skipped, .xfailed { color: #9a6700; }
+pre { background: #f6f8fa; padding: 8px; overflow-x: auto; white-space: pre-wrap; }
+details { margin: 0.5em 0 1em; }
+"""
+
+
+def summarize(paths):
+    """First pass: counts and timings only, so memory doesn't grow with the run"""
+    counts = Counter()
+    duration = 0.0
+    start = stop = None
+    workers = set()
+    for record in read_results(paths):
+        counts[record["outcome"]] += 1
+        duration += record["duration"]
+        if record.get("start"):
+            start = min(start or record["start"], record["start"])
+        if record.get("stop"):
+            stop = max(stop or record["stop"], record["stop"])
+        workers.add((record.get("group"), record.get("shard"), record.get("worker")))
+    return {"counts": counts, "tests": sum(counts.values()), "duration": duration,
+            "wall": (stop - start) if start and stop else None, "processes": len(workers)}
+
+
+def _where(record):
+    """Environment directory and worker a test ran in (e.g. Chrome_Windows10/gw1)"""
+    parts = [record.get("group"), record.get("worker") or record.get("shard")]
+    return "/".join(str(part) for part in parts if part)
+
+
+def _details(record):
+    parts = []
+    if record.get("longrepr"):
+        parts.append(f"<pre>{html.escape(record['longrepr'])}</pre>")
+    for title, content in record.get("sections", ()):
+        parts.append(f"<details><summary>{html.escape(title)}</summary><pre>{html.escape(content)}</pre></details>")
+    artifacts = record.get("properties", {}).get("artifacts")
+    if artifacts:
+        links = "".join(f'<li><a href="{html.escape(path)}">{html.escape(path)}</a></li>' for path in artifacts)
+        parts.append(f"<details><summary>Artifacts</summary><ul>{links}</ul></details>")
+    return "".join(parts)
+
+
+def render_html(paths, output, summary):
+    """
+    Write the HTML report.
+
+    Problems (with tracebacks and captured output) come first, then one row
+    per test. Each section is a separate streaming pass over the results, and
+    rows are written as they are read, so memory stays constant however many
+    tests the run had.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    counts = summary["counts"]
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test Report</title>"
+                f"<style>{STYLE}</style></head><body><h1>Test Report</h1>")
+        totals = ", ".join(f"<span class='{name}'>{counts[name]} {name}</span>"
+                           for name in OUTCOME_ORDER if counts[name])
+        wall = f", {summary['wall']:.1f}s wall clock" if summary["wall"] else ""
+        f.write(f"<p>{summary['tests']} tests: {totals}</p>"
+                f"<p>{summary['duration']:.1f}s of test time{wall} across {summary['processes']} process(es). "
+                f"Generated {time.strftime('%Y-%m-%d %H:%M:%S')}.</p>")
+
+        if any(counts[name] for name in PROBLEMS):
+            f.write("<h2>Problems</h2>")
+            for record in read_results(paths):
+                if record["outcome"] in PROBLEMS:
+                    f.write(f"<h3 class='{record['outcome']}'>{html.escape(record['nodeid'])} "
+                            f"({record['outcome']})</h3>{_details(record)}")
+
+        f.write("<h2>All tests</h2><table><tr><th>Result</th><th>Test</th><th>Duration</th><th>Where</th></tr>")
+        for record in read_results(paths):
+            f.write(f"<tr><td class='{record['outcome']}'>{record['outcome']}</td>"
+                    f"<td>{html.escape(record['nodeid'])}</td>"
+                    f"<td class='num'>{record['duration']:.2f}s</td>"
+                    f"<td>{html.escape(_where(record))}</td></tr>")
+        f.write("</table></body></html>\n")
+
+
+def _junit_names(nodeid):
+    """("tests.ui_tests.test_login.TestLogin", "test_valid_login") from a pytest node ID"""
+    parts = nodeid.split("::")
+    module = parts[0].replace("/", ".").replace("\\", ".")
+    if module.endswith(".py"):
+        module = module[:-3]
+    classname = ".".join([module] + parts[1:-1])
+    return classname, parts[-1] if len(parts) > 1 else parts[0]
+
+
+def render_junit(paths, output, summary):
+    """Write JUnit XML (one testsuite), streaming test cases like render_html"""
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    counts = summary["counts"]
+    with open(output, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>')
+        f.write(f'<testsuite name="pytest" tests="{summary["tests"]}" failures="{counts["failed"] + counts["xpassed"]}" '
+                f'errors="{counts["error"]}" skipped="{counts["skipped"] + counts["xfailed"]}" '
+                f'time="{summary["duration"]:.3f}">\n')
+        for record in read_results(paths):
+            classname, name = _junit_names(record["nodeid"])
+            if record.get("group"):
+                # Keep the same test from different environments apart
+                classname = f"{record['group']}.{classname}"
+            f.write(f"<testcase classname={quoteattr(classname)} name={quoteattr(name)} "
+                    f'time="{record["duration"]:.3f}">')
+            outcome = record["outcome"]
+            message = record.get("longrepr") or ""
+            first_line = message.strip().splitlines()[-1] if message.strip() else outcome
+            if outcome in ("failed", "xpassed"):
+                f.write(f"<failure message={quoteattr(first_line[:200])}>{escape(message)}</failure>")
+            elif outcome == "error":
+                f.write(f"<error message={quoteattr(first_line[:200])}>{escape(message)}</error>")
+            elif outcome in ("skipped", "xfailed"):
+                f.write(f"<skipped message={quoteattr(first_line[:200])}/>")
+            output_sections = [content for title, content in record.get("sections", ()) if title.startswith("Captured")]
+            if output_sections:
+                f.write(f"<system-out>{escape(chr(10).join(output_sections))}</system-out>")
+            f.write("</testcase>\n")
+        f.write("</testsuite></testsuites>\n")
+
+
+def update_durations(paths, durations_file):
+    """
+    Blend the durations of every recorded test into a durations file.
+
+    CI shards each time only their own tests, so they record into one file
+    here, after the run, and every shard of the next run reads the same one.
+    """
+    store = DurationStore(durations_file)
+    for record in read_results(paths):
+        if record["outcome"] in ("passed", "failed"):
+            store.add(record["nodeid"], record["duration"])
+    store.save()
+    return store
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render HTML/JUnit reports from pytest results files")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_RESULTS_DIR],
+                        help="Results files or directories holding results-*.jsonl, searched recursively "
+                             "(e.g. one per CI shard or BrowserStack environment)")
+    parser.add_argument("--html", default=None, help="HTML report to write")
+    parser.add_argument("--junit", default=None, help="JUnit XML report to write")
+    parser.add_argument("--update_durations", default=None,
+                        help="Blend the run's test durations into this durations file (used for shard balancing)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not expand_paths(args.paths):
+        raise SystemExit(f"No results files found in {', '.join(args.paths)}")
+    if args.update_durations:
+        store = update_durations(args.paths, args.update_durations)
+        print(f"Updated {store.path} ({len(store.durations)} tests)")
+        if not (args.html or args.junit):
+            return 0
+    if not (args.html or args.junit):
+        args.html = os.path.join("reports", "report.html")
+
+    start = time.perf_counter()
+    summary = summarize(args.paths)
+    if args.html:
+        render_html(args.paths, args.html, summary)
+    if args.junit:
+        render_junit(args.paths, args.junit, summary)
+    counts = ", ".join(f"{summary['counts'][name]} {name}" for name in OUTCOME_ORDER if summary["counts"][name])
+    print(f"Rendered {summary['tests']} tests ({counts}) in {time.perf_counter() - start:.1f}s")
+    # Fail like pytest would, so CI still marks the build red
+    return 1 if any(summary["counts"][name] for name in PROBLEMS) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
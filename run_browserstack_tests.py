@@ -1,18 +1,55 @@
 # run_browserstack_tests.py
+# Run the UI suite on every environment in browserstack_configs.json, several at a time.
+# Example: python run_browserstack_tests.py --max_parallel 3
+#          python run_browserstack_tests.py --grid_url http://localhost:4444/wd/hub
+import argparse
 import json
-import subprocess
 import os
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import render_reports
+from utils.results_store import expand_paths
+
+print_lock = threading.Lock()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the UI tests on several platforms in parallel")
+    parser.add_argument("--config", default="browserstack_configs.json",
+                        help="JSON file with an 'environments' list")
+    parser.add_argument("--max_parallel", type=int, default=2,
+                        help="Maximum environments running at once (respect your grid's session limit)")
+    parser.add_argument("--tests", default="tests/ui_tests/", help="Test path passed to pytest")
+    parser.add_argument("--results_dir", default="reports/browserstack",
+                        help="Where per-environment JUnit/JSON results, result streams and the summary are written")
+    parser.add_argument("--grid_url", default=None,
+                        help="Run against this Selenium Grid/standalone URL instead of BrowserStack")
+    parser.add_argument("--only", nargs="+", default=None, help="Only run the named environments")
+    parser.add_argument("pytest_args", nargs="*", help="Extra arguments passed through to pytest (after --)")
+    return parser.parse_args()
+
 
-# Load configurations
-with open('browserstack_configs.json', 'r') as f:
-    config = json.load(f)
+def build_command(env, args, junit_path):
+    """Turn one environment entry into a pytest command line"""
+    cmd = [sys.executable, "-m", "pytest", args.tests, "-v", f"--junitxml={junit_path}"]
+    cmd += ["--remote_url", args.grid_url] if args.grid_url else ["--use_browserstack"]
+    # Every environment streams its results to its own directory; render_reports merges them
+    env_dir = os.path.join(args.results_dir, env["name"])
+    cmd += ["--results_dir", env_dir]
+    # Runs happen side by side, so nothing they write may be shared: durations and their
+    # history are per environment (a Firefox timing says nothing about an iPhone) and so are artifacts
+    cmd += [
+        "--durations_file", f".test_durations.{env['name']}.json",
+        "--duration_history", f".duration_history.{env['name']}.db",
+        "--artifacts_dir", os.path.join(env_dir, "artifacts"),
+        "--network_dir", os.path.join(env_dir, "network"),
+    ]
 
-# Run tests on each configuration
-for env in config['environments']:
-    print(f"Running tests on {env['name']}...")
-    
-    cmd = ["pytest", "tests/ui_tests/", "-v", "--use_browserstack"]
-    
     # Add environment parameters
     for key, value in env.items():
         if key != 'name':
@@ -22,6 +59,94 @@ for env in config['environments']:
             else:
                 cmd.append(f"--{key}")
                 cmd.append(str(value))
-    
-    # Run the tests
-    subprocess.run(cmd)
\ No newline at end of file
+    return cmd + args.pytest_args
+
+
+def run_environment(env, args):
+    """Run pytest for one environment, streaming its output with a [name] prefix"""
+    name = env["name"]
+    junit_path = os.path.join(args.results_dir, f"{name}.xml")
+    cmd = build_command(env, args, junit_path)
+
+    with print_lock:
+        print(f"[{name}] Starting: {' '.join(cmd)}")
+
+    # Lets BrowserStack group sessions per environment in its dashboard
+    child_env = dict(os.environ, BROWSERSTACK_SESSION_NAME=name)
+    start = time.time()
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1, env=child_env)
+    for line in process.stdout:
+        with print_lock:
+            print(f"[{name}] {line}", end="")
+    returncode = process.wait()
+
+    result = {"name": name, "returncode": returncode, "duration": round(time.time() - start, 2)}
+    result.update(read_junit(junit_path))
+    with open(os.path.join(args.results_dir, f"{name}.json"), "w") as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+def read_junit(path):
+    """Pull test counts out of a pytest JUnit XML file"""
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    if not os.path.exists(path):
+        return counts
+    root = ET.parse(path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    for suite in suites:
+        for key in counts:
+            counts[key] += int(suite.get(key, 0))
+    return counts
+
+
+def print_summary(results, wall_time):
+    header = f"{'environment':<22}{'tests':>7}{'failed':>8}{'errors':>8}{'skipped':>9}{'time':>10}  status"
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        status = "PASS" if r["returncode"] == 0 else "FAIL"
+        print(f"{r['name']:<22}{r['tests']:>7}{r['failures']:>8}{r['errors']:>8}{r['skipped']:>9}"
+              f"{r['duration']:>9.1f}s  {status}")
+    serial = sum(r["duration"] for r in results)
+    print(f"\nWall time {wall_time:.1f}s (sum of runs {serial:.1f}s)")
+
+
+def main():
+    args = parse_args()
+
+    # Load configurations
+    with open(args.config, 'r') as f:
+        config = json.load(f)
+    environments = config['environments']
+    if args.only:
+        environments = [env for env in environments if env['name'] in args.only]
+
+    os.makedirs(args.results_dir, exist_ok=True)
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=max(1, args.max_parallel)) as executor:
+        results = list(executor.map(lambda env: run_environment(env, args), environments))
+    wall_time = time.time() - start
+
+    print_summary(results, wall_time)
+    summary = {
+        "wall_time": round(wall_time, 2),
+        "totals": {key: sum(r[key] for r in results) for key in ("tests", "failures", "errors", "skipped")},
+        "environments": results,
+    }
+    with open(os.path.join(args.results_dir, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    # One HTML report for every environment, from the results each run streamed
+    if expand_paths([args.results_dir]):
+        report = os.path.join(args.results_dir, "report.html")
+        render_reports.render_html([args.results_dir], report, render_reports.summarize([args.results_dir]))
+        print(f"Report: {report}")
+
+    sys.exit(0 if all(r["returncode"] == 0 for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# run_load_tests.py
+# Drive the ReqRes API scenarios from api_tests/ under load.
+# Example: python run_load_tests.py --api_mode mock --duration 30 --concurrency 20 --rate 200
+import argparse
+import json
+import os
+
+from mock_api.reqres import ReqResServer, LIVE_BASE_URL, DEFAULT_RECORDINGS
+from utils.api_client import ApiClient
+from utils.load_runner import LoadRunner, build_scenarios
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the API scenarios under load")
+    parser.add_argument("--scenario", nargs="+", default=["create_user", "get_user", "update_user", "delete_user"],
+                        help="Scenarios to run round-robin (create_user, get_user, update_user, delete_user)")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to run for")
+    parser.add_argument("--concurrency", type=int, default=10, help="Number of concurrent workers")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Target requests per second (default: as fast as the workers can go)")
+    parser.add_argument("--api_mode", choices=["live", "replay", "mock"], default="mock",
+                        help="Live ReqRes API, recorded responses, or the in-memory mock")
+    parser.add_argument("--api_recordings", default=DEFAULT_RECORDINGS,
+                        help="JSON file used by --api_mode replay")
+    parser.add_argument("--output", default=None, help="Optional path for a JSON copy of the report")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scenarios = build_scenarios()
+    unknown = [name for name in args.scenario if name not in scenarios]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    server = None
+    base_url = LIVE_BASE_URL
+    if args.api_mode != "live":
+        server = ReqResServer(args.api_mode, recordings=args.api_recordings).start()
+        base_url = server.base_url
+
+    # Retries would hide errors from the report, and timings are aggregated by the runner
+    client = ApiClient(base_url, pool_size=args.concurrency, retries=0, record_timings=False)
+    runner = LoadRunner(
+        client,
+        [scenarios[name] for name in args.scenario],
+        duration=args.duration,
+        concurrency=args.concurrency,
+        rate=args.rate,
+    )
+
+    print(f"Running {', '.join(args.scenario)} against {base_url} for {args.duration}s...")
+    try:
+        report = runner.run()
+    finally:
+        client.close()
+        if server:
+            server.stop()
+
+    print(report.format())
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 # test_data/data_reader.py
-import json
 import os
+from config import registry
 
 class DataReader:
     @staticmethod
@@ -12,12 +12,28 @@ class DataReader:
             file_path: Path to the JSON data file
             
         Returns:
-            The loaded data as a Python object
+            The loaded data, parsed once per process and read-only
+            (dicts are FrozenDicts; lists are shared, copy before changing them)
         """
         # Construct absolute path relative to this file
         base_dir = os.path.dirname(os.path.abspath(__file__))
         absolute_path = os.path.join(base_dir, file_path)
         
-        # Read and parse the JSON file
-        with open(absolute_path, 'r') as file:
-            return json.load(file)
\ No newline at end of file
+        # Parse the JSON file (cached after the first call)
+        return registry.load_json(absolute_path)
+
+    @staticmethod
+    def stream(file_path, id_field=None, **kwargs):
+        """
+        Open a large data file for streaming instead of loading it whole.
+
+        Args:
+            file_path: .jsonl, .csv or .json file, relative to test_data/
+            id_field: Field used as each record's test ID
+
+        Returns:
+            A DataSource (see test_data/providers.py); iterate it, or use
+            .params() for lazy pytest parametrization
+        """
+        from test_data.providers import open_source
+        return open_source(file_path, id_field=id_field, **kwargs)
\ No newline at end of file
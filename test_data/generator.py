@@ -0,0 +1,326 @@
+# test_data/generator.py
+# Deterministic synthetic test data for scale testing.
+# Example: python -m test_data.generator customers --count 1000000 --seed 42
+#          python -m test_data.generator login_users --count 50000 --format csv
+import argparse
+import csv
+import json
+import os
+import shutil
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from test_data.test_data import DataManager
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "generated")
+
+FIRST_NAMES = (
+    "John", "Jane", "Bob", "Alice", "Carlos", "Priya", "Wei", "Fatima", "Olga", "Kwame",
+    "Sofia", "Liam", "Noah", "Emma", "Mateo", "Aiko", "Omar", "Chloe", "Ivan", "Zoë",
+)
+LAST_NAMES = (
+    "Doe", "Smith", "Johnson", "Garcia", "Patel", "Chen", "Okafor", "Kowalski", "Nguyen", "Müller",
+    "Silva", "Brown", "Tanaka", "Haddad", "Ivanova", "Rossi", "O'Brien", "Kim", "Dubois", "Mensah",
+)
+JOBS = (
+    "Developer", "QA Engineer", "Manager", "Designer", "Product Owner", "Data Analyst",
+    "Support Engineer", "Architect", "Scrum Master", "SRE",
+)
+
+# Login outcomes and how often they appear (weights out of 100)
+LOGIN_CASES = (
+    ("valid_login", 50),
+    ("locked_user", 10),
+    ("invalid_password", 15),
+    ("unknown_user", 15),
+    ("empty_username", 5),
+    ("empty_password", 5),
+)
+
+# Column order for CSV output (and the keys every record of a kind may have)
+FIELDS = {
+    "login_users": ("id", "scenario", "username", "password", "expected_result", "expected_url", "expected_error"),
+    "customers": ("id", "first_name", "last_name", "zip_code"),
+    "cart_scenarios": ("id", "items"),
+    "api_users": ("id", "name", "job", "expected_status"),
+}
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(value):
+    """splitmix64 finaliser: a fast, well-distributed 64-bit hash"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+class _Draws:
+    """
+    Random numbers for one record, derived only from (seed, kind, index).
+
+    Any record can be regenerated on its own, which is what makes lookups by
+    key possible without storing the data. One hash seeds a 64-bit LCG, which
+    is several times cheaper than seeding a random.Random per record.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, salt, index):
+        self.state = _mix(salt ^ index)
+
+    def below(self, limit):
+        self.state = (self.state * 6364136223846793005 + 1442695040888963407) & _MASK
+        # High bits of an LCG are the well-mixed ones
+        return (self.state >> 16) % limit
+
+    def pick(self, options):
+        return options[self.below(len(options))]
+
+
+class SyntheticData:
+    """
+    Generates records shaped like the checked-in test data.
+
+    Kinds and their schemas:
+        login_users:    like ui/login_data.json scenarios (+ id, scenario)
+        customers:      like test_data.json "customers" (+ id)
+        cart_scenarios: id + list of product keys from test_data.json "products"
+        api_users:      like api/user_data.json "create_users" (+ id)
+
+    Record i of a kind is always the same for a given seed, and can be built
+    directly with record(kind, i).
+
+    Args:
+        seed: Changes every generated value
+        products: Product keys used in cart scenarios (default: test_data.json)
+    """
+
+    def __init__(self, seed=0, products=None):
+        self.seed = seed
+        self.products = tuple(products or DataManager().test_data["products"])
+        self._builders = {
+            "login_users": self._login_user,
+            "customers": self._customer,
+            "cart_scenarios": self._cart_scenario,
+            "api_users": self._api_user,
+        }
+        weights = []
+        for case, weight in LOGIN_CASES:
+            weights.extend([case] * weight)
+        self._login_cases = tuple(weights)
+
+    @property
+    def kinds(self):
+        return tuple(self._builders)
+
+    @staticmethod
+    def key(kind, index):
+        """Record ID, e.g. customers-0000042"""
+        return f"{kind}-{index:07d}"
+
+    @staticmethod
+    def index_of(key):
+        return int(key.rsplit("-", 1)[1])
+
+    def record(self, kind, index):
+        if kind not in self._builders:
+            raise ValueError(f"Unknown data kind '{kind}' (choose from {', '.join(self.kinds)})")
+        return self._builders[kind](_Draws(self._salt(kind), index), self.key(kind, index))
+
+    def _salt(self, kind):
+        return _mix((self.seed << 32) ^ zlib.crc32(kind.encode()))
+
+    def records(self, kind, count, start=0):
+        """Yield `count` records one at a time (constant memory)"""
+        build = self._builders[kind]
+        salt = self._salt(kind)
+        for index in range(start, start + count):
+            yield build(_Draws(salt, index), self.key(kind, index))
+
+    def _login_user(self, draws, record_id):
+        case = draws.pick(self._login_cases)
+        record = {"id": record_id, "scenario": case, "username": "standard_user", "password": "secret_sauce"}
+        if case == "valid_login":
+            record.update(expected_result="success", expected_url="inventory.html")
+            return record
+
+        record["expected_result"] = "failure"
+        if case == "locked_user":
+            record.update(username="locked_out_user", expected_error="Sorry, this user has been locked out")
+        elif case == "invalid_password":
+            record.update(password=f"wrong_{draws.below(10 ** 8):08d}",
+                          expected_error="Username and password do not match")
+        elif case == "unknown_user":
+            record.update(username=f"user_{draws.below(10 ** 8):08d}",
+                          expected_error="Username and password do not match")
+        elif case == "empty_username":
+            record.update(username="", expected_error="Username is required")
+        else:
+            record.update(password="", expected_error="Password is required")
+        return record
+
+    def _customer(self, draws, record_id):
+        return {
+            "id": record_id,
+            "first_name": draws.pick(FIRST_NAMES),
+            "last_name": draws.pick(LAST_NAMES),
+            "zip_code": f"{draws.below(100000):05d}",
+        }
+
+    def _cart_scenario(self, draws, record_id):
+        # 1..n distinct products, in catalogue order like the fixed scenarios
+        size = 1 + draws.below(len(self.products))
+        chosen = set()
+        while len(chosen) < size:
+            chosen.add(draws.below(len(self.products)))
+        return {"id": record_id, "items": [self.products[i] for i in sorted(chosen)]}
+
+    def _api_user(self, draws, record_id):
+        return {
+            "id": record_id,
+            "name": f"{draws.pick(FIRST_NAMES)} {draws.pick(LAST_NAMES)}",
+            "job": draws.pick(JOBS),
+            "expected_status": 201,
+        }
+
+    def write(self, kind, count, path, file_format="jsonl", workers=1):
+        """
+        Stream `count` records to a .jsonl or .csv file (readable by
+        test_data/providers.py).
+
+        With workers > 1 the index range is split into parts written by
+        separate processes and concatenated; records are derived from their
+        index, so the file is identical to a single-process run.
+
+        Returns:
+            The path written
+        """
+        if kind not in self._builders:
+            raise ValueError(f"Unknown data kind '{kind}' (choose from {', '.join(self.kinds)})")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        workers = max(1, min(workers, count // 50_000))
+
+        with open(path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as f:
+            if file_format == "csv":
+                csv.writer(f).writerow(FIELDS[kind])
+            if workers == 1:
+                _write_records(f, self.records(kind, count), kind, file_format)
+                return path
+
+        step = -(-count // workers)
+        parts = [(start, min(step, count - start), f"{path}.part{n}")
+                 for n, start in enumerate(range(0, count, step))]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_write_part, self.seed, self.products, kind, start, size, part_path, file_format)
+                for start, size, part_path in parts
+            ]
+            for future in futures:
+                future.result()
+
+        with open(path, "ab") as out:
+            for _, _, part_path in parts:
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+                os.remove(part_path)
+        return path
+
+
+def _write_records(f, records, kind, file_format):
+    if file_format == "csv":
+        writer = csv.writer(f)
+        fields = FIELDS[kind]
+        # Lists (cart items) are stored as "backpack|bike_light"
+        writer.writerows(
+            ["|".join(value) if isinstance(value, list) else value
+             for value in (record.get(field, "") for field in fields)]
+            for record in records
+        )
+    else:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        f.writelines(dumps(record) + "\n" for record in records)
+
+
+def _write_part(seed, products, kind, start, count, part_path, file_format):
+    """Write records [start, start + count) to their own file (runs in a worker process)"""
+    generator = SyntheticData(seed, products)
+    with open(part_path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as f:
+        _write_records(f, generator.records(kind, count, start), kind, file_format)
+
+
+class SyntheticDataManager(DataManager):
+    """
+    DataManager-style lookups over generated data, without generating it all.
+
+    Keys are record IDs (e.g. "customers-0000042"); each lookup rebuilds that
+    one record from the seed, so any of `size` records is available in O(1)
+    time and memory. Fixed data (products, sort options) still comes from
+    test_data.json.
+
+    Args:
+        seed: Generator seed
+        size: Number of records of each kind
+    """
+
+    def __init__(self, seed=0, size=1_000_000):
+        super().__init__()
+        self.generator = SyntheticData(seed)
+        self.size = size
+
+    def _lookup(self, kind, key):
+        index = key if isinstance(key, int) else self.generator.index_of(key)
+        if not 0 <= index < self.size:
+            raise KeyError(f"{kind} record {key!r} is outside 0..{self.size - 1}")
+        return self.generator.record(kind, index)
+
+    def get_user_credentials(self, user_type):
+        # Named users ('valid_user', ...) still come from test_data.json
+        if isinstance(user_type, str) and not user_type.startswith("login_users-"):
+            return super().get_user_credentials(user_type)
+        return self._lookup("login_users", user_type)
+
+    def get_customer(self, key):
+        return self._lookup("customers", key)
+
+    def get_cart_scenario(self, scenario_type):
+        if isinstance(scenario_type, str) and not scenario_type.startswith("cart_scenarios-"):
+            return super().get_cart_scenario(scenario_type)
+        return self._lookup("cart_scenarios", scenario_type)["items"]
+
+    def get_api_user(self, key):
+        return self._lookup("api_users", key)
+
+    def records(self, kind, count=None):
+        """Stream records of a kind (all `size` of them by default)"""
+        return self.generator.records(kind, self.size if count is None else count)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate synthetic test data")
+    parser.add_argument("kind", choices=sorted(FIELDS))
+    parser.add_argument("--count", type=int, default=10000, help="Number of records")
+    parser.add_argument("--seed", type=int, default=0, help="Same seed, same data")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--output", default=None,
+                        help="Output file (default: test_data/generated/<kind>.<format>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes used for large files (output is the same for any number)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    output = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"{args.kind}.{args.format}")
+    start = time.perf_counter()
+    SyntheticData(args.seed).write(args.kind, args.count, output, args.format, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {args.count} {args.kind} to {output} in {elapsed:.1f}s "
+          f"({args.count / elapsed if elapsed else 0:,.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
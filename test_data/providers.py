@@ -0,0 +1,331 @@
+# test_data/providers.py
+import codecs
+import csv
+import json
+import os
+import random
+import zlib
+from collections.abc import Mapping
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Characters that can still extend a JSON number
+NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class LazyRecord(Mapping):
+    """
+    A test-data record that is only read from disk when the test uses it.
+
+    Behaves like a read-only dict. pytest keeps one of these per generated
+    test, so only the ID and file offset stay in memory until the test runs;
+    conftest.py releases the loaded payload again after the test.
+    """
+
+    __slots__ = ("source", "locator", "record_id", "_data")
+
+    def __init__(self, source, locator, record_id):
+        self.source = source
+        self.locator = locator
+        self.record_id = record_id
+        self._data = None
+
+    def load(self):
+        if self._data is None:
+            self._data = self.source.read(self.locator)
+        return self._data
+
+    def release(self):
+        self._data = None
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __repr__(self):
+        return f"LazyRecord({self.record_id!r})"
+
+
+def select(entries, sample=None, seed=0, partition=None):
+    """
+    Filter a stream of (record_id, locator) entries.
+
+    Args:
+        entries: Iterable of (record_id, locator)
+        sample: Keep this many records (int >= 1, reservoir sampling) or this
+            fraction of them (float < 1); the same seed gives the same sample
+        seed: Random seed for sampling
+        partition: (index, count) with index from 1; keeps the records whose ID
+            hashes to that partition. Stable across processes and data growth.
+            Meant for separate processes (CI jobs, load generators); under
+            pytest-xdist every worker must collect the same tests, so use
+            --shard / -n there instead.
+    """
+    if partition:
+        index, count = partition
+        entries = (entry for entry in entries if zlib.crc32(entry[0].encode("utf-8")) % count == index - 1)
+
+    if sample is None:
+        yield from entries
+        return
+
+    rng = random.Random(seed)
+    if sample < 1:
+        yield from (entry for entry in entries if rng.random() < sample)
+        return
+
+    # Reservoir sampling keeps memory at `sample` entries however long the stream is
+    size = int(sample)
+    reservoir = []
+    for position, entry in enumerate(entries):
+        if position < size:
+            reservoir.append((position, entry))
+        else:
+            slot = rng.randint(0, position)
+            if slot < size:
+                reservoir[slot] = (position, entry)
+    yield from (entry for _, entry in sorted(reservoir, key=lambda item: item[0]))
+
+
+class DataSource:
+    """
+    Base class for streaming test-data files.
+
+    Subclasses implement index(), which scans the file once and yields
+    (record_id, locator) pairs without keeping the records, and read(), which
+    loads a single record from its locator (a byte offset and length).
+
+    Args:
+        path: File path, relative to test_data/ unless absolute
+        id_field: Field used as the record ID (default: position in the file,
+            or the key for a JSON object)
+    """
+
+    def __init__(self, path, id_field=None):
+        self.path = path if os.path.isabs(path) else os.path.join(BASE_DIR, path)
+        self.id_field = id_field
+
+    def index(self):
+        raise NotImplementedError
+
+    def read(self, locator):
+        raise NotImplementedError
+
+    def _read_bytes(self, locator):
+        offset, length = locator
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _record_id(self, record, position):
+        if self.id_field and isinstance(record, Mapping) and self.id_field in record:
+            return str(record[self.id_field])
+        return str(position)
+
+    def records(self, sample=None, seed=0, partition=None):
+        """Yield LazyRecords for the selected records"""
+        for record_id, locator in select(self.index(), sample, seed, partition):
+            yield LazyRecord(self, locator, record_id)
+
+    def params(self, sample=None, seed=0, partition=None):
+        """pytest.param list for @pytest.mark.parametrize, using the record IDs as test IDs"""
+        return [pytest.param(record, id=record.record_id) for record in self.records(sample, seed, partition)]
+
+    def __iter__(self):
+        """Stream every record, fully loaded, one at a time"""
+        for _, locator in self.index():
+            yield self.read(locator)
+
+
+class JsonLinesSource(DataSource):
+    """One JSON document per line (.jsonl / .ndjson)"""
+
+    def index(self):
+        with open(self.path, "rb") as f:
+            offset = 0
+            position = 0
+            for line in f:
+                if line.strip():
+                    # Only parse the line when the ID lives inside it
+                    record_id = self._record_id(json.loads(line), position) if self.id_field else str(position)
+                    yield record_id, (offset, len(line))
+                    position += 1
+                offset += len(line)
+
+    def read(self, locator):
+        return json.loads(self._read_bytes(locator))
+
+
+class CsvSource(DataSource):
+    """
+    CSV with a header row. Values are strings, as csv.DictReader gives them.
+    Quoted fields spanning several lines are not supported.
+    """
+
+    def __init__(self, path, id_field=None):
+        super().__init__(path, id_field)
+        self._fieldnames = None
+
+    @property
+    def fieldnames(self):
+        if self._fieldnames is None:
+            with open(self.path, "r", encoding="utf-8-sig", newline="") as f:
+                self._fieldnames = next(csv.reader(f))
+        return self._fieldnames
+
+    def _parse(self, line):
+        row = next(csv.reader([line.decode("utf-8")]))
+        return dict(zip(self.fieldnames, row))
+
+    def index(self):
+        with open(self.path, "rb") as f:
+            offset = len(f.readline())
+            position = 0
+            for line in f:
+                if line.strip():
+                    record_id = self._record_id(self._parse(line), position) if self.id_field else str(position)
+                    yield record_id, (offset, len(line))
+                    position += 1
+                offset += len(line)
+
+    def read(self, locator):
+        return self._parse(self._read_bytes(locator))
+
+
+class _JsonStream:
+    """Reads JSON values one at a time from a file, tracking their byte offsets"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        # Absolute byte offset of buffer[_cursor], advanced incrementally
+        self._cursor = 0
+        self._cursor_bytes = 0
+
+    def _byte_offset(self, index):
+        self._cursor_bytes += len(self.buffer[self._cursor:index].encode("utf-8"))
+        self._cursor = index
+        return self._cursor_bytes
+
+    def _fill(self):
+        # Drop the consumed text so memory stays around one chunk
+        self._byte_offset(self.pos)
+        self.buffer = self.buffer[self.pos:]
+        self.pos = self._cursor = 0
+        data = self.f.read(self.chunk_size)
+        self.eof = not data
+        self.buffer += self.text_decoder.decode(data, final=self.eof)
+        return not self.eof
+
+    def peek(self):
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def take(self):
+        char = self.peek()
+        self.pos += len(char)
+        return char
+
+    def _number_continues(self, value, end):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return all(char in NUMBER_CHARS for char in self.buffer[end:])
+
+    def value(self):
+        """Decode the next value; returns (value, byte_offset, byte_length)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+                # A number ending at the buffer edge may continue in the next chunk, and so may
+                # one followed only by the start of a fraction or exponent ("6." of "6.75e3")
+                if self.eof or (end < len(self.buffer) and not self._number_continues(value, end)):
+                    break
+            except ValueError:
+                if self.eof:
+                    raise
+            self._fill()
+        start = self._byte_offset(self.pos)
+        length = self._byte_offset(end) - start
+        self.pos = end
+        return value, start, length
+
+
+class JsonChunkedSource(DataSource):
+    """
+    A JSON file whose top level is an array of records, or an object mapping
+    record IDs to records (like ui/login_data.json).
+
+    The file is read in chunk_size blocks, one record at a time, so indexing
+    a large file never holds more than a chunk plus one record in memory.
+    """
+
+    def __init__(self, path, id_field=None, chunk_size=64 * 1024):
+        super().__init__(path, id_field)
+        self.chunk_size = chunk_size
+
+    def index(self):
+        with open(self.path, "rb") as f:
+            stream = _JsonStream(f, self.chunk_size)
+            opener = stream.take()
+            if opener not in ("[", "{"):
+                raise ValueError(f"{self.path}: expected a top-level JSON array or object")
+            closer = "]" if opener == "[" else "}"
+
+            position = 0
+            while True:
+                char = stream.peek()
+                if char == closer:
+                    return
+                if char == ",":
+                    stream.take()
+                    continue
+                if char == "":
+                    raise ValueError(f"{self.path}: unexpected end of file")
+
+                key = None
+                if opener == "{":
+                    key, _, _ = stream.value()
+                    if stream.take() != ":":
+                        raise ValueError(f"{self.path}: expected ':' after key {key!r}")
+                record, offset, length = stream.value()
+                yield key if key is not None else self._record_id(record, position), (offset, length)
+                position += 1
+
+    def read(self, locator):
+        return json.loads(self._read_bytes(locator))
+
+
+def open_source(path, id_field=None, **kwargs):
+    """
+    Pick a data source by file extension: .jsonl/.ndjson, .csv or .json.
+
+    Args:
+        path: File path, relative to test_data/ unless absolute
+        id_field: Field used as the record ID
+        **kwargs: Passed to the source (e.g. chunk_size for JSON)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return JsonLinesSource(path, id_field)
+    if extension == ".csv":
+        return CsvSource(path, id_field)
+    if extension == ".json":
+        return JsonChunkedSource(path, id_field, **kwargs)
+    raise ValueError(f"Unsupported test data format: {path}")
@@ -1,6 +1,6 @@
 # test_data/test_data.py
-import json
 import os
+from config import registry
 
 class DataManager:  # Changed from TestDataManager to DataManager
     def __init__(self):
@@ -8,8 +8,8 @@ class DataManager:  # Changed from TestDataManager to DataManager
         self.test_data = self._load_test_data()
 
     def _load_test_data(self):
-        with open(self.data_file, 'r') as f:
-            return json.load(f)
+        # Shared, read-only copy parsed once per process (cheap to construct per test)
+        return registry.load_json(self.data_file)
 
     def get_user_credentials(self, user_type):
         return self.test_data['users'].get(user_type, {})
@@ -22,6 +22,9 @@ class DataManager:  # Changed from TestDataManager to DataManager
 
     def get_sort_options(self):
         return self.test_data['test_scenarios']['sort_options']
+
+    def get_performance_budget(self, page):
+        return self.test_data.get('performance_budgets', {}).get(page, {})
     
     # test_data/test_data.py
     def get_data(self, category, key):
@@ -1,37 +1,27 @@
 # tests/ui_tests/test_data_driven_login.py
 import pytest
-from selenium import webdriver
 from page_objects.login_page import LoginPage
-from test_data.data_reader import DataReader
 
 class TestDataDrivenLogin:
     @pytest.fixture
-    def login_data(self):
-        """Fixture to load login test data"""
-        return DataReader.load_data("ui/login_data.json")
+    def driver(self, browser):
+        """The shared browser fixture (pooled or an isolated browser context when enabled)"""
+        return browser
     
-    @pytest.fixture
-    def driver(self):
-        """Fixture to set up and tear down the WebDriver"""
-        driver = webdriver.Chrome()
-        driver.maximize_window()
-        yield driver
-        driver.quit()
-    
-    @pytest.mark.parametrize("scenario", ["valid_login", "locked_user", "invalid_password", "empty_username", "empty_password"])
-    def test_login_scenarios(self, driver, login_data, scenario):
+    # One test per scenario in the data file, named after its key (valid_login, locked_user, ...)
+    @pytest.mark.data_source("ui/login_data.json", argname="data")
+    def test_login_scenarios(self, driver, env, data):
         """
         Test different login scenarios using data-driven approach.
         
         This single test function can handle multiple test cases based on the
         scenario parameter and corresponding test data.
+        The record is streamed from the data file when the test runs.
         """
-        # Get the test data for this scenario
-        data = login_data[scenario]
         
         # Set up login page
         login_page = LoginPage(driver)
-        login_page.navigate("https://www.saucedemo.com")
+        login_page.navigate(env.base_url)
         
         # Perform login with data from our test data file
         login_page.login(data["username"], data["password"])
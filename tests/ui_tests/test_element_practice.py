@@ -4,9 +4,9 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from page_objects.login_page import LoginPage
 
-def test_find_elements():
+def test_find_elements(env):
     driver = webdriver.Chrome()
-    driver.get("https://www.saucedemo.com")
+    driver.get(env.base_url)
     
     # Practice finding elements
     login_button = driver.find_element(By.ID, "login-button")
@@ -4,3 +4,14 @@ def test_product_displayed(inventory_page):
     """
     product_name = "Sauce Labs Backpack"
     assert inventory_page.is_product_displayed(product_name), f"{product_name} is not displayed on the inventory page."
+
+
+def test_inventory_locators_resolve(inventory_page):
+    """
+    Verify that the inventory page's declared locators all match elements
+    (the cart badge only appears once something is in the cart).
+    """
+    counts = inventory_page.locators.validate(inventory_page.driver)
+    missing = [name for name, count in counts.items() if count <= 0 and name != "CART_BADGE"]
+    assert not missing, f"Locators with no match on the inventory page: {missing}"
+    assert not inventory_page.locators.slow(), "Inventory page locators should use ID or CSS"
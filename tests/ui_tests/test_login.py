@@ -16,10 +16,10 @@ class TestLogin:
         yield driver
         driver.quit()
 
-    def test_valid_login(self, setup):
+    def test_valid_login(self, setup, env):
         driver = setup
         # Navigate to the website
-        driver.get("https://www.saucedemo.com/")
+        driver.get(env.base_url)
         
         # Find elements and login
         username = driver.find_element(By.ID, "user-name")
@@ -0,0 +1,25 @@
+import pytest
+from page_objects.inventory_page import InventoryPage
+
+
+class TestPagePerformance:
+    """Front-end performance budgets for the main shopping pages"""
+
+    def test_inventory_page_load_budget(self, logged_in_browser, env, test_data, perf_metrics):
+        """A full load of the inventory page stays within its LCP/load budget"""
+        logged_in_browser.get(f"{env.base_url.rstrip('/')}/inventory.html")
+        inventory_page = InventoryPage(logged_in_browser)
+        assert inventory_page.get_products(), "Inventory page rendered no products"
+
+        metrics = inventory_page.capture_performance("inventory")
+        assert metrics["kind"] == "navigation"
+        perf_metrics.assert_budget("inventory", **test_data.get_performance_budget("inventory"))
+
+    def test_cart_and_checkout_transition_budgets(self, inventory_page, test_data, perf_metrics):
+        """Opening the cart and starting checkout stay within their budgets"""
+        inventory_page.add_item_to_cart(test_data.get_product_details("backpack")["name"])
+        cart_page = inventory_page.go_to_cart()
+        perf_metrics.assert_budget("cart", **test_data.get_performance_budget("cart"))
+
+        cart_page.proceed_to_checkout()
+        perf_metrics.assert_budget("checkout_step_one", **test_data.get_performance_budget("checkout_step_one"))
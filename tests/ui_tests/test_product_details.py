@@ -6,7 +6,7 @@ from page_objects.inventory_page import InventoryPage
 class TestProductDetails:
     """Tests for the product details functionality"""
     
-    def test_view_product_details(self, browser, env, test_data):
+    def test_view_product_details(self, browser, env, test_data, session_cache):
         """
         Test that a user can view product details.
         
@@ -16,13 +16,10 @@ class TestProductDetails:
         3. Product details page loads with correct information
         """
         # --- ARRANGE ---
-        # Start by navigating to the site and logging in
-        login_page = LoginPage(browser)
-        login_page.navigate(env.base_url)
-        
+        # Start by logging in (reuses a cached session after the first test)
         # Get user credentials from test data
         user = test_data.get_user_credentials('valid_user')
-        login_page.login(user['username'], user['password'])
+        session_cache.login(browser, env.base_url, user['username'], user['password'])
         
         # --- ACT ---
         # Once logged in, we should be on the inventory page
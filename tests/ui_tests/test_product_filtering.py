@@ -1,26 +1,14 @@
 # tests/ui_tests/test_product_filtering.py
 
 import pytest
-from selenium.webdriver.common.by import By
-from page_objects.inventory_page import InventoryPage
 
+@pytest.mark.start_state("inventory")
 class TestProductFiltering:
     """
     This class demonstrates equivalence partitioning and boundary value analysis 
     for product filtering functionality.
     """
     
-    @pytest.fixture
-    def inventory_page(self, setup):
-        """Initialize the inventory page after login"""
-        driver = setup
-        driver.get("https://www.saucedemo.com/")
-        # Log in with standard user
-        from page_objects.login_page import LoginPage
-        login_page = LoginPage(driver)
-        login_page.login("standard_user", "secret_sauce")
-        return InventoryPage(driver)
-    
     # Equivalence Partitioning for product filtering
     @pytest.mark.parametrize("sort_option,expected_first_product", [
         # Partition 1: Alphabetical sorting (A to Z)
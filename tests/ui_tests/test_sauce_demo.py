@@ -9,13 +9,9 @@ from selenium.webdriver.support import expected_conditions as EC
 from page_objects.login_page import LoginPage
 from page_objects.inventory_page import InventoryPage
 from test_data.test_data import DataManager
-from config.environment import Environment  # Add this import
+from utils.artifacts import artifacts
 
 class TestSauceDemo:
-    @pytest.fixture(scope="session")
-    def env(self):
-        return Environment()
-
     @pytest.fixture
     def driver(self, env, request):  # Add request parameter
         browser_options = env.get_browser_options()
@@ -26,18 +22,10 @@ class TestSauceDemo:
         
         # Take screenshot on failure using request instead of pytest.current_test
         if request.node.rep_call.failed if hasattr(request.node, "rep_call") else False:
-            screenshot_path = os.path.join(
-                env.get_screenshot_dir(), 
-                f"{request.node.name}.png"
-            )
-            driver.save_screenshot(screenshot_path)
+            artifacts.capture(driver, "failure")
         
         driver.quit()
 
-    @pytest.fixture
-    def test_data(self):
-        return DataManager()
-
     def test_valid_login(self, driver, env, test_data):
         login_page = LoginPage(driver)
         login_page.navigate(env.base_url)  # Pass base_url here
@@ -56,12 +44,10 @@ class TestSauceDemo:
         login_page.login(user['username'], user['password'])
         assert "locked out" in login_page.get_error_message()
 
-    def test_add_multiple_items_to_cart(self, driver, env, test_data):  # Add env parameter
-        # Login first
-        login_page = LoginPage(driver)
-        login_page.navigate(env.base_url)  # Pass base_url here
+    def test_add_multiple_items_to_cart(self, driver, env, test_data, session_cache):  # Add env parameter
+        # Login first (reuses a cached session after the first test)
         user = test_data.get_user_credentials('valid_user')
-        login_page.login(user['username'], user['password'])
+        session_cache.login(driver, env.base_url, user['username'], user['password'])
         
         # Add items to cart
         inventory_page = InventoryPage(driver)
@@ -74,24 +60,20 @@ class TestSauceDemo:
         assert inventory_page.get_cart_count() == str(len(cart_items))
 
     @pytest.mark.parametrize("sort_option", DataManager().get_sort_options())
-    def test_sort_products(self, driver, env, test_data, sort_option):  # Add env parameter
-        # Login first
-        login_page = LoginPage(driver)
-        login_page.navigate(env.base_url)  # Pass base_url here
+    def test_sort_products(self, driver, env, test_data, sort_option, session_cache):  # Add env parameter
+        # Login first (reuses a cached session after the first test)
         user = test_data.get_user_credentials('valid_user')
-        login_page.login(user['username'], user['password'])
+        session_cache.login(driver, env.base_url, user['username'], user['password'])
         
         # Test sorting
         inventory_page = InventoryPage(driver)
         inventory_page.sort_products(sort_option)
 
-    def test_logout(self, browser, env, test_data):  # If this is a class method, keep self
+    def test_logout(self, browser, env, test_data, session_cache):  # If this is a class method, keep self
         """Test logout functionality"""
-        # Login first
-        login_page = LoginPage(browser)
-        login_page.navigate(env.base_url)
+        # Login first (reuses a cached session after the first test)
         user = test_data.get_user_credentials('valid_user')
-        login_page.login(user['username'], user['password'])
+        session_cache.login(browser, env.base_url, user['username'], user['password'])
     
         # Verify we're logged in
         WebDriverWait(browser, 10).until(
@@ -123,7 +105,7 @@ class TestSauceDemo:
         try:
            # Check URL first
            WebDriverWait(browser, 10).until(
-              lambda driver: "saucedemo.com" in driver.current_url and 
+              lambda driver: driver.current_url.startswith(env.base_url) and 
                           ("index.html" in driver.current_url or 
                            driver.current_url.endswith("/"))
             )
@@ -137,28 +119,22 @@ class TestSauceDemo:
            print("Login button found, logout successful")
         except Exception as e:
             print(f"Logout verification failed: {e}")
-            browser.save_screenshot("logout_failure.png")
+            artifacts.capture(browser, "logout_failure")
             raise
 
-    def test_update_cart_quantity(self, driver, env, test_data):
-        """Test updating item quantity in cart"""
-        # Login first
-        login_page = LoginPage(driver)
-        login_page.navigate(env.base_url)
-        login_page.login("standard_user", "secret_sauce")
-        
-        # Add item to cart and update quantity
+    def test_cart_badge_counts_seeded_and_added_items(self, driver, env, test_data, session_cache, cart_state):
+        """Cart badge counts an item already in the cart plus one added through the UI"""
+        # Login first (reuses a cached session after the first test)
+        session_cache.login(driver, env.base_url, "standard_user", "secret_sauce")
+
+        # Start with the backpack in the cart, seeded directly, on the inventory page
+        cart_state.seed(driver, test_data.get_cart_scenario('single_item'), page="inventory.html")
+
+        # Add a second item through the UI
         inventory_page = InventoryPage(driver)
-        inventory_page.add_item_to_cart("Sauce Labs Backpack")
-        inventory_page.add_item_to_cart("Sauce Labs Bike Light")
-        
+        inventory_page.add_item_to_cart(test_data.get_product_details('bike_light')['name'])
+
         WebDriverWait(driver, 5).until(
         EC.text_to_be_present_in_element((By.CLASS_NAME, "shopping_cart_badge"), "2")
         )
-        
-        cart_badge = driver.find_element(By.CLASS_NAME, "shopping_cart_badge")
-        print(f"Cart badge shows: {cart_badge.text}")
-        assert cart_badge.text == "2"
-
-        # echo "# Adding a comment to test hook" >> tests/ui_tests/test_sauce_demo.py
-        # echo "practicing git worflow"
+        assert inventory_page.get_cart_count() == "2"
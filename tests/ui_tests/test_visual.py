@@ -0,0 +1,20 @@
+import pytest
+
+
+# Opt-in with --visual: baselines are per environment and must be committed first.
+# visual comes first so the skip happens before a browser is started.
+class TestVisual:
+    """Cheap perceptual checks of the main shopping pages against stored baselines"""
+
+    def test_inventory_page_matches_baseline(self, visual, inventory_page):
+        """The inventory grid renders like the recorded baseline"""
+        assert inventory_page.get_products(), "Inventory page rendered no products"
+        inventory_page.wait_for_dom_stable()
+        visual("inventory")
+
+    def test_cart_page_matches_baseline(self, visual, inventory_page, test_data):
+        """A cart holding one product renders like the recorded baseline"""
+        inventory_page.add_item_to_cart(test_data.get_product_details("backpack")["name"])
+        cart_page = inventory_page.go_to_cart()
+        cart_page.wait_for_dom_stable()
+        visual("cart_one_item")
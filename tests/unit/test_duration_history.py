@@ -0,0 +1,90 @@
+# tests/unit/test_duration_history.py
+
+import sqlite3
+import pytest
+from utils.duration_history import DurationHistory
+
+
+@pytest.fixture
+def db(tmp_path):
+    return str(tmp_path / "history.db")
+
+
+def record_run(path, durations, env="dev", outcome="passed", **options):
+    """Store one run of {nodeid: call seconds} and return the regressions it was flagged with"""
+    history = DurationHistory(path, env, **options)
+    for nodeid, seconds in durations.items():
+        history.add(nodeid, "setup", 0.01, "passed")
+        history.add(nodeid, "call", seconds, outcome)
+        history.add(nodeid, "teardown", 0.01, "passed")
+    return history.save()
+
+
+def regressed(path, baseline, now, **options):
+    for seconds in baseline:
+        record_run(path, {"test_a": seconds}, **options)
+    return [r.nodeid for r in record_run(path, {"test_a": now}, **options)]
+
+
+class TestDurationHistory:
+    """Regression detection against each test's recent passing runs"""
+
+    def test_baseline_is_newest_passing_runs_of_the_env(self, db):
+        for seconds in (1.0, 2.0, 3.0):
+            record_run(db, {"test_a": seconds})
+        record_run(db, {"test_a": 9.0}, outcome="failed")
+        record_run(db, {"test_a": 7.0}, env="staging")
+
+        history = DurationHistory(db, "dev", baseline_runs=2)
+        with history._connect() as connection:
+            assert history.baseline(connection, "test_a") == [3.0, 2.0]
+        connection.close()
+
+    def test_clear_slowdown_is_flagged(self, db):
+        for seconds in (1.0, 1.1, 0.9, 1.0):
+            record_run(db, {"test_a": seconds})
+        regression, = record_run(db, {"test_a": 2.0})
+
+        assert regression.nodeid == "test_a"
+        assert regression.samples == 4
+        assert regression.baseline_mean == pytest.approx(1.0)
+        assert regression.slowdown == pytest.approx(2.0)
+        assert regression.z_score >= 3.0
+
+    def test_within_noise_is_not_flagged(self, db):
+        assert regressed(db, [1.0, 1.3, 0.8, 1.2], 1.4) == []
+
+    def test_insufficient_history_is_not_judged(self, db):
+        assert regressed(db, [1.0, 1.0], 5.0) == []
+        assert regressed(db + "2", [1.0, 1.0], 5.0, min_samples=2) == ["test_a"]
+
+    def test_min_delta_ignores_tiny_slowdowns(self, db):
+        # 40ms over a 20ms test is a big z-score but still timer noise
+        assert regressed(db, [0.02, 0.02, 0.02], 0.06) == []
+        assert regressed(db + "2", [0.02, 0.02, 0.02], 0.06, min_delta=0.01) == ["test_a"]
+
+    def test_noise_floor_for_steady_tests(self, db):
+        # Zero spread: the floor is 5% of the 2s mean (0.1s), so +0.25s is z = 2.5
+        assert regressed(db, [2.0, 2.0, 2.0], 2.25) == []
+        assert regressed(db + "2", [2.0, 2.0, 2.0], 2.35) == ["test_a"]
+
+    def test_threshold(self, db):
+        assert regressed(db, [2.0, 2.0, 2.0], 2.25, threshold=2.0) == ["test_a"]
+
+    def test_failed_runs_are_not_flagged(self, db):
+        for seconds in (1.0, 1.0, 1.0):
+            record_run(db, {"test_a": seconds})
+        assert record_run(db, {"test_a": 10.0}, outcome="failed") == []
+
+    def test_old_runs_are_pruned_per_env(self, db):
+        for i in range(5):
+            record_run(db, {"test_a": float(i)}, keep_runs=3)
+        record_run(db, {"test_a": 1.0}, env="staging", keep_runs=3)
+
+        connection = sqlite3.connect(db)
+        runs = connection.execute("SELECT env, COUNT(*) FROM runs GROUP BY env ORDER BY env").fetchall()
+        kept = connection.execute(
+            "SELECT call_s FROM durations WHERE env = 'dev' ORDER BY run_id").fetchall()
+        connection.close()
+        assert runs == [("dev", 3), ("staging", 1)]
+        assert [row[0] for row in kept] == [2.0, 3.0, 4.0]
@@ -0,0 +1,69 @@
+# tests/unit/test_durations.py
+
+import json
+import pytest
+from utils.durations import DurationStore, parse_shard, partition, longest_first
+
+
+class Item:
+    """Stand-in for a collected pytest item; partition() only needs the node ID"""
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "durations.json"
+    # Uneven durations, and some tests that were never timed
+    path.write_text(json.dumps({f"test_{i}": float(i % 7 + 1) for i in range(0, 40, 2)}))
+    return DurationStore(str(path))
+
+
+class TestDurations:
+    """Shard parsing and duration-balanced splitting"""
+
+    @pytest.mark.parametrize("value,expected", [("1/1", (1, 1)), ("2/4", (2, 4)), ("4/4", (4, 4))])
+    def test_parse_shard(self, value, expected):
+        assert parse_shard(value) == expected
+
+    @pytest.mark.parametrize("value", ["0/2", "3/2", "1/0", "2", "a/b", None])
+    def test_parse_shard_rejects_bad_values(self, value):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 7])
+    def test_shards_are_disjoint_and_complete(self, store, count):
+        items = [Item(f"test_{i}") for i in range(40)]
+        groups = partition(items, store, count)
+
+        assert len(groups) == count
+        selected = [item.nodeid for group in groups for item in group]
+        assert sorted(selected) == sorted(item.nodeid for item in items), "Every test runs exactly once"
+
+    def test_every_shard_computes_the_same_split(self, store):
+        # Each CI shard collects its own Item objects; the split must only depend on the node IDs
+        first = partition([Item(f"test_{i}") for i in range(40)], store, 3)
+        second = partition([Item(f"test_{i}") for i in range(40)], store, 3)
+        assert [[item.nodeid for item in group] for group in first] == \
+               [[item.nodeid for item in group] for group in second]
+
+    def test_shards_keep_collection_order(self, store):
+        items = [Item(f"test_{i}") for i in range(40)]
+        for group in partition(items, store, 4):
+            positions = [items.index(item) for item in group]
+            assert positions == sorted(positions)
+
+    def test_longest_first(self, store):
+        ordered = [item.nodeid for item in longest_first([Item("test_0"), Item("test_4"), Item("test_12")], store)]
+        assert ordered == ["test_12", "test_4", "test_0"]
+
+    def test_save_blends_with_recorded_value(self, store):
+        store.add("test_2", 1.0)
+        store.add("test_2", 1.0)
+        store.add("test_new", 5.0)
+        store.save()
+
+        reloaded = DurationStore(store.path)
+        assert reloaded.get("test_2") == pytest.approx(0.5 * 2.0 + 0.5 * 3.0)
+        assert reloaded.get("test_new") == 5.0
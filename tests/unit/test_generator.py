@@ -0,0 +1,45 @@
+# tests/unit/test_generator.py
+
+import pytest
+from test_data.generator import SyntheticData
+from test_data.providers import open_source
+
+PRODUCTS = ("backpack", "bike_light", "onesie")
+
+
+class TestGenerator:
+    """Generated records depend only on the seed, the kind and the record index"""
+
+    @pytest.mark.parametrize("kind", ["login_users", "customers", "cart_scenarios", "api_users"])
+    def test_records_are_repeatable(self, kind):
+        first = list(SyntheticData(seed=7, products=PRODUCTS).records(kind, 200))
+        second = list(SyntheticData(seed=7, products=PRODUCTS).records(kind, 200))
+        assert first == second
+        assert first != list(SyntheticData(seed=8, products=PRODUCTS).records(kind, 200))
+
+    def test_record_matches_its_position_in_the_stream(self):
+        generator = SyntheticData(seed=1, products=PRODUCTS)
+        stream = list(generator.records("customers", 50))
+        assert [generator.record("customers", i) for i in (0, 17, 49)] == [stream[0], stream[17], stream[49]]
+        assert list(generator.records("customers", 10, start=20)) == stream[20:30]
+
+    def test_cart_scenarios_use_known_products(self):
+        for record in SyntheticData(seed=3, products=PRODUCTS).records("cart_scenarios", 100):
+            assert record["items"] and set(record["items"]) <= set(PRODUCTS)
+            assert record["items"] == sorted(record["items"], key=PRODUCTS.index)
+
+    @pytest.mark.parametrize("file_format", ["jsonl", "csv"])
+    def test_file_is_the_same_for_any_worker_count(self, tmp_path, file_format):
+        # Below 50,000 records per worker write() stays in one process, so use enough for two
+        generator = SyntheticData(seed=5, products=PRODUCTS)
+        single = generator.write("api_users", 100_000, str(tmp_path / f"one.{file_format}"), file_format, workers=1)
+        parallel = generator.write("api_users", 100_000, str(tmp_path / f"two.{file_format}"), file_format,
+                                   workers=2)
+
+        with open(single, "rb") as a, open(parallel, "rb") as b:
+            assert a.read() == b.read()
+
+    def test_written_file_reads_back(self, tmp_path):
+        generator = SyntheticData(seed=2, products=PRODUCTS)
+        path = generator.write("login_users", 30, str(tmp_path / "users.jsonl"))
+        assert list(open_source(path)) == list(generator.records("login_users", 30))
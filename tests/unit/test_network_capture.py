@@ -0,0 +1,126 @@
+# tests/unit/test_network_capture.py
+
+import pytest
+from utils.network_capture import NetworkCapture
+
+TIMING = {
+    "requestTime": 100.0,
+    "dnsStart": 0.0, "dnsEnd": 5.0,
+    "connectStart": 5.0, "connectEnd": 20.0,
+    "sslStart": 10.0, "sslEnd": 20.0,
+    "sendStart": 20.0, "sendEnd": 21.0,
+    "receiveHeadersEnd": 50.0,
+}
+
+
+def sent(request_id, url, timestamp=100.0, wall_time=1700000000.0, kind="Document"):
+    return {"method": "Network.requestWillBeSent", "params": {
+        "requestId": request_id, "timestamp": timestamp, "wallTime": wall_time, "type": kind,
+        "request": {"method": "GET", "url": url},
+    }}
+
+
+def response(request_id, status=200, timing=None, **flags):
+    return {"method": "Network.responseReceived", "params": {
+        "requestId": request_id,
+        "response": dict({"status": status, "mimeType": "text/html", "timing": timing}, **flags),
+    }}
+
+
+def finished(request_id, timestamp, size):
+    return {"method": "Network.loadingFinished", "params": {
+        "requestId": request_id, "timestamp": timestamp, "encodedDataLength": size,
+    }}
+
+
+def failed(request_id, timestamp, error):
+    return {"method": "Network.loadingFailed", "params": {
+        "requestId": request_id, "timestamp": timestamp, "errorText": error,
+    }}
+
+
+def entries(events):
+    return NetworkCapture.build_har(events)["log"]["entries"]
+
+
+class TestNetworkCapture:
+    """HAR entries and summaries built from raw CDP Network events"""
+
+    def test_timing_spans(self):
+        entry, = entries([sent("1", "https://example.test/"), response("1", timing=TIMING),
+                          finished("1", 100.08, 2048)])
+
+        assert entry["time"] == pytest.approx(80.0)
+        assert entry["timings"] == {
+            "dns": 5.0, "connect": 15.0, "ssl": 10.0, "send": 1.0, "wait": 29.0,
+            "receive": pytest.approx(30.0),
+        }
+        assert entry["response"]["bodySize"] == 2048
+        assert entry["startedDateTime"].startswith("2023-11-14T22:13:20")
+
+    def test_phases_that_did_not_happen(self):
+        # A reused connection reports -1 for DNS, connect and TLS
+        timing = dict(TIMING, dnsStart=-1, dnsEnd=-1, connectStart=-1, connectEnd=-1, sslStart=-1, sslEnd=-1)
+        entry, = entries([sent("1", "https://example.test/"), response("1", timing=timing),
+                          finished("1", 100.08, 10)])
+        assert (entry["timings"]["dns"], entry["timings"]["connect"], entry["timings"]["ssl"]) == (-1, -1, -1)
+
+    @pytest.mark.parametrize("extra_events,flags,status,expected", [
+        ([{"method": "Network.requestServedFromCache", "params": {"requestId": "1"}}], {}, 200, "memory"),
+        ([], {"fromDiskCache": True}, 200, "disk"),
+        ([], {"fromServiceWorker": True}, 200, "service_worker"),
+        ([], {}, 304, "revalidated"),
+        ([], {}, 200, "network"),
+    ])
+    def test_cache_status(self, extra_events, flags, status, expected):
+        events = [sent("1", "https://example.test/app.js", kind="Script")] + extra_events
+        events += [response("1", status=status, timing=TIMING, **flags), finished("1", 100.01, 0)]
+        entry, = entries(events)
+        assert entry["cache"]["status"] == expected
+
+    def test_redirect_keeps_the_final_hop(self):
+        # Chrome reuses the request id for every hop of a redirect chain
+        events = [
+            sent("7", "http://example.test/", timestamp=100.0),
+            sent("7", "https://example.test/inventory.html", timestamp=100.02),
+            response("7", timing=TIMING),
+            finished("7", 100.1, 512),
+        ]
+        entry, = entries(events)
+        assert entry["request"]["url"] == "https://example.test/inventory.html"
+        assert entry["time"] == pytest.approx(80.0)
+
+    def test_failed_request(self):
+        entry, = entries([sent("3", "https://example.test/missing.png", kind="Image"),
+                          failed("3", 100.5, "net::ERR_CONNECTION_REFUSED")])
+        assert entry["_error"] == "net::ERR_CONNECTION_REFUSED"
+        assert entry["response"]["status"] == 0
+        assert entry["response"]["bodySize"] == 0
+        assert entry["time"] == pytest.approx(500.0)
+
+    def test_ignores_unrelated_and_orphan_events(self):
+        events = [
+            {"method": "Page.loadEventFired", "params": {"timestamp": 1}},
+            response("unknown", timing=TIMING),
+            finished("unknown", 101.0, 99),
+        ]
+        assert entries(events) == []
+
+    def test_summarize(self):
+        events = [
+            sent("1", "https://example.test/", timestamp=100.0, wall_time=1.0),
+            response("1", timing=TIMING), finished("1", 100.3, 4096),
+            sent("2", "https://example.test/app.js", timestamp=100.1, wall_time=2.0, kind="Script"),
+            response("2", status=304, timing=TIMING), finished("2", 100.15, 100),
+            sent("3", "https://example.test/font.woff", timestamp=100.1, wall_time=3.0, kind="Font"),
+            failed("3", 100.2, "net::ERR_ABORTED"),
+        ]
+        summary = NetworkCapture.summarize(NetworkCapture.build_har(events))
+
+        assert summary["requests"] == 3
+        assert summary["transfer_bytes"] == 4196
+        assert summary["cached"] == 1
+        assert summary["failed"] == 1
+        assert list(summary["bytes_by_type"]) == ["Document", "Script", "Font"]
+        assert [url for url, _ in summary["slowest"]][0] == "https://example.test/"
+        assert "3 requests" in NetworkCapture.format(summary, "x.har.json")
@@ -0,0 +1,87 @@
+# tests/unit/test_providers.py
+
+import json
+import pytest
+from test_data.providers import CsvSource, JsonChunkedSource, JsonLinesSource, open_source, select
+
+RECORDS = [
+    {"username": "standard_user", "password": "secret_sauce", "note": "plain"},
+    {"username": "ünïcödé_user", "password": "pässwörd", "note": "multi-byte ✓ characters"},
+    {"username": "locked_out_user", "password": "secret_sauce", "note": "nested", "tags": [1, 2.5, {"a": None}]},
+    {"username": "", "password": "", "note": "escaped \"quotes\", commas, [brackets] and {braces}"},
+]
+
+
+class TestProviders:
+    """Streaming data sources index records once and read each one back by offset"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 64 * 1024])
+    def test_json_array_across_chunk_boundaries(self, tmp_path, chunk_size):
+        path = tmp_path / "records.json"
+        path.write_text(json.dumps(RECORDS, indent=2, ensure_ascii=False), encoding="utf-8")
+        source = JsonChunkedSource(str(path), chunk_size=chunk_size)
+
+        assert [record_id for record_id, _ in source.index()] == ["0", "1", "2", "3"]
+        assert list(source) == RECORDS
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+    def test_json_object_uses_keys_as_ids(self, tmp_path, chunk_size):
+        data = {f"case_{i}": record for i, record in enumerate(RECORDS)}
+        path = tmp_path / "records.json"
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        source = JsonChunkedSource(str(path), chunk_size=chunk_size)
+
+        assert dict((record_id, source.read(locator)) for record_id, locator in source.index()) == data
+
+    @pytest.mark.parametrize("chunk_size", [1, 3])
+    def test_json_numbers_split_by_a_chunk(self, tmp_path, chunk_size):
+        path = tmp_path / "numbers.json"
+        path.write_text("[12345, 6.75e3, -0.5]")
+        assert list(JsonChunkedSource(str(path), chunk_size=chunk_size)) == [12345, 6750.0, -0.5]
+
+    def test_json_truncated_file(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text('[{"a": 1}, {"b": ')
+        with pytest.raises(ValueError):
+            list(JsonChunkedSource(str(path), chunk_size=4).index())
+
+    def test_json_lines(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        path.write_text("\n".join(json.dumps(record, ensure_ascii=False) for record in RECORDS) + "\n\n",
+                        encoding="utf-8")
+        source = open_source(str(path), id_field="username")
+
+        assert isinstance(source, JsonLinesSource)
+        assert [record_id for record_id, _ in source.index()] == [record["username"] for record in RECORDS]
+        assert list(source) == RECORDS
+
+    def test_csv(self, tmp_path):
+        path = tmp_path / "records.csv"
+        path.write_text('username,password,note\nstandard_user,secret_sauce,plain\n'
+                        'ünïcödé_user,pässwörd,"with, comma"\n', encoding="utf-8")
+        source = open_source(str(path))
+
+        assert isinstance(source, CsvSource)
+        assert list(source) == [
+            {"username": "standard_user", "password": "secret_sauce", "note": "plain"},
+            {"username": "ünïcödé_user", "password": "pässwörd", "note": "with, comma"},
+        ]
+
+    def test_lazy_records_load_on_access(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        path.write_text("\n".join(json.dumps(record) for record in RECORDS))
+        records = list(open_source(str(path)).records())
+
+        assert records[2]["username"] == "locked_out_user"
+        records[2].release()
+        assert dict(records[2]) == RECORDS[2]
+
+    def test_sampling_is_repeatable(self):
+        entries = [(str(i), (i, 1)) for i in range(1000)]
+        assert list(select(entries, sample=25, seed=3)) == list(select(entries, sample=25, seed=3))
+        assert len(list(select(entries, sample=25, seed=3))) == 25
+
+    def test_partitions_are_disjoint_and_complete(self):
+        entries = [(f"record-{i}", (i, 1)) for i in range(500)]
+        parts = [list(select(entries, partition=(index, 3))) for index in (1, 2, 3)]
+        assert sorted(entry for part in parts for entry in part) == sorted(entries)
@@ -0,0 +1,100 @@
+# tests/unit/test_results_store.py
+
+import xml.etree.ElementTree as ET
+import pytest
+import render_reports
+from utils.results_store import ResultsWriter, clear_results, outcome_of, read_results, results_file
+
+SAMPLE = [
+    {"nodeid": "tests/ui_tests/test_login.py::TestLogin::test_valid_login", "outcome": "passed",
+     "duration": 1.5, "sections": [["Captured stdout call", "logged in"]], "properties": {}},
+    {"nodeid": "tests/ui_tests/test_cart.py::test_badge", "outcome": "failed", "duration": 2.0,
+     "longrepr": "def test_badge():\n>   assert '1' == '2'\nE   AssertionError: <badge> & \"count\"",
+     "sections": [], "properties": {"artifacts": ["reports/screenshots/ab/cd.jpeg"]}},
+    {"nodeid": "api_tests/test_api.py::test_skipped", "outcome": "skipped", "duration": 0.0,
+     "longrepr": "Skipped: no recording", "sections": [], "properties": {}},
+    {"nodeid": "api_tests/test_api.py::test_setup_error", "outcome": "error", "duration": 0.1,
+     "longrepr": "fixture 'api_client' failed", "sections": [], "properties": {}},
+]
+
+
+class Report:
+    """Stand-in for a pytest TestReport phase"""
+
+    def __init__(self, outcome, wasxfail=None):
+        self.failed = outcome == "failed"
+        self.skipped = outcome == "skipped"
+        if wasxfail is not None:
+            self.wasxfail = wasxfail
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    for worker, records in (("gw0", SAMPLE[:2]), ("gw1", SAMPLE[2:])):
+        writer = ResultsWriter(results_file(str(tmp_path), "1/2", worker))
+        for record in records:
+            writer.write(record)
+        writer.close()
+    return str(tmp_path)
+
+
+class TestResultsStore:
+    """Per-worker results files and the reports rendered from them"""
+
+    @pytest.mark.parametrize("phases,expected", [
+        ({"setup": Report("passed"), "call": Report("passed"), "teardown": Report("passed")}, "passed"),
+        ({"setup": Report("passed"), "call": Report("failed"), "teardown": Report("passed")}, "failed"),
+        ({"setup": Report("failed"), "teardown": Report("passed")}, "error"),
+        ({"setup": Report("passed"), "call": Report("passed"), "teardown": Report("failed")}, "error"),
+        ({"setup": Report("skipped"), "teardown": Report("passed")}, "skipped"),
+        ({"setup": Report("passed"), "call": Report("skipped", ""), "teardown": Report("passed")}, "xfailed"),
+        ({"setup": Report("passed"), "call": Report("passed", ""), "teardown": Report("passed")}, "xpassed"),
+    ])
+    def test_outcome_of(self, phases, expected):
+        assert outcome_of(phases) == expected
+
+    def test_workers_write_separate_files_that_merge(self, results_dir):
+        assert results_file(results_dir, "1/2", "gw0") != results_file(results_dir, "1/2", "gw1")
+        assert sorted(record["nodeid"] for record in read_results([results_dir])) == \
+               sorted(record["nodeid"] for record in SAMPLE)
+
+    def test_clear_results_only_touches_its_shard(self, results_dir):
+        other = ResultsWriter(results_file(results_dir, "2/2", "gw0"))
+        other.write(SAMPLE[0])
+        other.close()
+
+        clear_results(results_dir, "1/2")
+        assert [record["nodeid"] for record in read_results([results_dir])] == [SAMPLE[0]["nodeid"]]
+
+    def test_subdirectories_become_groups(self, tmp_path):
+        for name in ("Chrome_Windows10", "iPhone13"):
+            writer = ResultsWriter(results_file(str(tmp_path / name)))
+            writer.write(SAMPLE[0])
+            writer.close()
+        assert sorted(record["group"] for record in read_results([str(tmp_path)])) == ["Chrome_Windows10", "iPhone13"]
+
+    def test_junit_from_results(self, results_dir, tmp_path):
+        output = str(tmp_path / "junit.xml")
+        render_reports.render_junit([results_dir], output, render_reports.summarize([results_dir]))
+
+        suite = ET.parse(output).getroot().find("testsuite")
+        assert (suite.get("tests"), suite.get("failures"), suite.get("errors"), suite.get("skipped")) == \
+               ("4", "1", "1", "1")
+        cases = {case.get("name"): case for case in suite.iter("testcase")}
+        assert cases["test_valid_login"].get("classname") == "tests.ui_tests.test_login.TestLogin"
+        assert cases["test_valid_login"].find("system-out").text == "logged in"
+        failure = cases["test_badge"].find("failure")
+        assert failure.get("message") == "E   AssertionError: <badge> & \"count\""
+        assert cases["test_skipped"].find("skipped") is not None
+        assert cases["test_setup_error"].find("error") is not None
+
+    def test_html_from_results(self, results_dir, tmp_path):
+        output = str(tmp_path / "report.html")
+        render_reports.render_html([results_dir], output, render_reports.summarize([results_dir]))
+
+        with open(output, encoding="utf-8") as f:
+            html = f.read()
+        assert "4 tests" in html
+        assert "&lt;badge&gt; &amp;" in html, "Tracebacks are escaped"
+        assert "reports/screenshots/ab/cd.jpeg" in html
+        assert html.index("<h2>Problems</h2>") < html.index("<h2>All tests</h2>")
@@ -0,0 +1,157 @@
+# utils/api_client.py
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+# Connect time of the request currently running on this thread
+_connect_timing = threading.local()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = getattr(_connect_timing, "seconds", 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # Includes the TLS handshake
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = getattr(_connect_timing, "seconds", 0.0) + time.perf_counter() - start
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report how long connecting took"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class ApiClient:
+    """
+    Keep-alive HTTP client for API tests.
+
+    Wraps a requests.Session so connections are pooled and reused across
+    tests, retries idempotent requests on transient errors, and records a
+    latency breakdown for every request.
+
+    Args:
+        base_url: Prefix for every request path (e.g. https://reqres.in/api)
+        pool_size: Connections kept open per host
+        retries: Retry attempts for connection errors and 429/5xx responses
+        backoff: Exponential backoff factor between retries, in seconds
+        timeout: Default (connect, read) timeout in seconds
+        record_timings: Keep every timing for drain_timings(); turn off for
+            long-running load tests (each response still carries .timing)
+    """
+
+    def __init__(self, base_url, pool_size=10, retries=3, backoff=0.3, timeout=(3.05, 10),
+                 record_timings=True):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.record_timings = record_timings
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._timings = []
+        self._lock = threading.Lock()
+
+    def url(self, path):
+        """Build a full URL from a path such as "/users/2" """
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method, path, **kwargs):
+        """Send a request and record its connect / TTFB / total timings"""
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+
+        _connect_timing.seconds = 0.0
+        start = time.perf_counter()
+        response = self.session.request(method, url, **kwargs)
+        total = time.perf_counter() - start
+        connect = _connect_timing.seconds
+
+        # response.elapsed runs until the headers arrive, including connecting
+        timing = {
+            "method": method.upper(),
+            "url": url,
+            "status": response.status_code,
+            "reused_connection": connect == 0.0,
+            "connect_ms": round(connect * 1000, 2),
+            "ttfb_ms": round(max(response.elapsed.total_seconds() - connect, 0.0) * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+        }
+        if self.record_timings:
+            with self._lock:
+                self._timings.append(timing)
+        response.timing = timing
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def drain_timings(self):
+        """Return and forget the timings recorded since the last call"""
+        with self._lock:
+            timings, self._timings = self._timings, []
+        return timings
+
+    @staticmethod
+    def format_timings(timings):
+        lines = [f"{'method':<7}{'status':>7}{'connect':>10}{'ttfb':>10}{'total':>10}  url"]
+        for t in timings:
+            lines.append(
+                f"{t['method']:<7}{t['status']:>7}{t['connect_ms']:>8.1f}ms{t['ttfb_ms']:>8.1f}ms"
+                f"{t['total_ms']:>8.1f}ms  {t['url']}"
+            )
+        return "\n".join(lines)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,234 @@
+# utils/artifacts.py
+import gzip
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+
+from utils.screenshot_store import ScreenshotStore
+
+
+def _safe_name(text):
+    return re.sub(r"[^\w.-]+", "_", text)
+
+
+class ArtifactService:
+    """
+    Captures failure artifacts (screenshot, DOM, browser console) without
+    blocking the test on disk I/O.
+
+    capture() only pulls the raw bytes out of the browser on the calling
+    thread; gzip compression and file writes happen on a background thread.
+    Files are named per test and numbered, under a per-worker root, and the
+    oldest files are deleted once the count or size limit is exceeded.
+
+    Screenshots go through a ScreenshotStore: downscaled, re-encoded and
+    stored once per distinct image under root/screenshots. index.jsonl maps
+    each capture (test, reason) to its files; it is trimmed along with them,
+    so it only lists captures that still have files on disk.
+
+    Args:
+        root: Directory for this process's artifacts (already per xdist worker)
+        max_files: Keep at most this many files under root
+        max_bytes: Keep at most this many bytes under root
+    """
+
+    def __init__(self, root=os.path.join("reports", "artifacts"), max_files=200, max_bytes=200 * 1024 * 1024):
+        self.root = root
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.test_id = None
+        self.test_paths = []
+        self._counter = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._files = None
+        self._total_bytes = 0
+        self.screenshots = ScreenshotStore(os.path.join(root, "screenshots"))
+        self.stats = {"captured": 0, "written": 0, "deleted": 0, "capture_seconds": 0.0}
+
+    def configure(self, root=None, max_files=None, max_bytes=None, screenshot_scale=None, screenshot_format=None):
+        # 0 is a valid limit ("keep nothing"), so only None means "leave as is"
+        if root is not None:
+            self.root = root
+        if max_files is not None:
+            self.max_files = max_files
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if screenshot_scale is not None:
+            self.screenshots.scale = screenshot_scale
+        if screenshot_format is not None:
+            self.screenshots.image_format = screenshot_format
+        self.screenshots.root = os.path.join(self.root, "screenshots")
+
+    def start_test(self, test_id):
+        self.test_id = test_id
+        self.test_paths = []
+        self._counter = 0
+
+    def capture(self, driver, reason, screenshot=True, dom=True, console=True):
+        """
+        Grab artifacts from the browser and queue them for writing.
+
+        Args:
+            driver: WebDriver to capture from
+            reason: Short label used in the file names (e.g. "cart_navigation_error")
+
+        Returns:
+            Paths the artifacts will be written to
+        """
+        if not self.max_files or not self.max_bytes:
+            # Retention of 0 keeps nothing, so don't spend time capturing
+            return []
+        start = time.perf_counter()
+        self._counter += 1
+        test_dir = _safe_name(self.test_id or "session")[-150:]
+        base = os.path.join(self.root, test_dir, f"{self._counter:02d}-{_safe_name(reason)}")
+
+        pending = []
+        if screenshot:
+            image = self._safe(lambda: self.screenshots.grab(driver))
+            if image is not None:
+                data, extension = image
+                pending.append((self.screenshots.path_for(data, extension), data, "dedupe"))
+        if dom:
+            pending.append((f"{base}.html.gz", self._safe(lambda: driver.page_source.encode("utf-8")), "gzip"))
+        if console:
+            pending.append((f"{base}.console.json.gz", self._safe(lambda: self._console_log(driver)), "gzip"))
+
+        paths = []
+        for path, data, mode in pending:
+            if data is not None:
+                self._put(path, data, mode)
+                paths.append(path)
+        self.test_paths.extend(paths)
+        if paths:
+            entry = {"test": self.test_id, "reason": reason, "files": [os.path.relpath(p, self.root) for p in paths]}
+            self._put(os.path.join(self.root, "index.jsonl"), (json.dumps(entry) + "\n").encode("utf-8"), "append")
+        self.stats["captured"] += 1
+        self.stats["capture_seconds"] += time.perf_counter() - start
+        return paths
+
+    @staticmethod
+    def _console_log(driver):
+        # Only Chromium-based local drivers expose the browser log
+        return json.dumps(driver.get_log("browser"), indent=1).encode("utf-8")
+
+    @staticmethod
+    def _safe(read):
+        try:
+            return read()
+        except Exception as e:
+            print(f"[Artifacts]: capture step failed: {e}")
+            return None
+
+    def _put(self, path, data, mode):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._writer, name="artifact-writer", daemon=True)
+            self._thread.start()
+        self._queue.put((path, data, mode))
+
+    def _writer(self):
+        while True:
+            path, data, mode = self._queue.get()
+            try:
+                if mode == "append":
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "ab") as f:
+                        f.write(data)
+                    continue
+                if mode == "dedupe":
+                    # An identical screenshot already on disk only moves to the back of the retention queue
+                    if self.screenshots.put(path, data):
+                        self.stats["written"] += 1
+                    self._retain(path, len(data))
+                    continue
+                if mode == "gzip":
+                    # Images are already compressed; text compresses ~10x
+                    data = gzip.compress(data, compresslevel=5)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+                self.stats["written"] += 1
+                self._retain(path, len(data))
+            except Exception as e:
+                print(f"[Artifacts]: could not write {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _retain(self, path, size):
+        """Delete the oldest files once the count or size limit is exceeded"""
+        if self._files is None:
+            # Include files left by earlier runs, oldest first
+            existing = []
+            for directory, _, names in os.walk(self.root):
+                for name in names:
+                    full = os.path.join(directory, name)
+                    if full != path and name != "index.jsonl":
+                        stat = os.stat(full)
+                        existing.append((stat.st_mtime, full, stat.st_size))
+            self._files = deque((full, size_) for _, full, size_ in sorted(existing))
+            self._total_bytes = sum(size_ for _, size_ in self._files)
+
+        # A rerun may overwrite a file, or a screenshot may repeat; count it once
+        for entry in [entry for entry in self._files if entry[0] == path]:
+            self._files.remove(entry)
+            self._total_bytes -= entry[1]
+        self._files.append((path, size))
+        self._total_bytes += size
+        deleted = False
+        while len(self._files) > self.max_files or self._total_bytes > self.max_bytes:
+            old_path, old_size = self._files.popleft()
+            self._total_bytes -= old_size
+            try:
+                os.remove(old_path)
+                self.stats["deleted"] += 1
+                deleted = True
+            except OSError:
+                pass
+        if deleted:
+            self._trim_index()
+
+    def _trim_index(self):
+        """Drop deleted files from index.jsonl, and captures with none left"""
+        index = os.path.join(self.root, "index.jsonl")
+        if not os.path.exists(index):
+            return
+        kept = []
+        with open(index, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                # A deduplicated screenshot may still be on disk for a newer capture
+                entry["files"] = [name for name in entry.get("files", ())
+                                  if os.path.exists(os.path.join(self.root, name))]
+                if entry["files"]:
+                    kept.append(json.dumps(entry) + "\n")
+        temporary = index + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.writelines(kept)
+        os.replace(temporary, index)
+
+    def flush(self):
+        """Wait until every queued artifact is on disk"""
+        self._queue.join()
+
+    def close(self):
+        self.flush()
+        if self.stats["captured"]:
+            print(f"[Artifacts]: {self.stats['captured']} captures, {self.stats['written']} files written to "
+                  f"{self.root} ({self.stats['deleted']} old files removed), "
+                  f"{self.stats['capture_seconds']:.2f}s spent capturing in tests")
+            shots = self.screenshots.stats
+            if shots["duplicates"]:
+                print(f"[Artifacts]: {shots['duplicates']} duplicate screenshots skipped "
+                      f"({shots['bytes_saved'] / 1024:.0f} KB not written)")
+
+
+# Shared by the page objects and fixtures in this process
+artifacts = ArtifactService()
@@ -0,0 +1,118 @@
+# utils/async_api.py
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+class BatchResult:
+    """
+    Responses and latency figures for one batch of concurrent requests.
+
+    Responses are returned in the same order as the requests were given.
+    """
+
+    def __init__(self, calls, responses, wall_seconds, concurrency):
+        self.calls = calls
+        self.responses = responses
+        self.wall_ms = round(wall_seconds * 1000, 2)
+        self.concurrency = concurrency
+        self.timings = [response.timing for response in responses]
+
+    @property
+    def status_codes(self):
+        return [response.status_code for response in self.responses]
+
+    def summary(self):
+        totals = sorted(t["total_ms"] for t in self.timings)
+        serial_ms = sum(totals)
+        return {
+            "requests": len(totals),
+            "concurrency": self.concurrency,
+            "wall_ms": self.wall_ms,
+            "serial_ms": round(serial_ms, 2),
+            "speedup": round(serial_ms / self.wall_ms, 2) if self.wall_ms else None,
+            "min_ms": totals[0] if totals else None,
+            "mean_ms": round(statistics.mean(totals), 2) if totals else None,
+            "p95_ms": totals[min(len(totals) - 1, int(len(totals) * 0.95))] if totals else None,
+            "max_ms": totals[-1] if totals else None,
+        }
+
+    def format(self):
+        s = self.summary()
+        return (
+            f"{s['requests']} requests, concurrency {s['concurrency']}: wall {s['wall_ms']}ms "
+            f"(serial sum {s['serial_ms']}ms, x{s['speedup']}) | "
+            f"min {s['min_ms']}ms, mean {s['mean_ms']}ms, p95 {s['p95_ms']}ms, max {s['max_ms']}ms"
+        )
+
+
+class AsyncApiClient:
+    """
+    asyncio front end for ApiClient that sends batches of requests concurrently.
+
+    Requests still go through the shared keep-alive session, so they reuse
+    its connection pool, retry policy and timing capture. Blocking calls run
+    on a thread pool and an asyncio.Semaphore caps how many are in flight.
+
+    Args:
+        client: ApiClient used to send the requests
+        concurrency: Maximum number of requests in flight at once
+    """
+
+    def __init__(self, client, concurrency=10):
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="api")
+        self._batches = []
+        self._lock = threading.Lock()
+
+    async def request(self, method, path, semaphore=None, **kwargs):
+        """Send one request without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        call = partial(self.client.request, method, path, **kwargs)
+        if semaphore is None:
+            return await loop.run_in_executor(self._executor, call)
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, call)
+
+    async def gather(self, calls, concurrency=None):
+        """
+        Send many requests concurrently and return their responses in order.
+
+        Args:
+            calls: Iterable of (method, path) or (method, path, kwargs) tuples
+            concurrency: Override the client's in-flight limit for this batch
+        """
+        semaphore = asyncio.Semaphore(min(concurrency or self.concurrency, self.concurrency))
+        return await asyncio.gather(*(
+            self.request(call[0], call[1], semaphore=semaphore, **(call[2] if len(call) > 2 else {}))
+            for call in calls
+        ))
+
+    def run_batch(self, calls, concurrency=None):
+        """
+        Blocking helper for regular (non-async) tests.
+
+        Returns:
+            BatchResult with the responses and per-request/aggregate latency
+        """
+        calls = list(calls)
+        start = time.perf_counter()
+        responses = asyncio.run(self.gather(calls, concurrency))
+        result = BatchResult(calls, responses, time.perf_counter() - start,
+                             min(concurrency or self.concurrency, self.concurrency))
+        with self._lock:
+            self._batches.append(result)
+        return result
+
+    def drain_batches(self):
+        """Return and forget the batches run since the last call"""
+        with self._lock:
+            batches, self._batches = self._batches, []
+        return batches
+
+    def close(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,156 @@
+# utils/browser_contexts.py
+import json
+import os
+import statistics
+import time
+import urllib.request
+from typing import NamedTuple
+
+# Set by the pytest controller so xdist workers attach to the Chrome it launched
+ADDRESS_VARIABLE = "SHARED_CHROME_ADDRESS"
+
+
+class BrowserContext(NamedTuple):
+    """One isolated session: a CDP browser context and the tab opened in it"""
+    context_id: str
+    window: str
+
+
+class DevToolsBrowser:
+    """
+    Browser-level DevTools connection.
+
+    Chrome only allows creating and disposing browser contexts from the
+    browser target, not from a tab's session (which is all
+    driver.execute_cdp_cmd reaches), so this talks to the debugger address
+    directly over websocket-client (already a Selenium dependency).
+
+    Args:
+        address: DevTools host:port (goog:chromeOptions.debuggerAddress)
+        timeout: Seconds to wait for a reply
+    """
+
+    def __init__(self, address, timeout=10):
+        import websocket
+
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            url = json.load(response)["webSocketDebuggerUrl"]
+        # Chrome rejects DevTools connections that send an Origin header it doesn't allow
+        self.socket = websocket.create_connection(url, timeout=timeout, suppress_origin=True)
+        self._next_id = 0
+
+    def send(self, method, params=None):
+        self._next_id += 1
+        self.socket.send(json.dumps({"id": self._next_id, "method": method, "params": params or {}}))
+        while True:
+            message = json.loads(self.socket.recv())
+            if message.get("id") == self._next_id:
+                if "error" in message:
+                    raise RuntimeError(f"{method} failed: {message['error'].get('message')}")
+                return message.get("result", {})
+
+    def close(self):
+        self.socket.close()
+
+
+class BrowserContexts:
+    """
+    Gives every test its own browser context inside one Chrome process.
+
+    A browser context is Chrome's incognito-style profile: cookies, storage
+    and cache are separate per context, but the browser process, GPU process
+    and renderer binaries are shared, so a context costs a few MB instead of
+    the hundreds a new Chrome needs. Contexts are created and disposed over
+    CDP (Target.createBrowserContext / Target.disposeBrowserContext) and the
+    driver is switched into the new context's tab; ChromeDriver uses DevTools
+    target IDs as window handles.
+
+    Several xdist workers can attach their own ChromeDriver to the same
+    Chrome (see SharedChrome) and run contexts side by side. Contexts are
+    created with disposeOnDetach, so a crashed worker's contexts go away
+    with its DevTools connection.
+
+    Args:
+        driver: Local Chrome WebDriver (launched or attached)
+        throttle: Callable applied to each new tab (CDP network settings are per tab)
+    """
+
+    def __init__(self, driver, throttle=None):
+        self.driver = driver
+        self.throttle = throttle
+        self.devtools = DevToolsBrowser(driver.capabilities["goog:chromeOptions"]["debuggerAddress"])
+        self.timings = {"create": [], "dispose": []}
+
+    def open(self):
+        """Create a context with one blank tab and switch the driver into it"""
+        start = time.perf_counter()
+        context_id = self.devtools.send("Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+        window = self.devtools.send(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+        )["targetId"]
+        self.driver.switch_to.window(window)
+        if self.throttle:
+            self.throttle(self.driver)
+        self.timings["create"].append(time.perf_counter() - start)
+        return BrowserContext(context_id, window)
+
+    def close(self, context):
+        """Dispose of a context (closing its tabs and dropping its cookies and storage)"""
+        start = time.perf_counter()
+        try:
+            self.devtools.send("Target.disposeBrowserContext", {"browserContextId": context.context_id})
+        except Exception as e:
+            print(f"[BrowserContexts]: could not dispose {context.context_id}: {e}")
+        self.timings["dispose"].append(time.perf_counter() - start)
+
+    def summary(self):
+        summary = {"contexts": len(self.timings["create"])}
+        for kind, values in self.timings.items():
+            if values:
+                summary[f"{kind}_avg_ms"] = round(statistics.mean(values) * 1000, 1)
+                summary[f"{kind}_max_ms"] = round(max(values) * 1000, 1)
+        return summary
+
+    def format(self):
+        summary = self.summary()
+        if not summary["contexts"]:
+            return "no browser contexts opened"
+        line = (f"{summary['contexts']} contexts, create avg {summary['create_avg_ms']:.0f} ms "
+                f"(max {summary['create_max_ms']:.0f} ms)")
+        if "dispose_avg_ms" in summary:
+            line += f", dispose avg {summary['dispose_avg_ms']:.0f} ms (max {summary['dispose_max_ms']:.0f} ms)"
+        return line
+
+    def quit(self):
+        self.devtools.close()
+        self.driver.quit()
+
+
+class SharedChrome:
+    """
+    The Chrome process that browser contexts live in, launched once per run.
+
+    The pytest controller launches it through a normal WebDriver session and
+    publishes its DevTools address in SHARED_CHROME_ADDRESS, which xdist
+    workers inherit and attach to.
+
+    Args:
+        factory: Callable returning a local Chrome WebDriver
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.driver = None
+
+    def start(self):
+        self.driver = self.factory()
+        address = self.driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        os.environ[ADDRESS_VARIABLE] = address
+        print(f"[SharedChrome]: browser contexts will use Chrome at {address}")
+        return address
+
+    def stop(self):
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            os.environ.pop(ADDRESS_VARIABLE, None)
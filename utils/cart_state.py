@@ -0,0 +1,84 @@
+# utils/cart_state.py
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from page_objects.cart_page import CartPage
+from test_data.test_data import DataManager
+
+
+class CartState:
+    """
+    Puts products in the cart without clicking through the inventory page.
+
+    Swag Labs keeps the cart client-side, as a JSON list of product IDs in
+    localStorage under "cart-contents". seed() writes that list and opens
+    the target page once, so a test starts with the right cart after a
+    single navigation. Tests of the add-to-cart behavior itself should keep
+    using InventoryPage.add_item_to_cart.
+
+    The browser must already be logged in (e.g. via SessionCache).
+
+    Args:
+        base_url: Site root (env.base_url)
+        test_data: DataManager used to map product keys to IDs
+        timeout: Seconds to wait for the seeded page to render
+    """
+
+    STORAGE_KEY = "cart-contents"
+
+    def __init__(self, base_url, test_data=None, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.test_data = test_data or DataManager()
+        self.timeout = timeout
+
+    def product_ids(self, items):
+        """IDs for product keys from test_data.json (e.g. ["backpack"] -> [4])"""
+        ids = []
+        for key in items:
+            product = self.test_data.get_product_details(key)
+            if "id" not in product:
+                raise KeyError(f"Product '{key}' has no id in test_data.json")
+            ids.append(product["id"])
+        return ids
+
+    def seed(self, driver, items, page="cart.html"):
+        """
+        Replace the cart with the given products and open `page`.
+
+        Args:
+            driver: Logged-in WebDriver
+            items: Product keys, e.g. ["backpack", "bike_light"]
+            page: Page to open afterwards ("cart.html" or "inventory.html")
+
+        Returns:
+            CartPage when page is the cart, otherwise None
+        """
+        ids = self.product_ids(items)
+        # localStorage is per origin, so make sure a site page is loaded
+        if not driver.current_url.startswith(self.base_url):
+            driver.get(self.base_url)
+        driver.execute_script(
+            "window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));",
+            self.STORAGE_KEY, ids,
+        )
+        driver.get(f"{self.base_url}/{page}")
+        WebDriverWait(driver, self.timeout).until(EC.url_contains(page))
+
+        if page == "cart.html":
+            WebDriverWait(driver, self.timeout).until(
+                lambda d: d.execute_script("return document.querySelectorAll('.cart_item').length") == len(ids)
+            )
+            return CartPage(driver)
+        return None
+
+    def seed_scenario(self, driver, scenario, page="cart.html"):
+        """Seed a cart scenario from test_data.json (e.g. "multiple_items")"""
+        return self.seed(driver, self.test_data.get_cart_scenario(scenario), page)
+
+    def clear(self, driver):
+        driver.execute_script("window.localStorage.removeItem(arguments[0]);", self.STORAGE_KEY)
+
+    def read(self, driver):
+        """Product IDs currently in the cart"""
+        return driver.execute_script(
+            "return JSON.parse(window.localStorage.getItem(arguments[0]) || '[]');", self.STORAGE_KEY
+        )
@@ -0,0 +1,149 @@
+# utils/driver_pool.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DriverPool:
+    """
+    Keeps a fixed number of warm WebDriver instances for one pytest worker.
+
+    Launching Chrome is the slowest part of most UI tests, so instead of
+    quitting the driver after every test we hand it back to the pool and give
+    it to the next test. Browser state is wiped lazily, when the next test
+    asks for a clean driver; tests with a declared start state take the
+    driver as it is and move it to their state (see utils/state_planner.py).
+
+    A worker runs one test at a time, so it only ever uses one driver. With
+    size > 1 the other size - 1 are spares launched in a background thread
+    while tests run; when a driver is recycled (max_uses, failed health
+    check, --max_browser_mb) the next test gets a spare instead of waiting
+    for a cold Chrome start.
+
+    Args:
+        factory: Callable that creates a new, ready-to-use driver
+        size: Drivers kept per worker: the one in use plus size - 1 spares
+        max_uses: Recycle (quit and relaunch) a driver after this many tests
+    """
+
+    def __init__(self, factory, size=1, max_uses=50):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._idle = []
+        self._spares = []
+        self._launcher = None
+        self._uses = {}
+        # launched: cold starts a test waited for; prewarmed: spares handed to a test instead
+        self.stats = {"launched": 0, "reused": 0, "recycled": 0, "resets": 0, "prewarmed": 0}
+
+    def acquire(self, clean=True):
+        """
+        Return a healthy driver, reusing an idle one when possible.
+
+        Args:
+            clean: Wipe cookies and storage of a reused driver first; pass
+                False to keep the previous test's session and page
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if not self._is_healthy(driver):
+                self._discard(driver)
+                continue
+            if clean:
+                try:
+                    self.reset(driver)
+                    self.stats["resets"] += 1
+                except Exception as e:
+                    print(f"[DriverPool] Reset failed, recycling driver: {e}")
+                    self._discard(driver)
+                    continue
+            self.stats["reused"] += 1
+            self._prewarm()
+            return driver
+
+        driver = self._take_spare()
+        if driver is None:
+            driver = self.factory()
+            self.stats["launched"] += 1
+        self._uses[id(driver)] = 0
+        self._prewarm()
+        return driver
+
+    def _take_spare(self):
+        """A driver launched in the background (waiting for it if it's still starting), or None"""
+        while self._spares:
+            try:
+                driver = self._spares.pop(0).result()
+            except Exception as e:
+                print(f"[DriverPool] Spare driver failed to start: {e}")
+                continue
+            self.stats["prewarmed"] += 1
+            return driver
+        return None
+
+    def _prewarm(self):
+        """Start launching spares until idle and spare drivers make up size - 1"""
+        while len(self._idle) + len(self._spares) < self.size - 1:
+            if self._launcher is None:
+                self._launcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-prewarm")
+            self._spares.append(self._launcher.submit(self.factory))
+
+    def release(self, driver, recycle=False):
+        """
+        Give a driver back to the pool after a test.
+
+        The driver is quit instead of reused when recycle is True, when it has
+        reached max_uses or when the pool is full. It is not reset here; the
+        next acquire() decides whether it needs to be.
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+        if (recycle or self._uses[id(driver)] >= self.max_uses
+                or len(self._idle) + len(self._spares) >= self.size):
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    @staticmethod
+    def reset(driver):
+        """Clear cookies and web storage, then park the driver on about:blank"""
+        # Storage is per-origin, so it has to be cleared before leaving the page
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        self.stats["recycled"] += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[DriverPool] Error quitting driver: {e}")
+
+    def close(self):
+        """Quit every idle and spare driver (called once at the end of the session)"""
+        start = time.time()
+        while self._spares:
+            try:
+                self._idle.append(self._spares.pop().result())
+            except Exception:
+                pass
+        if self._launcher:
+            self._launcher.shutdown()
+        while self._idle:
+            driver = self._idle.pop()
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"[DriverPool] Error quitting driver: {e}")
+        print(f"[DriverPool] Closed in {time.time() - start:.2f}s, stats: {self.stats}")
@@ -0,0 +1,177 @@
+# utils/duration_history.py
+import math
+import sqlite3
+import statistics
+import time
+
+DEFAULT_HISTORY_FILE = ".duration_history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    env TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    env TEXT NOT NULL,
+    call_s REAL NOT NULL,
+    total_s REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS durations_by_test ON durations (nodeid, env, run_id);
+"""
+
+
+class Regression:
+    """A test whose call duration is well above its recent baseline"""
+
+    def __init__(self, nodeid, seconds, baseline_mean, baseline_stdev, samples, z_score):
+        self.nodeid = nodeid
+        self.seconds = seconds
+        self.baseline_mean = baseline_mean
+        self.baseline_stdev = baseline_stdev
+        self.samples = samples
+        self.z_score = z_score
+
+    @property
+    def slowdown(self):
+        return self.seconds / self.baseline_mean if self.baseline_mean else math.inf
+
+
+class DurationHistory:
+    """
+    SQLite history of test durations, one row per test per run, keyed by
+    node ID and environment (TEST_ENV).
+
+    Regressions are flagged when a passing test's call time is more than
+    `threshold` standard deviations above the mean of its last
+    `baseline_runs` passing runs in the same environment.
+
+    Args:
+        path: SQLite database file
+        env: Environment name the run belongs to
+        threshold: z-score above which a test counts as regressed
+        baseline_runs: Number of earlier passing runs in the baseline
+        min_samples: Baseline runs needed before a test is judged
+        min_delta: Ignore slowdowns smaller than this many seconds (timer noise)
+        keep_runs: Runs kept per environment; older ones are deleted on save
+    """
+
+    def __init__(self, path, env, threshold=3.0, baseline_runs=10, min_samples=3, min_delta=0.1, keep_runs=200):
+        self.path = path
+        self.env = env
+        self.threshold = threshold
+        self.baseline_runs = baseline_runs
+        self.min_samples = min_samples
+        self.min_delta = min_delta
+        self.keep_runs = keep_runs
+        self._tests = {}
+        self.regressions = []
+
+    def add(self, nodeid, when, seconds, outcome):
+        """Record one phase (setup/call/teardown) of a test report"""
+        entry = self._tests.setdefault(nodeid, {"call": 0.0, "total": 0.0, "outcome": "passed"})
+        entry["total"] += seconds
+        if when == "call":
+            entry["call"] = seconds
+        # A failed or skipped setup/teardown marks the whole test
+        if outcome != "passed" and entry["outcome"] == "passed":
+            entry["outcome"] = outcome
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def baseline(self, connection, nodeid):
+        """Call durations of the test's most recent passing runs, newest first"""
+        rows = connection.execute(
+            "SELECT call_s FROM durations WHERE nodeid = ? AND env = ? AND outcome = 'passed' "
+            "ORDER BY run_id DESC LIMIT ?",
+            (nodeid, self.env, self.baseline_runs),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def save(self):
+        """Compare this run against the stored baselines, then append it to the history"""
+        if not self._tests:
+            return []
+        with self._connect() as connection:
+            self.regressions = self._find_regressions(connection)
+            run_id = connection.execute(
+                "INSERT INTO runs (started, env) VALUES (?, ?)", (time.time(), self.env)
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO durations (run_id, nodeid, env, call_s, total_s, outcome) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, self.env, round(entry["call"], 4), round(entry["total"], 4), entry["outcome"])
+                    for nodeid, entry in self._tests.items()
+                ],
+            )
+            self._prune(connection)
+        connection.close()
+        self._tests = {}
+        return self.regressions
+
+    def _prune(self, connection):
+        """Delete this environment's runs older than the newest keep_runs"""
+        oldest_kept = connection.execute(
+            "SELECT id FROM runs WHERE env = ? ORDER BY id DESC LIMIT 1 OFFSET ?", (self.env, self.keep_runs - 1)
+        ).fetchone()
+        if oldest_kept:
+            connection.execute("DELETE FROM durations WHERE env = ? AND run_id < ?", (self.env, oldest_kept[0]))
+            connection.execute("DELETE FROM runs WHERE env = ? AND id < ?", (self.env, oldest_kept[0]))
+
+    def _find_regressions(self, connection):
+        regressions = []
+        for nodeid, entry in self._tests.items():
+            if entry["outcome"] != "passed":
+                continue
+            samples = self.baseline(connection, nodeid)
+            if len(samples) < self.min_samples:
+                continue
+            mean = statistics.fmean(samples)
+            stdev = statistics.stdev(samples)
+            delta = entry["call"] - mean
+            if delta < self.min_delta:
+                continue
+            # Very steady tests have ~0 spread; treat 5% of the mean as the minimum noise
+            z_score = delta / max(stdev, mean * 0.05, 1e-6)
+            if z_score >= self.threshold:
+                regressions.append(Regression(nodeid, entry["call"], mean, stdev, len(samples), z_score))
+        return sorted(regressions, key=lambda r: r.z_score, reverse=True)
+
+    def format_regressions(self):
+        lines = [
+            f"{'now':>9}{'baseline':>10}{'stdev':>9}{'slower':>8}{'z':>7}  test",
+        ]
+        for r in self.regressions:
+            lines.append(
+                f"{r.seconds:8.2f}s{r.baseline_mean:9.2f}s{r.baseline_stdev:8.2f}s"
+                f"{r.slowdown:7.1f}x{r.z_score:7.1f}  {r.nodeid}"
+            )
+        return "\n".join(lines)
+
+
+class DurationHistoryRecorder:
+    """pytest plugin that stores every test's durations and reports regressions at the end"""
+
+    def __init__(self, history):
+        self.history = history
+
+    def pytest_runtest_logreport(self, report):
+        self.history.add(report.nodeid, report.when, report.duration, report.outcome)
+
+    def pytest_sessionfinish(self):
+        self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        history = self.history
+        if history.regressions:
+            terminalreporter.write_sep(
+                "-", f"duration regressions (z >= {history.threshold:g} vs last {history.baseline_runs} runs, "
+                     f"env {history.env})"
+            )
+            terminalreporter.write_line(history.format_regressions())
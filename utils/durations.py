@@ -0,0 +1,122 @@
+# utils/durations.py
+import heapq
+import json
+import os
+import statistics
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+
+
+class DurationStore:
+    """
+    Historical per-test durations (setup + call + teardown seconds), keyed by nodeid.
+
+    New measurements are blended with the stored value so one slow run
+    doesn't reshuffle every shard.
+
+    Args:
+        path: JSON file the durations are kept in
+        smoothing: Weight given to the newest measurement (0-1)
+    """
+
+    def __init__(self, path=DEFAULT_DURATIONS_FILE, smoothing=0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.durations = self._load()
+        self._measured = {}
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return {nodeid: float(seconds) for nodeid, seconds in json.load(f).items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def get(self, nodeid, default=None):
+        return self.durations.get(nodeid, default)
+
+    def default_duration(self):
+        """Estimate used for tests that have never been timed (median of the known ones)"""
+        return statistics.median(self.durations.values()) if self.durations else 1.0
+
+    def add(self, nodeid, seconds):
+        """Accumulate time for a test phase; saved by save()"""
+        self._measured[nodeid] = self._measured.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """Blend this run's measurements into the file (re-read first so parallel shards don't clobber each other)"""
+        if not self._measured:
+            return
+        durations = self._load()
+        for nodeid, seconds in self._measured.items():
+            previous = durations.get(nodeid)
+            if previous is None:
+                durations[nodeid] = round(seconds, 4)
+            else:
+                durations[nodeid] = round(self.smoothing * seconds + (1 - self.smoothing) * previous, 4)
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(sorted(durations.items())), f, indent=1)
+        os.replace(tmp_path, self.path)
+        self.durations = durations
+        self._measured = {}
+
+
+def parse_shard(value):
+    """
+    Parse a "--shard i/N" value.
+
+    Returns:
+        (index, count) with index counted from 1
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except (AttributeError, ValueError):
+        raise ValueError(f"--shard expects i/N (e.g. 1/4), got {value!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"--shard index must be between 1 and N, got {value!r}")
+    return index, count
+
+
+def longest_first(items, store):
+    """Order items by expected duration, longest first (ties keep collection order)"""
+    default = store.default_duration()
+    return sorted(items, key=lambda item: -store.get(item.nodeid, default))
+
+
+def partition(items, store, count):
+    """
+    Split items into `count` groups of roughly equal expected duration.
+
+    Greedy longest-processing-time: each test, longest first, goes to the
+    group with the least time so far. Deterministic for a given durations
+    file, so every shard computes the same split.
+
+    Returns:
+        List of `count` item lists, each in original collection order
+    """
+    default = store.default_duration()
+    heap = [(0.0, index) for index in range(count)]
+    groups = [[] for _ in range(count)]
+    positions = {id(item): position for position, item in enumerate(items)}
+
+    for item in longest_first(items, store):
+        total, index = heapq.heappop(heap)
+        groups[index].append(item)
+        heapq.heappush(heap, (total + store.get(item.nodeid, default), index))
+
+    return [sorted(group, key=lambda item: positions[id(item)]) for group in groups]
+
+
+class DurationRecorder:
+    """pytest plugin that feeds every test phase's duration into a DurationStore"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def pytest_runtest_logreport(self, report):
+        self.store.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self):
+        self.store.save()
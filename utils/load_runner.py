@@ -0,0 +1,262 @@
+# utils/load_runner.py
+import itertools
+import math
+import threading
+import time
+
+from test_data.data_reader import DataReader
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory latency histogram with ~1% wide logarithmic buckets.
+
+    Good enough for p50/p95/p99 over millions of samples without storing them.
+    """
+
+    GROWTH = 1.01
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms):
+        index = int(math.log(max(value_ms, 0.001) * 1000, self.GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, pct):
+        if not self.count:
+            return None
+        target = math.ceil(self.count * pct / 100)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                # Upper edge of the bucket, converted back from microseconds
+                return round(min(self.GROWTH ** (index + 1) / 1000, self.max_ms), 2)
+        return round(self.max_ms, 2)
+
+    @property
+    def mean_ms(self):
+        return round(self.total_ms / self.count, 2) if self.count else None
+
+    def bars(self, rows=10, width=40):
+        """ASCII histogram of the samples in `rows` log-spaced ranges"""
+        if not self.count:
+            return []
+        indexes = sorted(self.buckets)
+        low, high = indexes[0], indexes[-1] + 1
+        step = max(1, math.ceil((high - low) / rows))
+        lines = []
+        peak = 0
+        grouped = []
+        for start in range(low, high, step):
+            count = sum(self.buckets.get(i, 0) for i in range(start, start + step))
+            grouped.append((start, count))
+            peak = max(peak, count)
+        for start, count in grouped:
+            edge_ms = self.GROWTH ** (start + step) / 1000
+            bar = "#" * (round(width * count / peak) if peak else 0)
+            lines.append(f"  <= {edge_ms:9.2f}ms {count:>8} {bar}")
+        return lines
+
+
+class Scenario:
+    """
+    One request type driven by the load runner.
+
+    Args:
+        name: Scenario name used on the command line and in reports
+        method: HTTP method
+        paths: Iterable of request paths, cycled for each iteration
+        payloads: Optional iterable of JSON bodies, cycled alongside paths
+        expected_status: Status code counted as a success
+    """
+
+    def __init__(self, name, method, paths, expected_status, payloads=None):
+        self.name = name
+        self.method = method
+        self._paths = itertools.cycle(list(paths))
+        self._payloads = itertools.cycle(list(payloads)) if payloads else None
+        self.expected_status = expected_status
+        self._lock = threading.Lock()
+
+    def next_request(self):
+        with self._lock:
+            path = next(self._paths)
+            payload = next(self._payloads) if self._payloads else None
+        return path, payload
+
+
+def build_scenarios(data_file="api/user_data.json"):
+    """
+    Build the create/get/update/delete scenarios from the same test data the
+    API tests use (test_data/api/user_data.json).
+    """
+    api_data = DataReader.load_data(data_file)
+    create_payloads = [{"name": user["name"], "job": user["job"]} for user in api_data["create_users"]]
+    expected_create = api_data["create_users"][0]["expected_status"]
+    user_paths = [f"/users/{user_id}" for user_id in api_data["user_ids"]]
+
+    return {
+        "create_user": Scenario("create_user", "POST", ["/users"], expected_create, create_payloads),
+        "get_user": Scenario("get_user", "GET", user_paths, 200),
+        "update_user": Scenario("update_user", "PUT", ["/users/2"], 200, [api_data["update_user"]]),
+        "delete_user": Scenario("delete_user", "DELETE", user_paths, 204),
+    }
+
+
+class LoadRunner:
+    """
+    Drives scenarios against an ApiClient for a fixed duration.
+
+    With `rate` set, requests are scheduled at that many per second (open
+    model, capped by `concurrency` workers). Without it, every worker sends
+    the next request as soon as the previous one finishes (closed model).
+
+    Args:
+        client: ApiClient to send requests with (use record_timings=False)
+        scenarios: List of Scenario objects, used round-robin
+        duration: Seconds to run for
+        concurrency: Number of worker threads
+        rate: Target requests per second across all workers, or None
+    """
+
+    def __init__(self, client, scenarios, duration=10, concurrency=10, rate=None):
+        self.client = client
+        self.scenarios = scenarios
+        self.duration = duration
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def run(self):
+        self._start = time.perf_counter()
+        self._deadline = self._start + self.duration
+        results = [self._empty_stats() for _ in range(self.concurrency)]
+        workers = [
+            threading.Thread(target=self._worker, args=(results[i],), daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - self._start
+        return LoadReport(self._merge(results), elapsed, self.concurrency, self.rate)
+
+    def _empty_stats(self):
+        return {s.name: {"histogram": LatencyHistogram(), "errors": 0, "statuses": {}} for s in self.scenarios}
+
+    def _worker(self, stats):
+        while True:
+            with self._lock:
+                sequence = next(self._sequence)
+            if self.rate:
+                scheduled = self._start + sequence / self.rate
+                if scheduled >= self._deadline:
+                    return
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            elif time.perf_counter() >= self._deadline:
+                return
+
+            scenario = self.scenarios[sequence % len(self.scenarios)]
+            path, payload = scenario.next_request()
+            entry = stats[scenario.name]
+            start = time.perf_counter()
+            try:
+                response = self.client.request(scenario.method, path, json=payload)
+                status = response.status_code
+            except Exception as e:
+                status = type(e).__name__
+            entry["histogram"].record((time.perf_counter() - start) * 1000)
+            entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+            if status != scenario.expected_status:
+                entry["errors"] += 1
+
+    def _merge(self, results):
+        merged = self._empty_stats()
+        for stats in results:
+            for name, entry in stats.items():
+                target = merged[name]
+                target["histogram"].merge(entry["histogram"])
+                target["errors"] += entry["errors"]
+                for status, count in entry["statuses"].items():
+                    target["statuses"][status] = target["statuses"].get(status, 0) + count
+        return merged
+
+
+class LoadReport:
+    """Throughput, error rate and latency percentiles for a load run"""
+
+    def __init__(self, stats, elapsed, concurrency, rate):
+        self.stats = stats
+        self.elapsed = elapsed
+        self.concurrency = concurrency
+        self.rate = rate
+        self.overall = LatencyHistogram()
+        for entry in stats.values():
+            self.overall.merge(entry["histogram"])
+
+    def _row(self, histogram, errors):
+        return {
+            "requests": histogram.count,
+            "errors": errors,
+            "error_rate": round(errors / histogram.count, 4) if histogram.count else 0.0,
+            "throughput_rps": round(histogram.count / self.elapsed, 2) if self.elapsed else 0.0,
+            "mean_ms": histogram.mean_ms,
+            "p50_ms": histogram.percentile(50),
+            "p95_ms": histogram.percentile(95),
+            "p99_ms": histogram.percentile(99),
+            "max_ms": round(histogram.max_ms, 2),
+        }
+
+    def to_dict(self):
+        total_errors = sum(entry["errors"] for entry in self.stats.values())
+        return {
+            "duration_s": round(self.elapsed, 2),
+            "concurrency": self.concurrency,
+            "target_rps": self.rate,
+            "overall": self._row(self.overall, total_errors),
+            "scenarios": {
+                name: {**self._row(entry["histogram"], entry["errors"]),
+                       "statuses": {str(k): v for k, v in entry["statuses"].items()}}
+                for name, entry in self.stats.items()
+            },
+        }
+
+    def format(self):
+        data = self.to_dict()
+        header = f"{'scenario':<14}{'requests':>10}{'rps':>10}{'errors':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+        lines = [
+            f"Load test: {data['duration_s']}s, concurrency {self.concurrency}, "
+            f"target {self.rate or 'unlimited'} rps",
+            header,
+            "-" * len(header),
+        ]
+        rows = list(data["scenarios"].items()) + [("overall", data["overall"])]
+        for name, row in rows:
+            lines.append(
+                f"{name:<14}{row['requests']:>10}{row['throughput_rps']:>10}"
+                f"{row['error_rate'] * 100:>8.2f}%{row['p50_ms'] or 0:>8.2f}ms"
+                f"{row['p95_ms'] or 0:>8.2f}ms{row['p99_ms'] or 0:>8.2f}ms{row['max_ms']:>8.2f}ms"
+            )
+        lines.append("")
+        lines.append("Latency histogram (all scenarios):")
+        lines.extend(self.overall.bars())
+        return "\n".join(lines)
@@ -0,0 +1,218 @@
+# utils/network_capture.py
+import json
+import os
+import re
+from datetime import datetime, timezone
+
+# Throttling presets, matching Chrome DevTools / Lighthouse.
+# Throughput is in bytes per second, latency in ms.
+THROTTLE_PROFILES = {
+    "slow_3g": {"offline": False, "latency": 2000, "downloadThroughput": 400 * 1024 / 8,
+                "uploadThroughput": 400 * 1024 / 8},
+    "3g": {"offline": False, "latency": 562.5, "downloadThroughput": 1440 * 1024 / 8,
+           "uploadThroughput": 675 * 1024 / 8},
+    "slow_4g": {"offline": False, "latency": 150, "downloadThroughput": 1600 * 1024 / 8,
+                "uploadThroughput": 750 * 1024 / 8},
+    "offline": {"offline": True, "latency": 0, "downloadThroughput": 0, "uploadThroughput": 0},
+    "none": {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1},
+}
+
+
+def apply_throttle(driver, profile):
+    """
+    Emulate network conditions in a local Chrome through CDP.
+
+    Args:
+        driver: Chrome WebDriver (must support execute_cdp_cmd)
+        profile: Name from THROTTLE_PROFILES
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        print(f"[Network]: throttling needs local Chrome; '{profile}' ignored")
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", THROTTLE_PROFILES[profile])
+
+
+def _iso(wall_time):
+    return datetime.fromtimestamp(wall_time, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _span(timing, start, end):
+    """Duration between two CDP timing offsets, or -1 when the phase didn't happen"""
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return -1
+    return round(timing[end] - timing[start], 2)
+
+
+class NetworkCapture:
+    """
+    Records every request a local Chrome makes during a test.
+
+    Chrome's performance log (goog:loggingPrefs) carries the raw CDP Network
+    events; at the end of each test they are turned into a HAR-like JSON file
+    with sizes, timings and cache status, plus a short summary for the report.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = os.path.join("reports", "network")
+        self.throttle = None
+
+    @staticmethod
+    def enable_logging(options):
+        """Ask chromedriver to record CDP events for this browser"""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def start_test(self, driver):
+        """Drop events left over from a previous test on a pooled driver"""
+        if self.enabled:
+            self._read_events(driver)
+
+    @staticmethod
+    def _read_events(driver):
+        try:
+            return [json.loads(entry["message"])["message"] for entry in driver.get_log("performance")]
+        except Exception as e:
+            print(f"[Network]: could not read performance log: {e}")
+            return []
+
+    def collect(self, driver, test_id):
+        """
+        Build the HAR for everything requested since start_test() and write it.
+
+        Returns:
+            (path, summary dict), or (None, None) when disabled
+        """
+        if not self.enabled:
+            return None, None
+        har = self.build_har(self._read_events(driver), comment=f"{test_id} (throttle: {self.throttle or 'none'})")
+
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        directory = os.path.join(self.output_dir, worker) if worker else self.output_dir
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, re.sub(r"[^\w.-]+", "_", test_id) + ".har.json")
+        with open(path, "w") as f:
+            json.dump(har, f, indent=1)
+        return path, self.summarize(har)
+
+    @staticmethod
+    def build_har(events, comment=""):
+        """Turn CDP Network.* events into HAR 1.2-style entries"""
+        requests = {}
+        for event in events:
+            method = event.get("method", "")
+            params = event.get("params", {})
+            request_id = params.get("requestId")
+            if not method.startswith("Network.") or request_id is None:
+                continue
+
+            if method == "Network.requestWillBeSent":
+                # A redirect reuses the id; keep the final hop
+                requests[request_id] = {
+                    "sent": params, "response": None, "finished": None, "failed": None, "memory_cache": False,
+                }
+                continue
+            record = requests.get(request_id)
+            if record is None:
+                continue
+            if method == "Network.responseReceived":
+                record["response"] = params["response"]
+            elif method == "Network.requestServedFromCache":
+                record["memory_cache"] = True
+            elif method == "Network.loadingFinished":
+                record["finished"] = params
+            elif method == "Network.loadingFailed":
+                record["failed"] = params
+
+        entries = [NetworkCapture._entry(record) for record in requests.values()]
+        entries.sort(key=lambda entry: entry["startedDateTime"])
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "e-commerce-testing-framework", "version": "1.0"},
+                "comment": comment,
+                "entries": entries,
+            }
+        }
+
+    @staticmethod
+    def _entry(record):
+        sent = record["sent"]
+        request = sent["request"]
+        response = record["response"] or {}
+        end = record["finished"] or record["failed"] or {}
+        timing = response.get("timing") or {}
+
+        total = round((end["timestamp"] - sent["timestamp"]) * 1000, 2) if end.get("timestamp") else -1
+        transfer = record["finished"]["encodedDataLength"] if record["finished"] else 0
+        wait = _span(timing, "sendEnd", "receiveHeadersEnd")
+        receive = -1
+        if end.get("timestamp") and timing.get("requestTime"):
+            receive = round((end["timestamp"] - timing["requestTime"]) * 1000 - timing["receiveHeadersEnd"], 2)
+
+        if record["memory_cache"]:
+            cache_status = "memory"
+        elif response.get("fromDiskCache"):
+            cache_status = "disk"
+        elif response.get("fromServiceWorker"):
+            cache_status = "service_worker"
+        elif response.get("status") == 304:
+            cache_status = "revalidated"
+        else:
+            cache_status = "network"
+
+        return {
+            "startedDateTime": _iso(sent.get("wallTime", 0)),
+            "time": total,
+            "request": {"method": request["method"], "url": request["url"]},
+            "response": {
+                "status": response.get("status", 0),
+                "mimeType": response.get("mimeType", ""),
+                "bodySize": transfer,
+            },
+            "cache": {"status": cache_status},
+            "timings": {
+                "dns": _span(timing, "dnsStart", "dnsEnd"),
+                "connect": _span(timing, "connectStart", "connectEnd"),
+                "ssl": _span(timing, "sslStart", "sslEnd"),
+                "send": _span(timing, "sendStart", "sendEnd"),
+                "wait": wait,
+                "receive": receive,
+            },
+            "_resourceType": sent.get("type", ""),
+            "_error": (record["failed"] or {}).get("errorText"),
+        }
+
+    @staticmethod
+    def summarize(har):
+        entries = har["log"]["entries"]
+        by_type = {}
+        for entry in entries:
+            kind = entry["_resourceType"] or "Other"
+            by_type[kind] = by_type.get(kind, 0) + entry["response"]["bodySize"]
+        return {
+            "requests": len(entries),
+            "transfer_bytes": sum(entry["response"]["bodySize"] for entry in entries),
+            "cached": sum(1 for entry in entries if entry["cache"]["status"] != "network"),
+            "failed": sum(1 for entry in entries if entry["_error"]),
+            "bytes_by_type": dict(sorted(by_type.items(), key=lambda item: item[1], reverse=True)),
+            "slowest": [(entry["request"]["url"], entry["time"])
+                        for entry in sorted(entries, key=lambda e: e["time"], reverse=True)[:5]],
+        }
+
+    @staticmethod
+    def format(summary, path=None):
+        lines = [
+            f"{summary['requests']} requests, {summary['transfer_bytes'] / 1024:.1f} KB transferred, "
+            f"{summary['cached']} from cache, {summary['failed']} failed",
+            "By type: " + ", ".join(f"{kind} {size / 1024:.1f} KB" for kind, size in summary["bytes_by_type"].items()),
+            "Slowest:",
+        ]
+        lines.extend(f"  {ms:9.1f}ms  {url}" for url, ms in summary["slowest"])
+        if path:
+            lines.append(f"HAR: {path}")
+        return "\n".join(lines)
+
+
+# Shared by the browser fixture and the report hook in this process
+network_capture = NetworkCapture()
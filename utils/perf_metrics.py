@@ -0,0 +1,210 @@
+# utils/perf_metrics.py
+import statistics
+
+# Reads Navigation, Paint, LCP and Resource Timing entries for the current document.
+# arguments[0] is the performance.now() value a soft (client-side) transition started at,
+# or null; resources are only counted from that point on.
+CAPTURE_SCRIPT = """
+    var since = arguments[0];
+    var done = arguments[arguments.length - 1];
+    var round = function (value) { return value == null ? null : Math.round(value * 10) / 10; };
+    var result = {url: location.href, time_origin: performance.timeOrigin, now: performance.now()};
+
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        result.navigation = {
+            type: nav.type,
+            ttfb_ms: round(nav.responseStart - nav.startTime),
+            dom_content_loaded_ms: round(nav.domContentLoadedEventEnd - nav.startTime),
+            load_ms: nav.loadEventEnd ? round(nav.loadEventEnd - nav.startTime) : null,
+            transfer_bytes: nav.transferSize || 0
+        };
+    }
+    result.paint = {};
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        result.paint[entry.name] = round(entry.startTime);
+    });
+    result.resources = performance.getEntriesByType('resource')
+        .filter(function (entry) { return since == null || entry.startTime >= since; })
+        .map(function (entry) {
+            return [entry.name, entry.initiatorType, round(entry.startTime), round(entry.duration),
+                    entry.transferSize || 0];
+        });
+
+    // LCP is only exposed through a (buffered) observer
+    var finish = function () { done(result); };
+    try {
+        new PerformanceObserver(function (list) {
+            var entries = list.getEntries();
+            if (entries.length) {
+                result.lcp_ms = round(entries[entries.length - 1].startTime);
+            }
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+        setTimeout(finish, 50);
+    } catch (e) {
+        finish();
+    }
+"""
+
+# Metrics a budget can be set on, in report column order
+METRICS = ("duration_ms", "ttfb_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms", "lcp_ms",
+           "resource_count", "transfer_bytes")
+
+
+class PerfMetrics:
+    """
+    Collects browser performance timings for each page transition.
+
+    Page objects call start_transition() before an action that changes page
+    and capture() once the new page is ready. A transition that loaded a new
+    document reports Navigation/Paint/LCP timings; a client-side (SPA) route
+    change reports the time from the action until the page was ready and the
+    resources it fetched.
+
+    Capturing is off unless --perf_metrics is passed or a test asks for the
+    perf_metrics fixture, so normal runs make no extra WebDriver calls.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.test_id = None
+        self.captures = []
+        self._run = []
+
+    def start_test(self, test_id):
+        self.test_id = test_id
+        self.captures = []
+
+    def start_transition(self, driver):
+        """
+        Mark the start of a page transition.
+
+        Returns:
+            Opaque marker to pass to capture(), or None when disabled
+        """
+        if not self.enabled:
+            return None
+        try:
+            return driver.execute_script("return [performance.timeOrigin, performance.now()];")
+        except Exception as e:
+            print(f"[Perf metrics]: could not mark transition: {e}")
+            return None
+
+    def capture(self, driver, label, marker=None):
+        """
+        Read the timings for the page the driver is on now.
+
+        Args:
+            driver: WebDriver on the page to measure
+            label: Name for the page/transition in reports and budgets (e.g. "inventory")
+            marker: Value returned by start_transition() before the action, if any
+
+        Returns:
+            Dict of metrics, or None when disabled
+        """
+        if not self.enabled:
+            return None
+        time_origin, since = marker if marker else (None, None)
+        try:
+            raw = driver.execute_async_script(CAPTURE_SCRIPT, since)
+        except Exception as e:
+            print(f"[Perf metrics]: capture of '{label}' failed: {e}")
+            return None
+
+        # Same timeOrigin means the action didn't load a new document
+        soft = time_origin is not None and time_origin == raw["time_origin"]
+        resources = raw["resources"]
+        metrics = {
+            "label": label,
+            "url": raw["url"],
+            "kind": "soft" if soft else "navigation",
+            "resource_count": len(resources),
+            "transfer_bytes": sum(r[4] for r in resources),
+            "slowest_resources": [(r[0], r[3]) for r in sorted(resources, key=lambda r: r[3], reverse=True)[:5]],
+        }
+        if soft:
+            metrics["duration_ms"] = round(raw["now"] - since, 1)
+        else:
+            navigation = raw.get("navigation") or {}
+            metrics.update({key: navigation.get(key) for key in ("ttfb_ms", "dom_content_loaded_ms", "load_ms")})
+            metrics["transfer_bytes"] += navigation.get("transfer_bytes", 0)
+            metrics["fcp_ms"] = raw["paint"].get("first-contentful-paint")
+            metrics["lcp_ms"] = raw.get("lcp_ms")
+            metrics["duration_ms"] = metrics["load_ms"] or round(raw["now"], 1)
+
+        self.captures.append(metrics)
+        self._run.append(metrics)
+        return metrics
+
+    def latest(self, label):
+        """Most recent capture with this label in the current test"""
+        for metrics in reversed(self.captures):
+            if metrics["label"] == label:
+                return metrics
+        return None
+
+    def assert_budget(self, label, **budgets):
+        """
+        Fail the test if the latest capture for `label` exceeds any budget.
+
+        Example: perf_metrics.assert_budget("inventory", lcp_ms=2500, load_ms=3000)
+
+        A budget on a metric that wasn't measured (e.g. lcp_ms after a soft
+        transition) counts as a failure, so budgets can't pass silently.
+        """
+        unknown = set(budgets) - set(METRICS)
+        if unknown:
+            raise ValueError(f"Unknown performance metric(s): {', '.join(sorted(unknown))}")
+        metrics = self.latest(label)
+        if metrics is None:
+            raise AssertionError(f"No performance capture for '{label}' in this test")
+
+        violations = []
+        for name, limit in budgets.items():
+            value = metrics.get(name)
+            if value is None:
+                violations.append(f"{name} not measured ({metrics['kind']} transition)")
+            elif value > limit:
+                violations.append(f"{name} {value} > {limit}")
+        assert not violations, f"Performance budget exceeded for '{label}': " + "; ".join(violations)
+
+    @staticmethod
+    def format(captures):
+        columns = {"duration_ms": "ms", "ttfb_ms": "ttfb", "dom_content_loaded_ms": "dcl",
+                   "load_ms": "load", "fcp_ms": "fcp", "lcp_ms": "lcp"}
+        header = f"{'page':<22}{'kind':<12}" + "".join(f"{columns[name]:>8}" for name in METRICS[:-2])
+        header += f"{'requests':>10}{'KB':>9}"
+        lines = [header]
+        for m in captures:
+            cells = "".join(
+                f"{m.get(name):>8.0f}" if m.get(name) is not None else f"{'-':>8}" for name in METRICS[:-2]
+            )
+            lines.append(f"{m['label']:<22}{m['kind']:<12}{cells}{m['resource_count']:>10}"
+                         f"{m['transfer_bytes'] / 1024:>9.1f}")
+        return "\n".join(lines)
+
+    def run_summary(self):
+        """Median duration and LCP per page label over the whole run"""
+        by_label = {}
+        for metrics in self._run:
+            by_label.setdefault(metrics["label"], []).append(metrics)
+        rows = []
+        for label, captures in sorted(by_label.items()):
+            durations = [m["duration_ms"] for m in captures if m.get("duration_ms") is not None]
+            lcps = [m["lcp_ms"] for m in captures if m.get("lcp_ms") is not None]
+            rows.append((label, len(captures),
+                         statistics.median(durations) if durations else None,
+                         statistics.median(lcps) if lcps else None))
+        return rows
+
+    def format_run(self):
+        lines = [f"{'page':<22}{'captures':>9}{'median ms':>11}{'median LCP':>12}"]
+        for label, count, duration, lcp in self.run_summary():
+            lines.append(f"{label:<22}{count:>9}"
+                         f"{duration if duration is not None else '-':>11}"
+                         f"{lcp if lcp is not None else '-':>12}")
+        return "\n".join(lines)
+
+
+# Shared by all page objects in this process
+perf_metrics = PerfMetrics()
@@ -0,0 +1,215 @@
+# utils/resource_monitor.py
+import csv
+import os
+import re
+import threading
+import time
+
+# JS heap of the current page (Chromium only; other browsers return null)
+HEAP_SCRIPT = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+MB = 1024 * 1024
+
+
+class ResourceMonitor:
+    """
+    Samples memory and CPU of the browser a test is using.
+
+    A background thread reads RSS and CPU of the chromedriver process and
+    everything it spawned (Chrome, GPU and renderer processes) every
+    `interval` seconds. The JS heap is read from the page once at the end of
+    the test, on the test's own thread, since WebDriver calls from another
+    thread would interleave with the test's commands. Each test's samples
+    are written to a CSV file, and a driver whose peak memory or heap crossed
+    a threshold is flagged for recycling.
+
+    psutil is imported lazily; without it the monitor disables itself.
+
+    Args:
+        output_dir: Where the per-test CSV files go (per xdist worker)
+        interval: Seconds between samples
+        max_rss_mb: Recycle the driver when its process tree exceeds this
+        max_heap_mb: Recycle the driver when the page's JS heap exceeds this
+    """
+
+    def __init__(self, output_dir=os.path.join("reports", "resources"), interval=1.0, max_rss_mb=None,
+                 max_heap_mb=None):
+        self.enabled = False
+        self.output_dir = output_dir
+        self.interval = interval
+        self.max_rss_mb = max_rss_mb
+        self.max_heap_mb = max_heap_mb
+        self.recycle_reason = None
+        self._psutil = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._test_id = None
+        self._root_pid = None
+        self._processes = {}
+        self._samples = []
+        self._started = 0.0
+        self._warned = False
+
+    def _load_psutil(self):
+        if self._psutil is None:
+            try:
+                import psutil
+            except ImportError:
+                print("[Resources]: psutil is not installed (pip install psutil); resource monitoring is off")
+                self.enabled = False
+                return None
+            self._psutil = psutil
+        return self._psutil
+
+    def start_test(self, test_id, driver):
+        """Start sampling the process tree behind `driver` (local drivers only)"""
+        self.recycle_reason = None
+        if not self.enabled or not self._load_psutil():
+            return
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        with self._lock:
+            self._test_id = test_id
+            self._root_pid = process.pid if process else None
+            self._samples = []
+            self._started = time.perf_counter()
+        if self._root_pid is None and not self._warned:
+            print("[Resources]: no local driver process to sample (remote or attached driver); JS heap only")
+            self._warned = True
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sampler, name="resource-monitor", daemon=True)
+            self._thread.start()
+
+    def _sampler(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                if self._root_pid is not None:
+                    sample = self._sample(self._root_pid)
+                    if sample:
+                        self._samples.append((round(time.perf_counter() - self._started, 2),) + sample)
+
+    def _sample(self, root_pid):
+        """(rss_mb, cpu_percent, process_count) for a process and its descendants"""
+        psutil = self._psutil
+        try:
+            root = psutil.Process(root_pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        rss = 0
+        cpu = 0.0
+        alive = {}
+        for process in tree:
+            # Keep Process objects between samples so cpu_percent measures since the last call
+            process = self._processes.get(process.pid, process)
+            try:
+                rss += process.memory_info().rss
+                cpu += process.cpu_percent(None)
+                alive[process.pid] = process
+            except psutil.Error:
+                continue
+        self._processes = alive
+        return round(rss / MB, 1), round(cpu, 1), len(alive)
+
+    def finish_test(self, driver=None):
+        """
+        Stop sampling for the current test, write its CSV and check thresholds.
+
+        Returns:
+            Summary dict (peak_rss_mb, avg_cpu, js_heap_mb, samples, path), or
+            None when nothing was sampled
+        """
+        if not self.enabled or self._test_id is None:
+            return None
+        with self._lock:
+            test_id, samples = self._test_id, self._samples
+            if self._root_pid is not None:
+                # One last sample so even sub-interval tests get a reading
+                sample = self._sample(self._root_pid)
+                if sample:
+                    samples.append((round(time.perf_counter() - self._started, 2),) + sample)
+            self._test_id = self._root_pid = None
+            self._samples = []
+
+        heap_mb = None
+        if driver is not None:
+            try:
+                heap = driver.execute_script(HEAP_SCRIPT)
+                heap_mb = round(heap / MB, 1) if heap else None
+            except Exception:
+                pass
+        if not samples and heap_mb is None:
+            return None
+
+        summary = {
+            "test": test_id,
+            "peak_rss_mb": max((row[1] for row in samples), default=None),
+            "avg_cpu": round(sum(row[2] for row in samples) / len(samples), 1) if samples else None,
+            "max_processes": max((row[3] for row in samples), default=None),
+            "js_heap_mb": heap_mb,
+            "samples": len(samples),
+            "path": self._write(test_id, samples, heap_mb) if samples else None,
+        }
+
+        if self.max_rss_mb and summary["peak_rss_mb"] and summary["peak_rss_mb"] > self.max_rss_mb:
+            self.recycle_reason = f"browser RSS {summary['peak_rss_mb']:.0f} MB > {self.max_rss_mb} MB"
+        elif self.max_heap_mb and heap_mb and heap_mb > self.max_heap_mb:
+            self.recycle_reason = f"JS heap {heap_mb:.0f} MB > {self.max_heap_mb} MB"
+        return summary
+
+    def _write(self, test_id, samples, heap_mb):
+        directory = self.output_dir
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        if worker:
+            directory = os.path.join(directory, worker)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, re.sub(r"[^\w.-]+", "_", test_id)[-150:] + ".csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["seconds", "rss_mb", "cpu_percent", "processes", "js_heap_mb"])
+            for index, row in enumerate(samples):
+                # The heap is only read at the end, so it goes on the last row
+                writer.writerow(list(row) + [heap_mb if index == len(samples) - 1 else ""])
+        return path
+
+    @staticmethod
+    def format(summary):
+        parts = []
+        if summary["peak_rss_mb"] is not None:
+            parts.append(f"peak browser RSS {summary['peak_rss_mb']:.0f} MB over {summary['max_processes']} "
+                         f"processes, avg CPU {summary['avg_cpu']:.0f}%")
+        if summary["js_heap_mb"] is not None:
+            parts.append(f"JS heap {summary['js_heap_mb']:.1f} MB")
+        if summary["path"]:
+            parts.append(f"samples: {summary['path']}")
+        return "\n".join(parts)
+
+    @staticmethod
+    def format_run(results, limit=10):
+        """
+        Tests with the highest peak memory, for sizing container limits.
+
+        Args:
+            results: finish_test() summaries (from every worker's reports)
+        """
+        rows = sorted(results, key=lambda row: row["peak_rss_mb"] or 0, reverse=True)
+        lines = [f"{'peak RSS':>9} {'JS heap':>8} {'CPU':>5}  test"]
+        for row in rows[:limit]:
+            rss = f"{row['peak_rss_mb']:.0f} MB" if row["peak_rss_mb"] is not None else "-"
+            heap = f"{row['js_heap_mb']:.1f} MB" if row["js_heap_mb"] is not None else "-"
+            cpu = f"{row['avg_cpu']:.0f}%" if row["avg_cpu"] is not None else "-"
+            lines.append(f"{rss:>9} {heap:>8} {cpu:>5}  {row['test']}")
+        peaks = [row["peak_rss_mb"] for row in results if row["peak_rss_mb"] is not None]
+        if peaks:
+            lines.append(f"Highest browser RSS: {max(peaks):.0f} MB per browser "
+                         f"(multiply by the number of workers for the container limit)")
+        return "\n".join(lines)
+
+    def close(self):
+        self._stop.set()
+
+
+# Shared by the browser fixture and report hooks in this process
+resource_monitor = ResourceMonitor()
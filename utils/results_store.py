@@ -0,0 +1,194 @@
+# utils/results_store.py
+import glob
+import json
+import os
+import socket
+import time
+
+DEFAULT_RESULTS_DIR = os.path.join("reports", "results")
+
+# Report sections (captured output, wait budget, ...) are cut to this many characters
+MAX_SECTION_CHARS = 20000
+
+
+def results_file(directory, shard=None, worker=None):
+    """
+    File one process writes its results to.
+
+    Every shard and xdist worker gets its own file, so parallel writers never
+    share one and the files of a run can simply be collected into one
+    directory and rendered together.
+    """
+    shard_name = shard.replace("/", "of") if shard else "all"
+    return os.path.join(directory, f"results-{shard_name}-{worker or 'main'}.jsonl")
+
+
+def clear_results(directory, shard=None):
+    """Remove an earlier run's files for this shard (called once, before workers start)"""
+    shard_name = shard.replace("/", "of") if shard else "all"
+    for path in glob.glob(os.path.join(directory, f"results-{shard_name}-*.jsonl")):
+        os.remove(path)
+
+
+def _truncate(text):
+    if len(text) <= MAX_SECTION_CHARS:
+        return text
+    return text[:MAX_SECTION_CHARS] + f"\n... ({len(text) - MAX_SECTION_CHARS} more characters)"
+
+
+def outcome_of(phases):
+    """
+    Overall outcome from the setup/call/teardown reports of one test:
+    passed, failed, error (setup/teardown failed), skipped, xfailed or xpassed.
+    """
+    call = phases.get("call")
+    for when in ("setup", "teardown"):
+        report = phases.get(when)
+        if report is not None and report.failed:
+            return "error"
+    if call is not None and hasattr(call, "wasxfail"):
+        return "xfailed" if call.skipped else "xpassed"
+    if any(report.skipped for report in phases.values()):
+        return "skipped"
+    if call is not None and call.failed:
+        return "failed"
+    return "passed"
+
+
+class ResultsWriter:
+    """
+    Appends one JSON line per finished test.
+
+    Lines are flushed as they are written, so a crashed or cancelled run
+    still leaves every completed test on disk.
+
+    Args:
+        path: JSONL file for this process (see results_file)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self.count = 0
+
+    def write(self, record):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class ResultsRecorder:
+    """
+    pytest plugin that turns each test's setup/call/teardown reports into one
+    results record.
+
+    Registered in the processes that run tests (xdist workers, or the only
+    process without xdist), so each writes its own file.
+    """
+
+    def __init__(self, writer, shard=None, worker=None):
+        self.writer = writer
+        self.shard = shard
+        self.worker = worker
+        self._phases = {}
+
+    def pytest_runtest_logreport(self, report):
+        phases = self._phases.setdefault(report.nodeid, {})
+        phases[report.when] = report
+        if report.when == "teardown":
+            self.writer.write(self._record(report.nodeid, self._phases.pop(report.nodeid)))
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.writer.write({
+                "nodeid": report.nodeid,
+                "outcome": "error",
+                "duration": 0.0,
+                "phases": {},
+                "longrepr": _truncate(str(report.longrepr)),
+                "sections": [],
+                "properties": {},
+                "worker": self.worker,
+                "shard": self.shard,
+                "host": socket.gethostname(),
+            })
+
+    def _record(self, nodeid, phases):
+        outcome = outcome_of(phases)
+        failed = [report for report in phases.values() if report.failed or report.skipped]
+        sections = []
+        properties = {}
+        for report in phases.values():
+            sections.extend([title, _truncate(content)] for title, content in report.sections)
+            properties.update(report.user_properties)
+        starts = [getattr(report, "start", None) for report in phases.values()]
+        stops = [getattr(report, "stop", None) for report in phases.values()]
+        return {
+            "nodeid": nodeid,
+            "outcome": outcome,
+            "duration": round(sum(report.duration for report in phases.values()), 4),
+            "phases": {when: round(report.duration, 4) for when, report in phases.items()},
+            "longrepr": _truncate(failed[0].longreprtext) if failed and outcome != "passed" else "",
+            # Pytest repeats captured output in each later phase; the last copy is complete
+            "sections": _dedupe_sections(sections),
+            "properties": properties,
+            "start": min((s for s in starts if s), default=None),
+            "stop": max((s for s in stops if s), default=None) or time.time(),
+            "worker": self.worker,
+            "shard": self.shard,
+            "host": socket.gethostname(),
+        }
+
+    def pytest_sessionfinish(self):
+        self.writer.close()
+
+
+def _dedupe_sections(sections):
+    latest = {}
+    for title, content in sections:
+        latest[title] = content
+    return [[title, content] for title, content in latest.items()]
+
+
+def read_results(paths):
+    """
+    Stream records from JSONL files and/or directories of them, one at a time.
+
+    Records from a subdirectory of a given directory (e.g. one per BrowserStack
+    environment) get its name as "group", so merged runs stay distinguishable.
+
+    Args:
+        paths: Files or directories (every results-*.jsonl below them is read)
+    """
+    for root, path in _expand(paths):
+        group = os.path.relpath(os.path.dirname(path), root) if root else "."
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if group != ".":
+                        record.setdefault("group", group)
+                    yield record
+
+
+def expand_paths(paths):
+    return [path for _, path in _expand(paths)]
+
+
+def _expand(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = glob.glob(os.path.join(path, "**", "results-*.jsonl"), recursive=True)
+            files.extend((path, found_path) for found_path in sorted(found))
+        else:
+            files.append((None, path))
+    return files
@@ -0,0 +1,223 @@
+# utils/screenshot_store.py
+import base64
+import hashlib
+import io
+import json
+import os
+
+# Draws a screenshot (data URL) onto small canvases inside the browser and returns
+# a 64x36 grayscale thumbnail plus a 16x16 difference hash. Doing this in the page
+# avoids needing an image library in Python.
+FINGERPRINT_SCRIPT = """
+    var src = arguments[0];
+    var done = arguments[arguments.length - 1];
+    var gray = function (width, height, image) {
+        var canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        var context = canvas.getContext('2d');
+        context.imageSmoothingQuality = 'high';
+        context.drawImage(image, 0, 0, width, height);
+        var pixels = context.getImageData(0, 0, width, height).data;
+        var values = [];
+        for (var i = 0; i < pixels.length; i += 4) {
+            values.push(Math.round(0.299 * pixels[i] + 0.587 * pixels[i + 1] + 0.114 * pixels[i + 2]));
+        }
+        return values;
+    };
+    var image = new Image();
+    image.onload = function () {
+        var small = gray(17, 16, image);
+        var bits = '';
+        for (var row = 0; row < 16; row++) {
+            for (var col = 0; col < 16; col++) {
+                bits += small[row * 17 + col] < small[row * 17 + col + 1] ? '1' : '0';
+            }
+        }
+        done({thumbnail: gray(64, 36, image), dhash: bits});
+    };
+    image.onerror = function () { done(null); };
+    image.src = src;
+"""
+
+
+class ScreenshotStore:
+    """
+    Small, deduplicated screenshots.
+
+    Local Chrome renders the screenshot already downscaled and JPEG-encoded
+    through CDP (Page.captureScreenshot with a clip scale). Other drivers
+    return a full PNG, which is re-encoded with Pillow when it is installed
+    and kept as-is otherwise. Files are named by their SHA-256, so identical
+    captures (the same error page in many tests) are stored once.
+
+    Args:
+        root: Directory the images are stored in
+        scale: Size relative to the viewport (0.5 = half width and height)
+        image_format: "jpeg" or "png"
+        quality: JPEG quality (1-100)
+    """
+
+    def __init__(self, root=os.path.join("reports", "screenshots"), scale=0.5, image_format="jpeg", quality=70):
+        self.root = root
+        self.scale = scale
+        self.image_format = image_format
+        self.quality = quality
+        self.stats = {"stored": 0, "duplicates": 0, "bytes_written": 0, "bytes_saved": 0}
+
+    @property
+    def extension(self):
+        return "jpg" if self.image_format == "jpeg" else "png"
+
+    def grab(self, driver):
+        """
+        Take a compact screenshot.
+
+        Returns:
+            (image bytes, file extension)
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                return self._grab_cdp(driver), self.extension
+            except Exception as e:
+                print(f"[Screenshots]: CDP capture failed, using WebDriver screenshot: {e}")
+        return self._reencode(driver.get_screenshot_as_png())
+
+    def _grab_cdp(self, driver):
+        viewport = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})["cssLayoutViewport"]
+        params = {
+            "format": self.image_format,
+            "clip": {"x": 0, "y": 0, "width": viewport["clientWidth"], "height": viewport["clientHeight"],
+                     "scale": self.scale},
+        }
+        if self.image_format == "jpeg":
+            params["quality"] = self.quality
+        return base64.b64decode(driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"])
+
+    def _reencode(self, png):
+        try:
+            from PIL import Image  # Optional: only needed for non-Chrome drivers
+        except ImportError:
+            return png, "png"
+        image = Image.open(io.BytesIO(png))
+        if self.scale != 1:
+            image = image.resize((max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale))))
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, "JPEG", quality=self.quality, optimize=True)
+        else:
+            image.save(output, "PNG", optimize=True)
+        return output.getvalue(), self.extension
+
+    def path_for(self, data, extension):
+        """Content-addressed path for an image (same bytes, same path)"""
+        digest = hashlib.sha256(data).hexdigest()
+        return os.path.join(self.root, digest[:2], f"{digest[:24]}.{extension}")
+
+    def put(self, path, data):
+        """
+        Write an image unless an identical one is already stored.
+
+        Returns:
+            True if the file was written, False for a duplicate
+        """
+        if os.path.exists(path):
+            self.stats["duplicates"] += 1
+            self.stats["bytes_saved"] += len(data)
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.stats["stored"] += 1
+        self.stats["bytes_written"] += len(data)
+        return True
+
+
+def fingerprint(driver, image=None):
+    """
+    Perceptual fingerprint of the current viewport (or of the given PNG/JPEG bytes).
+
+    Returns:
+        {"thumbnail": 64x36 grayscale values, "dhash": 256-bit string}
+    """
+    if image is None:
+        image = driver.get_screenshot_as_png()
+    mime = "image/jpeg" if image[:2] == b"\xff\xd8" else "image/png"
+    src = f"data:{mime};base64,{base64.b64encode(image).decode('ascii')}"
+    # The script timeout is a session setting; put back whatever the test had
+    previous = driver.timeouts.script
+    driver.set_script_timeout(10)
+    try:
+        result = driver.execute_async_script(FINGERPRINT_SCRIPT, src)
+    finally:
+        driver.set_script_timeout(previous)
+    if result is None:
+        raise RuntimeError("Browser could not decode the screenshot")
+    return result
+
+
+def compare(baseline, current):
+    """
+    How different two fingerprints are.
+
+    Returns:
+        (difference, hash_distance): mean absolute thumbnail difference as a
+        fraction of full scale (0 = identical, 1 = inverted), and the number of
+        differing dHash bits (0-256)
+    """
+    pairs = zip(baseline["thumbnail"], current["thumbnail"])
+    difference = sum(abs(a - b) for a, b in pairs) / (255 * len(baseline["thumbnail"]))
+    hash_distance = sum(a != b for a, b in zip(baseline["dhash"], current["dhash"]))
+    return round(difference, 4), hash_distance
+
+
+class VisualBaselines:
+    """
+    Cheap visual regression checks against stored fingerprints.
+
+    A baseline is a few KB of JSON (thumbnail + dHash) per page and
+    environment, so baselines can be committed and compared without storing
+    full screenshots.
+
+    Args:
+        directory: Where baselines live (one subdirectory per environment)
+        env: Environment name (TEST_ENV)
+        threshold: Largest thumbnail difference (0-1) that still passes
+        update: Record baselines instead of comparing (the only time files are written)
+    """
+
+    def __init__(self, directory, env, threshold=0.02, update=False):
+        self.directory = os.path.join(directory, env)
+        self.threshold = threshold
+        self.update = update
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}.json")
+
+    def check(self, driver, name):
+        """
+        Compare the current viewport with the baseline called `name`.
+
+        Returns:
+            (passed, message); passed is None when the baseline was (re)recorded
+            because `update` is set. A missing baseline fails the check.
+        """
+        path = self.path(name)
+        if not self.update and not os.path.exists(path):
+            return False, (f"No visual baseline {path}; record it with --update_baselines "
+                           f"and commit it")
+        current = fingerprint(driver)
+        if self.update:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(current, f, separators=(",", ":"))
+            return None, f"Recorded visual baseline {path}"
+
+        with open(path) as f:
+            baseline = json.load(f)
+        difference, hash_distance = compare(baseline, current)
+        message = (f"'{name}' differs from baseline by {difference:.2%} "
+                   f"(limit {self.threshold:.2%}, {hash_distance}/256 hash bits changed)")
+        return difference <= self.threshold, message
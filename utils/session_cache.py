@@ -0,0 +1,115 @@
+# utils/session_cache.py
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from page_objects.login_page import LoginPage
+
+
+class SessionCache:
+    """
+    Remembers authenticated sessions so tests can skip the login form.
+
+    The first login for a user goes through the real UI. The cookies and web
+    storage the site sets are then captured and, for every later login with
+    the same user, injected straight into the browser before opening
+    inventory.html.
+
+    One cache lives per pytest worker, so sessions are never shared between
+    processes.
+
+    Args:
+        enabled: When False every login uses the UI and nothing is cached
+        timeout: Seconds to wait for the inventory page after logging in
+    """
+
+    INVENTORY_PATH = "inventory.html"
+    INVENTORY_LIST = (By.CLASS_NAME, "inventory_list")
+
+    def __init__(self, enabled=True, timeout=10):
+        self.enabled = enabled
+        self.timeout = timeout
+        self._sessions = {}
+        self.stats = {"ui_logins": 0, "injected": 0}
+
+    def login(self, driver, base_url, username, password):
+        """Log in as the given user, reusing a cached session when possible"""
+        base_url = base_url.rstrip("/")
+        key = (base_url, username)
+
+        session = self._sessions.get(key) if self.enabled else None
+        if session and self._inject(driver, base_url, session):
+            self.stats["injected"] += 1
+            return
+
+        self._login_through_ui(driver, base_url, username, password)
+        self.stats["ui_logins"] += 1
+        if self.enabled:
+            self._sessions[key] = self._capture(driver)
+
+    def invalidate(self, base_url, username):
+        """Forget a cached session (e.g. after the test logged the user out server-side)"""
+        self._sessions.pop((base_url.rstrip("/"), username), None)
+
+    def _login_through_ui(self, driver, base_url, username, password):
+        login_page = LoginPage(driver)
+        login_page.navigate(base_url)
+        login_page.login(username, password)
+        WebDriverWait(driver, self.timeout).until(
+            EC.url_contains(self.INVENTORY_PATH)
+        )
+
+    @staticmethod
+    def _capture(driver):
+        cookies = driver.get_cookies()
+        storage = driver.execute_script("""
+            var copy = function (store) {
+                var data = {};
+                for (var i = 0; i < store.length; i++) {
+                    var key = store.key(i);
+                    data[key] = store.getItem(key);
+                }
+                return data;
+            };
+            return {local: copy(window.localStorage), session: copy(window.sessionStorage)};
+        """)
+        return {"cookies": cookies, "storage": storage}
+
+    def _inject(self, driver, base_url, session):
+        # Cookies and storage can only be set while on the site's origin
+        driver.get(base_url)
+        for cookie in session["cookies"]:
+            # Host-only cookies are rejected if we pass an explicit domain
+            cookie = {k: v for k, v in cookie.items() if k != "domain"}
+            driver.add_cookie(cookie)
+        driver.execute_script("""
+            var storage = arguments[0];
+            Object.keys(storage.local).forEach(function (key) {
+                window.localStorage.setItem(key, storage.local[key]);
+            });
+            Object.keys(storage.session).forEach(function (key) {
+                window.sessionStorage.setItem(key, storage.session[key]);
+            });
+        """, session["storage"])
+
+        driver.get(f"{base_url}/{self.INVENTORY_PATH}")
+        try:
+            # The URL is inventory.html before the app checks the session, so wait until
+            # it has either rendered the products or sent us back to the login form
+            landed_on = WebDriverWait(driver, self.timeout).until(self._landed_on)
+        except Exception as e:
+            print(f"[SessionCache] Injected session not confirmed, falling back to UI login: {e}")
+            return False
+        if landed_on == "login":
+            # The site rejected the session (expired or redirected to login)
+            print("[SessionCache] Injected session rejected, falling back to UI login")
+            return False
+        return True
+
+    def _landed_on(self, driver):
+        """Where the app settled: inventory (products rendered), login (sent away) or None while loading"""
+        on_inventory = self.INVENTORY_PATH in driver.current_url
+        if on_inventory and driver.find_elements(*self.INVENTORY_LIST):
+            return "inventory"
+        if not on_inventory or driver.find_elements(*LoginPage.LOGIN_BUTTON):
+            return "login"
+        return None
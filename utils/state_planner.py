@@ -0,0 +1,221 @@
+# utils/state_planner.py
+from typing import NamedTuple, Optional
+
+from page_objects.cart_page import CartPage
+from page_objects.checkout_page import CheckoutPage
+from page_objects.inventory_page import InventoryPage
+from page_objects.login_page import LoginPage
+
+STATES = ("logged_out", "inventory", "cart", "checkout")
+
+# Fixtures that imply a start state when a test has no start_state marker
+FIXTURE_STATES = (
+    ("start_state", "inventory"),
+    ("inventory_page", "inventory"),
+    ("logged_in_browser", "inventory"),
+    ("setup", "logged_out"),
+)
+
+# Where the browser is: URL, logged-in user (session cookie) and cart IDs, in one round trip
+PROBE_SCRIPT = """
+    var match = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+    var cart = [];
+    try {
+        cart = JSON.parse(window.localStorage.getItem('cart-contents') || '[]');
+    } catch (e) {}
+    return {url: location.href, user: match ? decodeURIComponent(match[1]) : null, cart: cart};
+"""
+
+
+class StartState(NamedTuple):
+    """
+    The page and session a test starts from.
+
+    Declared with @pytest.mark.start_state(name, scenario=None, user="standard_user"):
+        logged_out: login page, no session
+        inventory:  logged in, empty cart, inventory.html
+        cart:       logged in, cart holding a test_data.json scenario, cart.html
+        checkout:   like cart, but on checkout-step-one.html
+    """
+    name: str
+    scenario: Optional[str] = None
+    user: str = "standard_user"
+
+    @classmethod
+    def from_marker(cls, marker):
+        state = cls(*marker.args, **marker.kwargs)
+        if state.name not in STATES:
+            raise ValueError(f"Unknown start_state '{state.name}' (choose from {', '.join(STATES)})")
+        if state.name in ("cart", "checkout") and state.scenario is None:
+            return state._replace(scenario="single_item")
+        return state
+
+    @property
+    def logged_in(self):
+        return self.name != "logged_out"
+
+
+def state_for(item):
+    """StartState a collected test declares (marker first, then fixtures), or None"""
+    marker = item.get_closest_marker("start_state")
+    if marker:
+        return StartState.from_marker(marker)
+    fixtures = getattr(item, "fixturenames", ())
+    for fixture, name in FIXTURE_STATES:
+        if fixture in fixtures:
+            return StartState(name)
+    return None
+
+
+def transition_cost(current, target):
+    """
+    Rough number of page loads to get from one start state to another.
+
+    `current` is the state the previous test on the driver started from (None
+    for a fresh browser); tests rarely leave the session, so it is a good
+    guess for where the driver ends up.
+    """
+    if not target.logged_in:
+        return 1 if current is None or not current.logged_in else 2
+    if current is None or not current.logged_in or current.user != target.user:
+        # Session injection or UI login, then the page itself
+        return 3 + (target.name != "inventory")
+    # Same user: one page load (a reload when already there)
+    return 1
+
+
+def plan_order(items):
+    """
+    Order tests so consecutive ones share a start state.
+
+    Tests without a start state need a clean browser and run first, in
+    collection order. The groups of stated tests follow, each time picking
+    the group cheapest to reach from the previous one (ties keep collection
+    order); tests keep their collection order inside a group.
+    """
+    unplanned = []
+    groups = {}
+    for item in items:
+        state = state_for(item)
+        if state is None:
+            unplanned.append(item)
+        else:
+            groups.setdefault(state, []).append(item)
+
+    ordered = list(unplanned)
+    current = None
+    while groups:
+        target = min(groups, key=lambda state: transition_cost(current, state))
+        ordered.extend(groups.pop(target))
+        current = target
+    return ordered
+
+
+class StatePlanner:
+    """
+    Moves a (possibly reused) browser into a test's start state with the
+    fewest page loads.
+
+    The browser is probed first; a session for the right user is kept and the
+    cart is only rewritten when it differs. A browser already on the right
+    page is still reloaded, so no DOM state carries over between tests.
+    Logins go through the SessionCache and carts through CartState.
+
+    Args:
+        env: Environment (base URL and credentials)
+        session_cache: SessionCache used for logins
+        cart_state: CartState used for cart contents
+    """
+
+    def __init__(self, env, session_cache, cart_state):
+        self.env = env
+        self.session_cache = session_cache
+        self.cart_state = cart_state
+        self.base_url = env.base_url.rstrip("/")
+        self.stats = {"entered": 0, "already_there": 0, "logins": 0, "logouts": 0, "cart_seeds": 0, "navigations": 0}
+
+    def enter(self, driver, state):
+        """
+        Bring the browser to `state`.
+
+        Returns:
+            Page object for the state (LoginPage, InventoryPage, CartPage or CheckoutPage)
+        """
+        self.stats["entered"] += 1
+        current = self._probe(driver)
+        username = self._credentials(state.user)[0]
+
+        if current["user"] and (not state.logged_in or current["user"] != username):
+            self._logout(driver)
+            current = {"url": "", "user": None, "cart": []}
+
+        if not state.logged_in:
+            if not self._on_page(current, ""):
+                self._navigate(driver, self.base_url)
+            else:
+                self._reload(driver)
+            return LoginPage(driver)
+
+        if not current["user"]:
+            self.session_cache.login(driver, self.base_url, *self._credentials(state.user))
+            self.stats["logins"] += 1
+            current = self._probe(driver)
+
+        if state.name == "inventory":
+            if current["cart"]:
+                self.cart_state.clear(driver)
+                self._navigate(driver, f"{self.base_url}/inventory.html")
+            elif not self._on_page(current, "inventory.html"):
+                self._navigate(driver, f"{self.base_url}/inventory.html")
+            else:
+                self._reload(driver)
+            return InventoryPage(driver)
+
+        page = "cart.html" if state.name == "cart" else "checkout-step-one.html"
+        wanted = self.cart_state.product_ids(self.cart_state.test_data.get_cart_scenario(state.scenario))
+        if current["cart"] == wanted and state.name == "cart" and self._on_page(current, page):
+            self._reload(driver)
+        else:
+            self.cart_state.seed(driver, self.cart_state.test_data.get_cart_scenario(state.scenario), page=page)
+            self.stats["cart_seeds"] += 1
+        return CartPage(driver) if state.name == "cart" else CheckoutPage(driver)
+
+    def _credentials(self, user):
+        credentials = self.env.get_credentials(user)
+        return credentials.get("username", user), credentials.get("password", "secret_sauce")
+
+    def _probe(self, driver):
+        try:
+            current = driver.execute_script(PROBE_SCRIPT)
+        except Exception:
+            return {"url": "", "user": None, "cart": []}
+        if not current["url"].startswith(self.base_url):
+            # Another origin (or about:blank): nothing of ours is loaded
+            current["user"], current["cart"] = None, []
+        return current
+
+    def _on_page(self, current, page):
+        url = current["url"].split("?")[0].split("#")[0].rstrip("/")
+        return url == f"{self.base_url}/{page}".rstrip("/") or (page == "" and url.endswith("/index.html"))
+
+    def _navigate(self, driver, url):
+        driver.get(url)
+        self.stats["navigations"] += 1
+
+    def _reload(self, driver):
+        # Same URL, session and cart, but the last test may have left sort order, menus,
+        # form fields or scroll behind; a reload drops them and still skips the login
+        driver.refresh()
+        self.stats["already_there"] += 1
+
+    def _logout(self, driver):
+        # Storage is per origin, so clear it while still on the site
+        driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+        driver.delete_all_cookies()
+        self.stats["logouts"] += 1
+
+    def format(self):
+        stats = self.stats
+        return (f"{stats['entered']} start states entered: {stats['already_there']} already in place (reloaded), "
+                f"{stats['logins']} logins, {stats['logouts']} logouts, {stats['cart_seeds']} cart seeds, "
+                f"{stats['navigations']} other page loads")
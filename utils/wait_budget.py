@@ -0,0 +1,61 @@
+# utils/wait_budget.py
+from collections import defaultdict
+
+
+class WaitBudget:
+    """
+    Records how long page objects spend waiting, grouped by what they waited for.
+
+    BasePage reports every wait here. conftest.py resets the budget before each
+    test and attaches the summary to the test report, while the run totals are
+    kept for the end-of-session summary.
+    """
+
+    def __init__(self):
+        self.test_id = None
+        self._test = defaultdict(lambda: [0, 0.0])
+        self._run = defaultdict(lambda: [0, 0.0])
+
+    def start_test(self, test_id):
+        self.test_id = test_id
+        self._test = defaultdict(lambda: [0, 0.0])
+
+    def record(self, description, seconds):
+        for entries in (self._test, self._run):
+            entries[description][0] += 1
+            entries[description][1] += seconds
+
+    @property
+    def total(self):
+        return sum(seconds for _, seconds in self._test.values())
+
+    def summary(self, run=False, limit=None):
+        """Return (description, count, seconds) tuples, slowest first"""
+        entries = self._run if run else self._test
+        rows = sorted(
+            ((desc, count, seconds) for desc, (count, seconds) in entries.items()),
+            key=lambda row: row[2],
+            reverse=True,
+        )
+        return rows[:limit] if limit else rows
+
+    def format(self, run=False, limit=None):
+        rows = self.summary(run=run)
+        total = sum(row[2] for row in rows)
+        lines = [f"Total wait: {total:.2f}s"]
+        for desc, count, seconds in rows[:limit] if limit else rows:
+            lines.append(f"{seconds:8.2f}s  x{count:<4} {desc}")
+        return "\n".join(lines)
+
+
+def describe(target):
+    """Readable name for a locator tuple, a string or a condition callable"""
+    if isinstance(target, tuple) and len(target) == 2:
+        return f"{target[0]}={target[1]}"
+    if isinstance(target, str):
+        return target
+    return getattr(target, "__name__", repr(target))
+
+
+# Shared by all page objects in this process
+wait_budget = WaitBudget()